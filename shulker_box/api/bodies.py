@@ -0,0 +1,63 @@
+"""Request body parsing helpers."""
+
+import json
+import typing as T
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import parse_obj_as
+from pydantic.error_wrappers import ErrorWrapper
+
+from shulker_box.api import schemas
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+BodySchema = T.TypeVar("BodySchema", bound=schemas.Schema)
+
+
+def decode_rows(body: bytes, media_type: str) -> T.Any:
+    """Decode raw rows of a JSON array or newline delimited JSON body.
+
+    Args:
+        body (bytes): raw request body.
+        media_type (str): content type of the body.
+
+    Returns:
+        Any: decoded rows.
+    """
+    if media_type.startswith(NDJSON_MEDIA_TYPE):
+        return [json.loads(line) for line in body.splitlines() if line.strip()]
+    return json.loads(body)
+
+
+class ManyOf(T.Generic[BodySchema]):
+    """Dependency reading a list of schemas from the request body.
+
+    The body is either a JSON array or newline delimited JSON,
+    depending on the content type of the request.
+    """
+
+    def __init__(self, schema: type[BodySchema]) -> None:
+        self.schema = schema
+
+    async def __call__(self, request: Request) -> list[BodySchema]:
+        """Parse the request body.
+
+        Args:
+            request (Request): incoming request.
+
+        Raises:
+            RequestValidationError: if the body is malformed or invalid.
+
+        Returns:
+            list[BodySchema]: parsed entries.
+        """
+        body = await request.body()
+        media_type = request.headers.get("content-type", "")
+        try:
+            return parse_obj_as(
+                list[self.schema],  # type: ignore
+                decode_rows(body, media_type),
+            )
+        except ValueError as exc:
+            raise RequestValidationError([ErrorWrapper(exc, ("body",))])
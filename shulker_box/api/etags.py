@@ -0,0 +1,108 @@
+"""Entity tags helpers."""
+
+import hashlib
+import typing as T
+
+ANY = "*"
+WEAK_PREFIX = "W/"
+QUOTE = '"'
+SEPARATOR = ":"
+DIGEST_SIZE = 8
+NO_VERSION = -1
+
+
+def quote(opaque: str) -> str:
+    """Quote the opaque part of an entity tag.
+
+    Args:
+        opaque (str): entity tag value.
+
+    Returns:
+        str: quoted entity tag.
+    """
+    return f"{QUOTE}{opaque}{QUOTE}"
+
+
+def entry_etag(version: int, fields: T.Sequence[str] | None = None) -> str:
+    """Create the tag of a single entry representation.
+
+    Args:
+        version (int): version of the entry.
+        fields (Sequence[str] | None): selected fields, all if None.
+
+    Returns:
+        str: quoted entity tag.
+    """
+    if fields is None:
+        return quote(str(version))
+    selection = ",".join(fields)
+    return quote(f"{version}{SEPARATOR}{selection}")
+
+
+def collection_etag(generation: int, params: str) -> str:
+    """Create the tag of a collection representation.
+
+    Args:
+        generation (int): generation of the collection.
+        params (str): query string selecting the representation.
+
+    Returns:
+        str: quoted entity tag.
+    """
+    digest = hashlib.blake2b(params.encode(), digest_size=DIGEST_SIZE)
+    return quote(f"{generation}{SEPARATOR}{digest.hexdigest()}")
+
+
+def parse(header: str) -> list[str]:
+    """Read the tags listed in a conditional header.
+
+    Args:
+        header (str): If-Match or If-None-Match header value.
+
+    Returns:
+        list[str]: quoted entity tags, without the weak prefix.
+    """
+    return [
+        tag.strip().removeprefix(WEAK_PREFIX)
+        for tag in header.split(",")
+        if tag.strip()
+    ]
+
+
+def matches(etag: str, if_none_match: str | None) -> bool:
+    """Check if the client already has the representation.
+
+    Args:
+        etag (str): current entity tag.
+        if_none_match (str | None): If-None-Match header value.
+
+    Returns:
+        bool: whether the representation was not modified.
+    """
+    if if_none_match is None:
+        return False
+    tags = parse(if_none_match)
+    return ANY in tags or etag in tags
+
+
+def read_version(if_match: str | None) -> int | None:
+    """Read the version expected by an If-Match header.
+
+    Tags which are not entry tags can not match any version.
+
+    Args:
+        if_match (str | None): If-Match header value.
+
+    Returns:
+        int | None: expected version, any if None.
+    """
+    if if_match is None:
+        return None
+    tags = parse(if_match)
+    if ANY in tags:
+        return None
+    for tag in tags:
+        version = tag.strip(QUOTE).partition(SEPARATOR)[0]
+        if version.isdigit():
+            return int(version)
+    return NO_VERSION
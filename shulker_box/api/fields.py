@@ -0,0 +1,65 @@
+"""Sparse fieldsets helpers."""
+
+from fastapi import Query
+from fastapi.exceptions import RequestValidationError
+from pydantic.error_wrappers import ErrorWrapper
+
+from shulker_box.api import schemas
+
+ID_FIELD = "id"
+FIELDS_SEPARATOR = ","
+FIELDS_QUERY = Query(
+    None,
+    description="Comma separated fields to return, all if not given.",
+)
+
+
+class FieldsOf:
+    """Dependency reading the fields of a schema selected in the url.
+
+    Some fields are always selected, by default the id, so that
+    the entries can be told apart and paged through.
+    """
+
+    def __init__(
+        self,
+        schema: type[schemas.Schema],
+        always: schemas.Fields = (ID_FIELD,),
+    ) -> None:
+        self.schema = schema
+        self.always = always
+
+    async def __call__(
+        self,
+        fields: str | None = FIELDS_QUERY,
+    ) -> schemas.Fields | None:
+        """Parse the selected fields.
+
+        Args:
+            fields (str | None): comma separated field names.
+
+        Raises:
+            RequestValidationError: if an unknown field is selected.
+
+        Returns:
+            Fields | None: selected fields in the schema order, if any.
+        """
+        if fields is None:
+            return None
+        selected = {name.strip() for name in fields.split(FIELDS_SEPARATOR)}
+        selected.discard("")
+        unknown = selected.difference(self.schema.__fields__)
+        if unknown:
+            names = FIELDS_SEPARATOR.join(sorted(unknown))
+            raise RequestValidationError(
+                [
+                    ErrorWrapper(
+                        ValueError(f"Unknown fields: {names}"),
+                        ("query", "fields"),
+                    ),
+                ],
+            )
+        selected.update(self.always)
+        return tuple(
+            name for name in self.schema.__fields__ if name in selected
+        )
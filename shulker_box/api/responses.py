@@ -0,0 +1,45 @@
+"""API responses."""
+
+import typing as T
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def encode_schema(obj: T.Any) -> T.Any:
+    """Encode objects unknown to orjson.
+
+    Args:
+        obj (Any): object to encode.
+
+    Raises:
+        TypeError: if the object cannot be encoded.
+
+    Returns:
+        Any: object made of types known to orjson.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.dict()
+    type_name = type(obj).__name__
+    raise TypeError(f"Type is not JSON serializable: {type_name}")
+
+
+class SchemaResponse(JSONResponse):
+    """JSON response serializing already validated schemas just once.
+
+    Returned from a route, it skips the validation against the response
+    model, which is then used only to document the route. UUIDs, enums,
+    datetimes and dataclasses are encoded by orjson itself.
+    """
+
+    def render(self, content: T.Any) -> bytes:
+        """Encode the content.
+
+        Args:
+            content (Any): schemas or anything orjson can encode.
+
+        Returns:
+            bytes: encoded content.
+        """
+        return orjson.dumps(content, default=encode_schema)
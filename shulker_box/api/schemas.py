@@ -1,6 +1,10 @@
 """API schemas."""
 
-from pydantic import BaseModel
+import typing as T
+
+from pydantic import BaseModel, create_model
+
+Fields = tuple[str, ...]
 
 
 class Schema(BaseModel):
@@ -8,3 +12,54 @@ class Schema(BaseModel):
 
     class Config(BaseModel.Config):
         orm_mode = True
+
+
+PartialKey = tuple[type[Schema], Fields]
+
+partial_schemas: dict[PartialKey, type[Schema]] = {}
+
+
+def partial_schema(
+    schema: type[Schema],
+    selected: T.Sequence[str] | None,
+) -> type[Schema]:
+    """Build a schema with only some of the fields of another one.
+
+    Args:
+        schema (type[Schema]): full schema.
+        selected (Sequence[str] | None): fields to keep, all if None.
+
+    Returns:
+        type[Schema]: partial schema, built once per set of fields.
+    """
+    if selected is None:
+        return schema
+    fields = tuple(selected)
+    if (schema, fields) not in partial_schemas:
+        hints = T.get_type_hints(schema)
+        partial_schemas[schema, fields] = create_model(  # type: ignore
+            f"{schema.__name__}Partial",
+            __base__=Schema,
+            **{
+                name: (hints[name], schema.__fields__[name].field_info)
+                for name in fields
+            },
+        )
+    return partial_schemas[schema, fields]
+
+
+def pick_fields(entry: Schema, fields: T.Sequence[str] | None) -> Schema:
+    """Cut an entry down to some of its fields.
+
+    Args:
+        entry (Schema): full entry.
+        fields (Sequence[str] | None): fields to keep, all if None.
+
+    Returns:
+        Schema: partial entry.
+    """
+    if fields is None:
+        return entry
+    return partial_schema(type(entry), fields).construct(
+        **entry.dict(include=set(fields)),
+    )
@@ -0,0 +1,105 @@
+"""Streaming response helpers."""
+
+import asyncio
+import json
+import typing as T
+
+from fastapi import WebSocket
+from starlette import status
+
+from shulker_box.events.feed import Subscriber
+
+SSE_MEDIA_TYPE = "text/event-stream"
+HEARTBEAT = b": heartbeat\n\n"
+WEBSOCKET_DISCONNECT = "websocket.disconnect"
+
+
+async def ndjson(
+    rows: T.AsyncIterator[dict[str, T.Any]],
+    chunk_size: int,
+) -> T.AsyncIterator[bytes]:
+    """Encode rows as newline delimited JSON.
+
+    Rows are grouped into chunks, so the response is not sent
+    in a separate message for every single row.
+
+    Args:
+        rows (AsyncIterator[dict[str, Any]]): rows to encode.
+        chunk_size (int): number of rows in a single chunk.
+
+    Yields:
+        bytes: encoded chunk of rows.
+    """
+    lines = []
+    async for row in rows:
+        line = json.dumps(row, default=str)
+        lines.append(f"{line}\n")
+        if len(lines) >= chunk_size:
+            yield "".join(lines).encode()
+            lines = []
+    if lines:
+        yield "".join(lines).encode()
+
+
+async def sse(
+    subscriber: Subscriber,
+    heartbeat: float,
+) -> T.AsyncIterator[bytes]:
+    """Encode the notices of a feed as server-sent events.
+
+    A comment is sent whenever nothing happens for a while, which keeps
+    proxies from closing idle connections and finds the clients gone.
+
+    Args:
+        subscriber (Subscriber): client of the feed.
+        heartbeat (float): seconds between the comments.
+
+    Yields:
+        bytes: event stream frame.
+    """
+    async with subscriber:
+        while True:  # noqa: WPS457
+            try:
+                notice = await asyncio.wait_for(subscriber.receive(), heartbeat)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT
+                continue
+            if notice is None:
+                return
+            yield notice.sse
+
+
+async def push(websocket: WebSocket, subscriber: Subscriber) -> None:
+    """Send the notices of a feed over a websocket until either side leaves.
+
+    Dropped clients are asked to try again later.
+
+    Args:
+        websocket (WebSocket): accepted websocket.
+        subscriber (Subscriber): client of the feed.
+    """
+    async with subscriber:
+        sender = asyncio.create_task(_send(websocket, subscriber))
+        receiver = asyncio.create_task(_wait_closed(websocket))
+        done, _ = await asyncio.wait(
+            {sender, receiver},
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        receiver.cancel()
+        sender.cancel()
+        await asyncio.gather(sender, receiver, return_exceptions=True)
+    if sender in done and sender.exception() is None:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+
+
+async def _send(websocket: WebSocket, subscriber: Subscriber) -> None:
+    notice = await subscriber.receive()
+    while notice is not None:
+        await websocket.send_text(notice.message)
+        notice = await subscriber.receive()
+
+
+async def _wait_closed(websocket: WebSocket) -> None:
+    message = await websocket.receive()
+    while message["type"] != WEBSOCKET_DISCONNECT:
+        message = await websocket.receive()
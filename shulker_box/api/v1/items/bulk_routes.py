@@ -0,0 +1,93 @@
+"""Items API bulk operation routes."""
+
+from fastapi import APIRouter, Depends
+from starlette import status
+
+from shulker_box.api import bodies
+from shulker_box.api.responses import SchemaResponse
+from shulker_box.api.v1.items import bulk_schemas, schemas
+from shulker_box.api.v1.items.dependencies import items_service
+
+router = APIRouter(prefix="/items", tags=["items"])
+
+ITEM_CREATE_SCHEMA_REF = "#/components/schemas/ItemCreateSchema"
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=bulk_schemas.ItemBulkCreateOutSchema,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": ITEM_CREATE_SCHEMA_REF},
+                    },
+                },
+                bodies.NDJSON_MEDIA_TYPE: {
+                    "schema": {"$ref": ITEM_CREATE_SCHEMA_REF},
+                },
+            },
+        },
+    },
+)
+async def create_items(
+    body: list[schemas.ItemCreateSchema] = Depends(
+        bodies.ManyOf(schemas.ItemCreateSchema),
+    ),
+) -> SchemaResponse:
+    """Create many items at once.
+
+    The body is either a JSON array or newline delimited JSON.
+    Items which could not be created are reported by their index.
+
+    Args:
+        body (list[ItemCreateSchema]): items data.
+
+    Returns:
+        SchemaResponse: created items and failures.
+    """
+    return SchemaResponse(await items_service.create_many(body))
+
+
+@router.delete(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=bulk_schemas.ItemBulkWriteOutSchema,
+)
+async def delete_items(
+    body: bulk_schemas.ItemBulkSelectSchema,
+) -> bulk_schemas.ItemBulkWriteOutSchema:
+    """Delete all the items selected by ids or filters.
+
+    Args:
+        body (ItemBulkSelectSchema): ids or filters of the items.
+
+    Returns:
+        ItemBulkWriteOutSchema: counts of the matched and deleted items.
+    """
+    bulk_result = await items_service.delete_many(body)
+    return bulk_schemas.ItemBulkWriteOutSchema.from_orm(bulk_result)
+
+
+@router.patch(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=bulk_schemas.ItemBulkWriteOutSchema,
+)
+async def update_items(
+    body: bulk_schemas.ItemBulkUpdateSchema,
+) -> bulk_schemas.ItemBulkWriteOutSchema:
+    """Apply the same changes to all the items selected by ids or filters.
+
+    Args:
+        body (ItemBulkUpdateSchema): selection and changes.
+
+    Returns:
+        ItemBulkWriteOutSchema: counts of the matched and modified items.
+    """
+    bulk_result = await items_service.update_many(body)
+    return bulk_schemas.ItemBulkWriteOutSchema.from_orm(bulk_result)
@@ -0,0 +1,99 @@
+"""Items API bulk operation schemas."""
+
+import typing as T
+import uuid
+
+from pydantic import Extra, root_validator, validator
+
+from shulker_box.api import schemas
+from shulker_box.api.v1.items.schemas import ItemOutSchema
+from shulker_box.domain.types import ItemCategory
+
+SELECTORS = ("ids", "name", "category")
+
+
+class ItemBulkErrorSchema(schemas.Schema):
+    """Item bulk operation error schema."""
+
+    index: int
+    detail: str
+    id: uuid.UUID | None
+
+
+class ItemBulkCreateOutSchema(schemas.Schema):
+    """Item bulk create output schema."""
+
+    created: list[ItemOutSchema]
+    errors: list[ItemBulkErrorSchema]
+
+
+class ItemBulkSelectSchema(schemas.Schema):
+    """Item bulk operation selection schema."""
+
+    ids: list[uuid.UUID] | None
+    name: str | None
+    category: ItemCategory | None
+
+    @root_validator(skip_on_failure=True)
+    @classmethod
+    def check_selection(cls, values: dict[str, T.Any]) -> dict[str, T.Any]:
+        """Make sure that not all the items are selected by accident.
+
+        Args:
+            values (dict[str, Any]): validated values.
+
+        Raises:
+            ValueError: if neither ids nor filters are given.
+
+        Returns:
+            dict[str, Any]: validated values.
+        """
+        if all(values.get(selector) is None for selector in SELECTORS):
+            raise ValueError("Items have to be selected by ids or filters")
+        return values
+
+
+class ItemBulkChangesSchema(schemas.Schema):
+    """Item bulk update changes schema.
+
+    Names are unique, so they cannot be given to many items at once.
+    """
+
+    category: ItemCategory | None
+
+    class Config(schemas.Schema.Config):
+        extra = Extra.forbid
+
+
+class ItemBulkUpdateSchema(ItemBulkSelectSchema):
+    """Item bulk update input schema."""
+
+    changes: ItemBulkChangesSchema
+
+    @validator("changes")
+    @classmethod
+    def check_changes(
+        cls,
+        changes: ItemBulkChangesSchema,
+    ) -> ItemBulkChangesSchema:
+        """Make sure that there is anything to update.
+
+        Args:
+            changes (ItemBulkChangesSchema): changes to apply.
+
+        Raises:
+            ValueError: if no field is set.
+
+        Returns:
+            ItemBulkChangesSchema: changes to apply.
+        """
+        if not changes.dict(exclude_unset=True):
+            raise ValueError("At least one field has to be changed")
+        return changes
+
+
+class ItemBulkWriteOutSchema(schemas.Schema):
+    """Item bulk update or delete output schema."""
+
+    matched: int
+    modified: int
@@ -0,0 +1,8 @@
+"""Items API dependencies."""
+
+from shulker_box.api import fields
+from shulker_box.api.v1.items import schemas
+from shulker_box.domain.items import repositories, services
+
+items_service = services.ItemService(repositories.ItemMongoRepository())
+item_fields = fields.FieldsOf(schemas.ItemOutSchema, always=("id", "version"))
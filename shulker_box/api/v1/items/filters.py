@@ -6,10 +6,33 @@ from fastapi import Query
 
 from shulker_box.domain import types
 
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+MAX_PREFIX_LENGTH = 100
+MAX_SEARCH_LENGTH = 200
+
 
 @dataclass
 class ItemFilters:
     """Item API filters."""
 
     name: str | None = Query(None)
+    name_prefix: str | None = Query(None, max_length=MAX_PREFIX_LENGTH)
     category: types.ItemCategory | None = Query(None)
+
+
+@dataclass
+class ItemPageFilters(ItemFilters):
+    """Item API filters with pagination."""
+
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT)
+    cursor: str | None = Query(None)
+    search: str | None = Query(None, max_length=MAX_SEARCH_LENGTH)
+
+
+@dataclass
+class ItemChangesFilters:
+    """Item changes API params."""
+
+    since: str | None = Query(None)
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT)
@@ -1,17 +1,37 @@
 """Items API routes."""
 
 
+import typing as T
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Request, Response
 from starlette import status
 
+from shulker_box.api import etags
+from shulker_box.api.responses import SchemaResponse
 from shulker_box.api.v1.items import filters, schemas
-from shulker_box.domain.items import repositories, services
+from shulker_box.api.v1.items.dependencies import item_fields, items_service
+from shulker_box.domain.items.list_cache import CachedPage
 
 router = APIRouter(prefix="/items", tags=["items"])
 
-items_service = services.ItemService(repositories.ItemMongoRepository())
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+ETAG_HEADER = "ETag"
+
+
+def not_modified(etag: str) -> Response:
+    """Tell the client that its copy is still fresh.
+
+    Args:
+        etag (str): current entity tag.
+
+    Returns:
+        Response: response without a body.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={ETAG_HEADER: etag},
+    )
 
 
 @router.post(
@@ -19,16 +39,17 @@ items_service = services.ItemService(repositories.ItemMongoRepository())
     status_code=status.HTTP_201_CREATED,
     response_model=schemas.ItemOutSchema,
 )
-async def create_item(body: schemas.ItemCreateSchema) -> schemas.ItemOutSchema:
+async def create_item(body: schemas.ItemCreateSchema) -> SchemaResponse:
     """Create a new item.
 
     Args:
         body (ItemCreateSchema): item data.
 
     Returns:
-        ItemOutSchema: created item.
+        SchemaResponse: created item.
     """
-    return await items_service.create(body)
+    item = await items_service.create(body)
+    return SchemaResponse(item, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -37,17 +58,75 @@ async def create_item(body: schemas.ItemCreateSchema) -> schemas.ItemOutSchema:
     response_model=list[schemas.ItemOutSchema],
 )
 async def get_items(
-    url_filters: filters.ItemFilters = Depends(),
-) -> list[schemas.ItemOutSchema]:
-    """Get all the items.
+    request: Request,
+    url_filters: filters.ItemPageFilters = Depends(),
+    selected: T.Sequence[str] | None = Depends(item_fields),
+    if_none_match: str | None = Header(None),
+) -> Response:
+    """Get a page of items.
+
+    The cursor of the next page is returned in the X-Next-Cursor header.
+    Only the selected fields are returned, along with the ids and versions.
+    Pages are tagged with the generation of all the items, so nothing
+    is read again until any item changes. Pages go untagged when
+    the generation can't be read. Cached pages are read along with
+    the generation and sent as they were stored.
 
     Args:
-        url_filters (ItemFilters): url params.
+        request (Request): incoming request.
+        url_filters (ItemPageFilters): url params.
+        selected (Sequence[str] | None): fields to return, all if None.
+        if_none_match (str | None): tags of the pages the client has.
+
+    Returns:
+        Response: list of items, or no body if it was not modified.
+    """
+    generation, cached = await items_service.get_generation(
+        url_filters,
+        selected,
+    )
+    headers = {}
+    if generation is not None:
+        headers[ETAG_HEADER] = etags.collection_etag(
+            generation,
+            request.url.query,
+        )
+        if etags.matches(headers[ETAG_HEADER], if_none_match):
+            return not_modified(headers[ETAG_HEADER])
+    page = cached or await items_service.collect(
+        url_filters,
+        selected,
+        generation,
+    )
+    if isinstance(page, CachedPage):
+        response = Response(
+            page.body,
+            media_type=SchemaResponse.media_type,
+            headers=headers,
+        )
+    else:
+        response = SchemaResponse(page.items, headers=headers)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
+
+
+@router.get(
+    "/stats",
+    status_code=status.HTTP_200_OK,
+    response_model=schemas.ItemStatsOutSchema,
+)
+async def get_item_stats() -> schemas.ItemStatsOutSchema:
+    """Get the numbers of items per category.
 
     Returns:
-        list[ItemOutSchema]: list of items.
+        ItemStatsOutSchema: numbers of items.
     """
-    return await items_service.collect(url_filters)
+    categories = await items_service.get_stats()
+    return schemas.ItemStatsOutSchema(
+        total=sum(categories.values()),
+        categories=categories,
+    )
 
 
 @router.get(
@@ -55,16 +134,28 @@ async def get_items(
     status_code=status.HTTP_200_OK,
     response_model=schemas.ItemOutSchema,
 )
-async def get_item(pk: uuid.UUID) -> schemas.ItemOutSchema:
+async def get_item(
+    pk: uuid.UUID,
+    selected: T.Sequence[str] | None = Depends(item_fields),
+    if_none_match: str | None = Header(None),
+) -> Response:
     """Get an item by its id.
 
+    Only the selected fields are returned, along with the id and version.
+
     Args:
         pk (UUID): item id.
+        selected (Sequence[str] | None): fields to return, all if None.
+        if_none_match (str | None): tags of the items the client has.
 
     Returns:
-        ItemOutSchema: retrieved item.
+        Response: retrieved item, or no body if it was not modified.
     """
-    return await items_service.get(pk)
+    item = await items_service.get(pk, selected)
+    etag = etags.entry_etag(item.version, selected)
+    if etags.matches(etag, if_none_match):
+        return not_modified(etag)
+    return SchemaResponse(item, headers={ETAG_HEADER: etag})
 
 
 @router.delete(
@@ -88,14 +179,22 @@ async def delete_item(pk: uuid.UUID) -> None:
 async def update_item(
     pk: uuid.UUID,
     body: schemas.ItemUpdateSchema,
-) -> schemas.ItemOutSchema:
+    if_match: str | None = Header(None),
+) -> SchemaResponse:
     """Update an existing item.
 
+    With If-Match, the item is updated only if it was not changed since.
+
     Args:
         pk (UUID): item id.
         body (ItemUpdateSchema): update data.
+        if_match (str | None): tag of the item the changes were made to.
 
     Returns:
-        ItemOutSchema: updated item.
+        SchemaResponse: updated item.
     """
-    return await items_service.update(pk, body)
+    item = await items_service.update(pk, body, etags.read_version(if_match))
+    return SchemaResponse(
+        item,
+        headers={ETAG_HEADER: etags.entry_etag(item.version)},
+    )
@@ -26,3 +26,20 @@ class ItemOutSchema(schemas.Schema):
     id: uuid.UUID
     name: str
     category: ItemCategory
+    version: int = 0
+
+
+class ItemStatsOutSchema(schemas.Schema):
+    """Item statistics output schema."""
+
+    total: int
+    categories: dict[ItemCategory, int]
+
+
+class ItemChangesOutSchema(schemas.Schema):
+    """Item changes output schema."""
+
+    changed: list[ItemOutSchema]
+    deleted: list[uuid.UUID]
+    token: str
+    more: bool
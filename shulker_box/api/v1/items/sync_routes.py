@@ -0,0 +1,115 @@
+"""Items API routes keeping the clients in sync."""
+
+from fastapi import APIRouter, Depends, WebSocket
+from fastapi.responses import StreamingResponse
+from starlette import status
+
+from shulker_box.api import bodies, streaming
+from shulker_box.api.responses import SchemaResponse
+from shulker_box.api.v1.items import filters, schemas
+from shulker_box.api.v1.items.dependencies import items_service
+from shulker_box.domain.items import feed
+from shulker_box.settings import settings
+
+router = APIRouter(prefix="/items", tags=["items"])
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {bodies.NDJSON_MEDIA_TYPE: {}},
+            "description": "Newline delimited items.",
+        },
+    },
+)
+async def export_items(
+    url_filters: filters.ItemFilters = Depends(),
+) -> StreamingResponse:
+    """Stream all the items as newline delimited JSON.
+
+    Args:
+        url_filters (ItemFilters): url params.
+
+    Returns:
+        StreamingResponse: items, one JSON object per line.
+    """
+    return StreamingResponse(
+        streaming.ndjson(
+            items_service.export(url_filters),
+            settings.ITEMS_EXPORT_BATCH_SIZE,
+        ),
+        media_type=bodies.NDJSON_MEDIA_TYPE,
+    )
+
+
+@router.get(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {streaming.SSE_MEDIA_TYPE: {}},
+            "description": "Item events as they happen.",
+        },
+    },
+)
+async def stream_items() -> StreamingResponse:
+    """Push the item events to the client as server-sent events.
+
+    Clients falling behind are disconnected and can catch up
+    with the changes endpoint.
+
+    Returns:
+        StreamingResponse: item created, updated and deleted events.
+    """
+    return StreamingResponse(
+        streaming.sse(
+            feed.item_feed.subscribe(settings.ITEMS_FEED_QUEUE_SIZE),
+            settings.ITEMS_FEED_HEARTBEAT,
+        ),
+        media_type=streaming.SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.websocket("/stream")
+async def stream_items_over_websocket(websocket: WebSocket) -> None:
+    """Push the item events to the client over a websocket.
+
+    Clients falling behind are disconnected and can catch up
+    with the changes endpoint.
+
+    Args:
+        websocket (WebSocket): incoming websocket.
+    """
+    await websocket.accept()
+    await streaming.push(
+        websocket,
+        feed.item_feed.subscribe(settings.ITEMS_FEED_QUEUE_SIZE),
+    )
+
+
+@router.get(
+    "/changes",
+    status_code=status.HTTP_200_OK,
+    response_model=schemas.ItemChangesOutSchema,
+)
+async def get_item_changes(
+    url_filters: filters.ItemChangesFilters = Depends(),
+) -> SchemaResponse:
+    """Get the items written and deleted since a sync token.
+
+    The returned token is passed as `since` to get the next changes,
+    right away if there are more of them or on the next sync.
+    An expired token means that all the items have to be synced again.
+
+    Args:
+        url_filters (ItemChangesFilters): url params.
+
+    Returns:
+        SchemaResponse: changed items, deleted ids and the next token.
+    """
+    return SchemaResponse(await items_service.collect_changes(url_filters))
@@ -0,0 +1,86 @@
+"""Metrics API routes."""
+
+from fastapi import APIRouter
+from starlette import status
+
+from shulker_box.api.v1.metrics import schemas
+from shulker_box.domain.items.cache import ItemCache
+from shulker_box.events.bus import EventBus
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+def get_event_buffer_metrics() -> schemas.EventBufferMetricsSchema | None:
+    """Collect the event buffer metrics.
+
+    Returns:
+        EventBufferMetricsSchema | None: metrics, if buffered mode is on.
+    """
+    if EventBus.buffer is None:
+        return None
+    stats = EventBus.buffer.stats
+    return schemas.EventBufferMetricsSchema(
+        depth=EventBus.buffer.depth,
+        flushes=stats.flushes,
+        flushed_events=stats.flushed_events,
+        failed_flushes=stats.failed_flushes,
+        dropped_events=stats.dropped_events,
+        last_flush_latency=stats.last_flush_latency,
+        max_flush_latency=stats.max_flush_latency,
+        average_flush_latency=stats.average_flush_latency,
+    )
+
+
+def get_event_sink_metrics() -> list[schemas.EventSinkMetricsSchema]:
+    """Collect the metrics of the subscribed event sinks.
+
+    Returns:
+        list[EventSinkMetricsSchema]: metrics of every sink.
+    """
+    return [
+        schemas.EventSinkMetricsSchema(
+            name=sink.name,
+            critical=sink.critical,
+            deliveries=sink.stats.deliveries,
+            failures=sink.stats.failures,
+            timeouts=sink.stats.timeouts,
+            average_latency=sink.stats.latency.average,
+            latency_histogram=sink.stats.latency.cumulative(),
+        )
+        for sink in EventBus.sinks
+    ]
+
+
+def get_item_cache_metrics() -> schemas.ItemCacheMetricsSchema | None:
+    """Collect the item cache metrics.
+
+    Returns:
+        ItemCacheMetricsSchema | None: metrics, if the cache is on.
+    """
+    if ItemCache.entries is None:
+        return None
+    stats = ItemCache.entries.stats
+    return schemas.ItemCacheMetricsSchema(
+        size=len(ItemCache.entries),
+        hits=stats.hits,
+        misses=stats.misses,
+        evictions=stats.evictions,
+    )
+
+
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=schemas.MetricsOutSchema,
+)
+async def get_metrics() -> schemas.MetricsOutSchema:
+    """Get the runtime metrics used for tuning.
+
+    Returns:
+        MetricsOutSchema: current metrics.
+    """
+    return schemas.MetricsOutSchema(
+        event_buffer=get_event_buffer_metrics(),
+        event_sinks=get_event_sink_metrics(),
+        item_cache=get_item_cache_metrics(),
+    )
@@ -0,0 +1,45 @@
+"""Metrics API schemas."""
+
+from shulker_box.api import schemas
+
+
+class EventBufferMetricsSchema(schemas.Schema):
+    """Event buffer metrics output schema."""
+
+    depth: int
+    flushes: int
+    flushed_events: int
+    failed_flushes: int
+    dropped_events: int
+    last_flush_latency: float
+    max_flush_latency: float
+    average_flush_latency: float
+
+
+class ItemCacheMetricsSchema(schemas.Schema):
+    """Item cache metrics output schema."""
+
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class EventSinkMetricsSchema(schemas.Schema):
+    """Event sink metrics output schema."""
+
+    name: str
+    critical: bool
+    deliveries: int
+    failures: int
+    timeouts: int
+    average_latency: float
+    latency_histogram: dict[str, int]
+
+
+class MetricsOutSchema(schemas.Schema):
+    """Metrics output schema."""
+
+    event_buffer: EventBufferMetricsSchema | None
+    event_sinks: list[EventSinkMetricsSchema]
+    item_cache: ItemCacheMetricsSchema | None
@@ -2,7 +2,14 @@
 
 from fastapi.routing import APIRouter
 
-from shulker_box.api.v1.items import routes
+from shulker_box.api.v1.items import bulk_routes as items_bulk_routes
+from shulker_box.api.v1.items import routes as items_routes
+from shulker_box.api.v1.items import sync_routes as items_sync_routes
+from shulker_box.api.v1.metrics import routes as metrics_routes
 
 v1_router = APIRouter(prefix="/v1")
-v1_router.include_router(routes.router)
+# Fixed paths go before the item ones, which would take them as item ids.
+v1_router.include_router(items_bulk_routes.router)
+v1_router.include_router(items_sync_routes.router)
+v1_router.include_router(items_routes.router)
+v1_router.include_router(metrics_routes.router)
@@ -0,0 +1,20 @@
+"""Recompute the item counters from the items.
+
+Run with ``python -m shulker_box.commands.rebuild_item_stats``.
+"""
+
+import asyncio
+
+from shulker_box.database.client import init_database
+from shulker_box.domain.items.stats import ItemStats
+
+
+async def rebuild_item_stats() -> None:
+    """Connect to the database and recompute the item counters."""
+    client = await init_database()
+    await ItemStats.rebuild()
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_item_stats())
@@ -2,11 +2,59 @@
 
 from beanie import init_beanie
 from motor import motor_asyncio
+from pymongo import UpdateOne
+from redis import asyncio as aioredis
 
-from shulker_box.database.models import Item
+from shulker_box.database.models import (
+    Generation,
+    Item,
+    ItemCounter,
+    ItemTombstone,
+    OutboxEvent,
+    normalize_name,
+)
 from shulker_box.settings import settings
 
 
+class RedisClient:
+    """Holder of the redis client shared by the whole application.
+
+    The pool blocks callers waiting for a free connection, up to the pool
+    timeout, so a burst of publishes queues up instead of failing once all
+    the connections are taken, long-lived listeners included.
+    """
+
+    instance: aioredis.Redis | None = None
+
+    @classmethod
+    def get(cls) -> aioredis.Redis:
+        """Get the redis client, creating its connection pool on first use.
+
+        Returns:
+            Redis: redis client.
+        """
+        if cls.instance is None:
+            pool = aioredis.BlockingConnectionPool(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_timeout=settings.REDIS_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_TIMEOUT,
+            )
+            cls.instance = aioredis.Redis(connection_pool=pool)
+        return cls.instance
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the redis client along with its connection pool."""
+        if cls.instance is None:
+            return
+        client = cls.instance
+        cls.instance = None
+        await client.close(close_connection_pool=True)
+
+
 async def init_database() -> motor_asyncio.AsyncIOMotorClient:
     """Initialize the database.
 
@@ -16,6 +64,55 @@ async def init_database() -> motor_asyncio.AsyncIOMotorClient:
     client = motor_asyncio.AsyncIOMotorClient(settings.DATABASE_URL)
     await init_beanie(
         database=client.account,
-        document_models=[Item],
+        document_models=[
+            Item,
+            ItemTombstone,
+            ItemCounter,
+            Generation,
+            OutboxEvent,
+        ],
     )
+    await normalize_item_names()
+    await number_item_changes()
     return client
+
+
+async def normalize_item_names() -> None:
+    """Fill in the normalized names of items stored without them."""
+    collection = Item.get_motor_collection()
+    cursor = collection.find({Item.name_key: None}, projection=[Item.name])
+    updates = []
+    async for document in cursor:
+        updates.append(
+            UpdateOne(
+                {"_id": document["_id"]},
+                {"$set": {Item.name_key: normalize_name(document["name"])}},
+            ),
+        )
+        if len(updates) == settings.ITEMS_BULK_CHUNK_SIZE:
+            await collection.bulk_write(updates, ordered=False)
+            updates = []
+    if updates:
+        await collection.bulk_write(updates, ordered=False)
+
+
+async def number_item_changes() -> None:
+    """Put the items stored without a change sequence number at its start."""
+    await Item.get_motor_collection().update_many(
+        {Item.sequence: None},
+        {"$set": {Item.sequence: 0}},
+    )
+
+
+async def init_redis() -> aioredis.Redis:
+    """Initialize the redis connection pool.
+
+    Returns:
+        Redis: redis client.
+    """
+    return RedisClient.get()
+
+
+async def close_redis() -> None:
+    """Close the redis connection pool."""
+    await RedisClient.close()
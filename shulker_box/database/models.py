@@ -1,16 +1,140 @@
 """Database models."""
 
+import typing as T
+import unicodedata
 import uuid
+from datetime import datetime
 
+import pymongo
 from beanie import Document, Indexed
-from pydantic import Field
+from pydantic import Field, StrictBytes, StrictStr, validator
 
 from shulker_box.domain.types import ItemCategory
+from shulker_box.settings import settings
+
+BY_ID = ("_id", pymongo.ASCENDING)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a name, so that it can be matched regardless of its case.
+
+    Args:
+        name (str): item name.
+
+    Returns:
+        str: normalized name.
+    """
+    return unicodedata.normalize("NFKC", name).casefold()
 
 
 class Item(Document):
-    """Item document model."""
+    """Item document model.
+
+    The normalized name is kept next to the name itself, so that names
+    can be matched by their prefixes with an index.
+
+    Every filter is served by an index. Indexes end with the id, so that
+    pages filtered by the category come in the id order without sorting,
+    and pages matched by name prefixes in the order of the normalized names.
+    Names are unique, so the name index alone serves the name filter
+    along with any other one.
+
+    Every write stamps the items with the next number of their change
+    sequence, so that the changes can be read in the order they were made,
+    and with the time the number was taken.
+    """
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     name: Indexed(str, unique=True)  # type: ignore
     category: ItemCategory
+    name_key: str = ""
+    version: int = 0
+    sequence: int = 0
+    changed_at: datetime | None = None
+
+    class Collection:
+        indexes = [
+            pymongo.IndexModel([("sequence", pymongo.ASCENDING), BY_ID]),
+            pymongo.IndexModel([("category", pymongo.ASCENDING), BY_ID]),
+            pymongo.IndexModel([("name_key", pymongo.ASCENDING), BY_ID]),
+            pymongo.IndexModel(
+                [
+                    ("category", pymongo.ASCENDING),
+                    ("name_key", pymongo.ASCENDING),
+                    BY_ID,
+                ],
+            ),
+            pymongo.IndexModel([("name", pymongo.TEXT)]),
+        ]
+
+    @validator("name_key", always=True)
+    @classmethod
+    def normalize_name_key(cls, name_key: str, values: dict[str, T.Any]) -> str:
+        """Derive the normalized name from the name.
+
+        Args:
+            name_key (str): given normalized name.
+            values (dict[str, Any]): already validated values.
+
+        Returns:
+            str: normalized name.
+        """
+        return normalize_name(values.get("name", name_key))
+
+
+class ItemTombstone(Document):
+    """Mark of a deleted item, kept for the clients syncing the changes.
+
+    Tombstones are removed by a TTL index some time after the deletion.
+    """
+
+    id: uuid.UUID
+    sequence: int
+    deleted_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Collection:
+        indexes = [
+            pymongo.IndexModel([("sequence", pymongo.ASCENDING), BY_ID]),
+            pymongo.IndexModel(
+                "deleted_at",
+                expireAfterSeconds=settings.ITEMS_TOMBSTONE_RETENTION,
+            ),
+        ]
+
+
+class ItemCounter(Document):
+    """Number of items of a single category."""
+
+    id: ItemCategory
+    items: int = 0
+
+
+class Generation(Document):
+    """Number of writes made to a collection so far."""
+
+    id: str
+    writes: int = 0
+
+
+class OutboxEvent(Document):
+    """Event waiting in the outbox to be relayed to redis.
+
+    Entries are relayed in the order of their ObjectId
+    and removed by a TTL index some time after being sent.
+    """
+
+    channel: str
+    payload: StrictStr | StrictBytes
+    sent: bool = False
+    sent_at: datetime | None = None
+
+    class Collection:
+        indexes = [
+            pymongo.IndexModel(
+                [("sent", pymongo.ASCENDING), BY_ID],
+            ),
+            pymongo.IndexModel(
+                "sent_at",
+                expireAfterSeconds=settings.EVENTS_OUTBOX_RETENTION,
+            ),
+        ]
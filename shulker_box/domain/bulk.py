@@ -0,0 +1,97 @@
+"""Bulk writes of the stored entries."""
+
+import typing as T
+import uuid
+from dataclasses import dataclass, field
+
+from shulker_box.domain.repositories import (
+    CreateSchema,
+    OutSchema,
+    Repository,
+    UpdateSchema,
+)
+
+
+@dataclass
+class BulkError:
+    """Failure of a single entry in a bulk operation."""
+
+    index: int
+    detail: str
+    id: uuid.UUID | None = None
+
+
+@dataclass
+class BulkCreateResult(T.Generic[OutSchema]):
+    """Outcome of a bulk create."""
+
+    created: list[OutSchema] = field(default_factory=list)
+    errors: list[BulkError] = field(default_factory=list)
+
+
+@dataclass
+class BulkResult(T.Generic[OutSchema]):
+    """Outcome of a bulk update or delete.
+
+    Updated entries are kept as they are after the update. Entries are also
+    kept as they were before the write, with only the fields the storage
+    reads along with their IDs.
+    """
+
+    matched: int = 0
+    modified: int = 0
+    ids: list[uuid.UUID] = field(default_factory=list)
+    entries: list[OutSchema] = field(default_factory=list)
+    before: list[OutSchema] = field(default_factory=list)
+
+
+class BulkRepository(
+    Repository[CreateSchema, UpdateSchema, OutSchema],
+    T.Protocol,
+):
+    """Storage interface with the bulk writes."""
+
+    async def create_many(
+        self,
+        data_objects: T.Sequence[CreateSchema],
+        chunk_size: int,
+    ) -> BulkCreateResult[OutSchema]:
+        """Create many entries, reporting failures per entry.
+
+        Args:
+            data_objects (Sequence[CreateSchema]): input data objects.
+            chunk_size (int): number of entries written at once.
+        """
+        ...  # noqa: WPS428
+
+    async def delete_many(
+        self,
+        chunk_size: int,
+        ids: list[uuid.UUID] | None = None,
+        **filters,
+    ) -> BulkResult[OutSchema]:
+        """Delete all the matching entries.
+
+        Args:
+            chunk_size (int): number of entries deleted at once.
+            ids (list[UUID] | None): delete only entries with these IDs.
+            filters (dict): additional filters to apply.
+        """
+        ...  # noqa: WPS428
+
+    async def update_many(
+        self,
+        data_object: UpdateSchema,
+        chunk_size: int,
+        ids: list[uuid.UUID] | None = None,
+        **filters,
+    ) -> BulkResult[OutSchema]:
+        """Update all the matching entries the same way.
+
+        Args:
+            data_object (UpdateSchema): input data object.
+            chunk_size (int): number of entries updated at once.
+            ids (list[UUID] | None): update only entries with these IDs.
+            filters (dict): additional filters to apply.
+        """
+        ...  # noqa: WPS428
@@ -0,0 +1,81 @@
+"""In-process caching."""
+
+import time
+import typing as T
+from collections import OrderedDict
+
+Key = T.TypeVar("Key", bound=T.Hashable)
+Value = T.TypeVar("Value")
+
+
+class CacheStats:
+    """Counters describing how the cache is used."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class LRUCache(T.Generic[Key, Value]):
+    """Bounded mapping dropping the least recently used entries.
+
+    Entries also expire after the given number of seconds.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict[Key, tuple[float, Value]] = OrderedDict()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        """Count the entries, including the expired ones.
+
+        Returns:
+            int: number of entries.
+        """
+        return len(self.entries)
+
+    def get(self, key: Key) -> Value | None:
+        """Get a fresh entry, marking it as recently used.
+
+        Args:
+            key (Key): entry key.
+
+        Returns:
+            Value | None: cached value, if there is a fresh one.
+        """
+        cached = self.entries.get(key)
+        if cached is None or cached[0] < time.monotonic():
+            self.entries.pop(key, None)
+            self.stats.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats.hits += 1
+        return cached[1]
+
+    def set(self, key: Key, value: Value) -> None:
+        """Store an entry, evicting the least recently used ones.
+
+        Args:
+            key (Key): entry key.
+            value (Value): value to cache.
+        """
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: Key) -> None:
+        """Drop an entry.
+
+        Args:
+            key (Key): entry key.
+        """
+        self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all the entries."""
+        self.entries.clear()
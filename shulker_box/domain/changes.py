@@ -0,0 +1,163 @@
+"""Change log of the stored entries and the sync tokens of its pages."""
+
+import typing as T
+import uuid
+from dataclasses import dataclass
+
+from shulker_box.domain import exceptions, repositories
+from shulker_box.domain.cursors import AFTER, read_cursor, write_cursor
+
+Position = tuple[int, uuid.UUID]
+
+START: Position = (0, uuid.UUID(int=0))
+SINCE = "since"
+ISSUED_AT = "at"
+
+
+@dataclass
+class Change(T.Generic[repositories.OutSchema]):
+    """Single entry written or deleted at a position of the change sequence.
+
+    Deleted entries come without their output data representation.
+    """
+
+    sequence: int
+    id: uuid.UUID
+    entry: repositories.OutSchema | None = None
+
+    @property
+    def position(self) -> Position:
+        """Position of the change, unique even within a bulk write.
+
+        Returns:
+            Position: sequence number and entry ID.
+        """
+        return self.sequence, self.id
+
+
+class ChangeLog(T.Protocol[repositories.OutSchema]):
+    """Storage interface of the changes in their order."""
+
+    async def collect_changes(
+        self,
+        limit: int,
+        since: Position | None = None,
+        until: float | None = None,
+    ) -> list[Change[repositories.OutSchema]]:
+        """Collect entries written or deleted after a change, in their order.
+
+        Args:
+            limit (int): maximum number of changes.
+            since (Position | None): position of the last known change.
+            until (float | None): timestamp of the latest changes, any if None.
+        """
+        ...  # noqa: WPS428
+
+
+@dataclass
+class ChangesPage(T.Generic[repositories.OutSchema]):
+    """Entries written and deleted since a token, with the token of the rest.
+
+    The token is kept by the client to ask for the next changes, either
+    right away if there are more of them or on the next sync.
+    """
+
+    changed: list[repositories.OutSchema]
+    deleted: list[uuid.UUID]
+    token: str
+    more: bool = False
+
+
+@dataclass
+class ChangeToken:
+    """Position of the last change known to a client and when it was told."""
+
+    sequence: int
+    after: uuid.UUID
+    issued_at: float
+
+    @property
+    def position(self) -> Position:
+        """Position of the last known change.
+
+        Returns:
+            Position: sequence number and entry ID.
+        """
+        return self.sequence, self.after
+
+    @classmethod
+    def from_payload(cls, payload: T.Any) -> "ChangeToken":
+        """Read a token from its decoded payload.
+
+        Args:
+            payload (Any): payload written by encode_token.
+
+        Returns:
+            ChangeToken: position of the change and the time it was told.
+        """
+        return cls(
+            sequence=int(payload[SINCE]),
+            after=uuid.UUID(payload[AFTER]),
+            issued_at=float(payload[ISSUED_AT]),
+        )
+
+
+def encode_token(position: Position, issued_at: float) -> str:
+    """Create an opaque token pointing right after the given change.
+
+    Args:
+        position (Position): position of the last change of a page.
+        issued_at (float): timestamp of the page.
+
+    Returns:
+        str: url safe token.
+    """
+    sequence, entry_id = position
+    return write_cursor(
+        {SINCE: sequence, AFTER: str(entry_id), ISSUED_AT: issued_at},
+    )
+
+
+def decode_token(token: str) -> ChangeToken:
+    """Read the position of the last known change from a token.
+
+    Args:
+        token (str): token created by encode_token.
+
+    Raises:
+        InvalidCursorError: when the token can't be decoded.
+
+    Returns:
+        ChangeToken: position of the change and the time it was told.
+    """
+    try:
+        return ChangeToken.from_payload(read_cursor(token))
+    except (ValueError, KeyError, TypeError):
+        raise exceptions.InvalidCursorError(cursor=token)
+
+
+def paginate_changes(
+    changes: list[Change[repositories.OutSchema]],
+    limit: int,
+    since: Position | None,
+    issued_at: float,
+) -> ChangesPage[repositories.OutSchema]:
+    """Cut a page out of changes fetched with one extra change.
+
+    Args:
+        changes (list[Change]): up to limit + 1 changes sorted by position.
+        limit (int): page size.
+        since (Position | None): position of the last known change.
+        issued_at (float): timestamp of the page.
+
+    Returns:
+        ChangesPage: written entries, deleted ids and the next token.
+    """
+    page = changes[:limit]
+    last = page[-1].position if page else since or START
+    return ChangesPage(
+        changed=[change.entry for change in page if change.entry is not None],
+        deleted=[change.id for change in page if change.entry is None],
+        token=encode_token(last, issued_at),
+        more=len(changes) > limit,
+    )
@@ -0,0 +1,72 @@
+"""Request coalescing."""
+
+import asyncio
+import typing as T
+from functools import partial
+
+Key = T.TypeVar("Key", bound=T.Hashable)
+Value = T.TypeVar("Value")
+
+
+class SingleFlight(T.Generic[Key, Value]):
+    """Share a single call among all the concurrent callers of the same key.
+
+    The call runs as a separate task, so a caller which gets cancelled
+    does not cancel it for the others. Errors are passed to every caller
+    and nothing is remembered once the call is over.
+    """
+
+    def __init__(self) -> None:
+        self.calls: dict[Key, asyncio.Future[Value]] = {}
+
+    def __len__(self) -> int:
+        """Count the calls in flight.
+
+        Returns:
+            int: number of calls.
+        """
+        return len(self.calls)
+
+    async def run(
+        self,
+        key: Key,
+        call: T.Callable[[], T.Awaitable[Value]],
+    ) -> Value:
+        """Run the call or join the one already in flight for the key.
+
+        Args:
+            key (Key): identity of the call.
+            call (Callable[[], Awaitable[Value]]): call to make.
+
+        Returns:
+            Value: result of the shared call.
+        """
+        future = self.calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self.calls[key] = future
+            future.add_done_callback(partial(self.finish, key))
+        return await asyncio.shield(future)
+
+    def forget(self, *keys: Key) -> None:
+        """Let the next callers start new calls instead of joining these.
+
+        The calls in flight still finish for the callers already waiting.
+
+        Args:
+            keys (Key): identities of the calls, all of them if not given.
+        """
+        if not keys:
+            self.calls.clear()
+        for key in keys:
+            self.calls.pop(key, None)
+
+    def finish(self, key: Key, future: asyncio.Future[Value]) -> None:
+        """Drop a finished call unless it has already been replaced.
+
+        Args:
+            key (Key): identity of the call.
+            future (Future[Value]): finished call.
+        """
+        if self.calls.get(key) is future:
+            self.calls.pop(key)
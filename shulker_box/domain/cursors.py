@@ -0,0 +1,134 @@
+"""Opaque cursors of the keyset and offset pagination."""
+
+import base64
+import json
+import typing as T
+import uuid
+from dataclasses import dataclass
+
+from shulker_box.domain import exceptions
+
+AFTER = "after"
+KEY = "key"
+OFFSET = "offset"
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """Position of an entry in the order of a page.
+
+    Entries ordered by their primary keys alone come without a sort key.
+    """
+
+    id: uuid.UUID
+    key: str | None = None
+
+    @classmethod
+    def from_payload(cls, payload: T.Any) -> "Keyset":
+        """Read a position from its decoded payload.
+
+        Args:
+            payload (Any): payload written by encode_cursor.
+
+        Raises:
+            TypeError: when the sort key is not a string.
+
+        Returns:
+            Keyset: position of the entry.
+        """
+        key = payload.get(KEY)
+        if not isinstance(key, (str, type(None))):
+            raise TypeError(key)
+        return cls(id=uuid.UUID(payload[AFTER]), key=key)
+
+
+def encode_cursor(position: Keyset) -> str:
+    """Create an opaque cursor pointing right after the given entry.
+
+    Args:
+        position (Keyset): position of the last entry of a page.
+
+    Returns:
+        str: url safe cursor.
+    """
+    payload = {AFTER: str(position.id)}
+    if position.key is not None:
+        payload[KEY] = position.key
+    return write_cursor(payload)
+
+
+def encode_offset(offset: int) -> str:
+    """Create an opaque cursor pointing at the given position.
+
+    Args:
+        offset (int): number of entries on the previous pages.
+
+    Returns:
+        str: url safe cursor.
+    """
+    return write_cursor({OFFSET: offset})
+
+
+def decode_cursor(cursor: str) -> Keyset:
+    """Read the position of an entry from a cursor.
+
+    Args:
+        cursor (str): cursor created by encode_cursor.
+
+    Raises:
+        InvalidCursorError: when the cursor can't be decoded.
+
+    Returns:
+        Keyset: position of the last entry of the previous page.
+    """
+    try:
+        return Keyset.from_payload(read_cursor(cursor))
+    except (ValueError, KeyError, TypeError, AttributeError):
+        raise exceptions.InvalidCursorError(cursor=cursor)
+
+
+def decode_offset(cursor: str) -> int:
+    """Read the position from a cursor.
+
+    Args:
+        cursor (str): cursor created by encode_offset.
+
+    Raises:
+        InvalidCursorError: when the cursor can't be decoded.
+
+    Returns:
+        int: number of entries on the previous pages.
+    """
+    try:
+        offset = read_cursor(cursor)[OFFSET]
+    except (ValueError, KeyError, TypeError):
+        raise exceptions.InvalidCursorError(cursor=cursor)
+    if not isinstance(offset, int) or offset < 0:
+        raise exceptions.InvalidCursorError(cursor=cursor)
+    return offset
+
+
+def write_cursor(payload: dict[str, T.Any]) -> str:
+    """Encode a cursor payload as url safe text.
+
+    Args:
+        payload (dict[str, Any]): JSON serializable payload.
+
+    Returns:
+        str: url safe cursor.
+    """
+    raw = json.dumps(payload).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def read_cursor(cursor: str) -> T.Any:
+    """Decode a cursor payload written by write_cursor.
+
+    Args:
+        cursor (str): url safe cursor.
+
+    Returns:
+        Any: JSON payload.
+    """
+    padding = "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(cursor + padding))
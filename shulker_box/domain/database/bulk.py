@@ -0,0 +1,168 @@
+"""Database bulk write helpers."""
+
+import typing as T
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import BulkWriteError
+
+from shulker_box.domain.bulk import BulkError
+
+ID = "_id"
+DUPLICATE_KEY_ERROR = 11000
+KEY_VALUE = "keyValue"
+
+RawDocument = dict[str, T.Any]
+WriteError = dict[str, T.Any]
+UniqueKey = tuple[tuple[str, T.Any], ...]
+
+
+async def insert_many(
+    collection: AsyncIOMotorCollection,
+    documents: list[dict[str, T.Any]],
+    chunk_size: int,
+) -> dict[int, WriteError]:
+    """Insert documents with unordered bulk writes, chunk by chunk.
+
+    Args:
+        collection (AsyncIOMotorCollection): collection to write to.
+        documents (list[dict[str, Any]]): raw documents.
+        chunk_size (int): number of documents inserted at once.
+
+    Returns:
+        dict[int, WriteError]: raw errors by document index.
+    """
+    write_errors: dict[int, WriteError] = {}
+    for offset in range(0, len(documents), chunk_size):
+        try:
+            await collection.insert_many(
+                documents[offset : offset + chunk_size],  # noqa: E203
+                ordered=False,
+            )
+        except BulkWriteError as exc:
+            write_errors.update(
+                (offset + error["index"], error)
+                for error in exc.details["writeErrors"]
+            )
+    return write_errors
+
+
+async def read_ids(
+    collection: AsyncIOMotorCollection,
+    query: dict[str, T.Any],
+    chunk_size: int,
+    fields: T.Sequence[str] = (),
+) -> T.AsyncIterator[list[RawDocument]]:
+    """Read ids of the matching documents, chunk by chunk.
+
+    Some other fields can be read along with the ids, so that
+    the documents are known as they were before a bulk write.
+
+    Args:
+        collection (AsyncIOMotorCollection): collection to read from.
+        query (dict[str, Any]): raw query.
+        chunk_size (int): maximum number of ids in a chunk.
+        fields (Sequence[str]): stored fields to read besides the ids.
+
+    Yields:
+        list[RawDocument]: chunk of raw documents.
+    """
+    chunk = []
+    cursor = collection.find(
+        query,
+        projection=[ID, *fields],
+        batch_size=chunk_size,
+    )
+    async for document in cursor:
+        chunk.append(document)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def unique_key(key_value: dict[str, T.Any]) -> UniqueKey:
+    """Build a hashable key from the values of a unique index.
+
+    Args:
+        key_value (dict[str, Any]): indexed fields and their values.
+
+    Returns:
+        UniqueKey: sorted field and value pairs.
+    """
+    return tuple(sorted(key_value.items()))
+
+
+async def find_duplicates(
+    collection: AsyncIOMotorCollection,
+    write_errors: T.Iterable[WriteError],
+) -> dict[UniqueKey, T.Any]:
+    """Find ids of the entries which caused duplicate key errors.
+
+    All of them are looked up with a single query.
+
+    Args:
+        collection (AsyncIOMotorCollection): collection written to.
+        write_errors (Iterable[WriteError]): raw bulk write errors.
+
+    Returns:
+        dict[UniqueKey, Any]: ids of the existing entries by unique key.
+    """
+    key_values = [
+        error[KEY_VALUE]
+        for error in write_errors
+        if error["code"] == DUPLICATE_KEY_ERROR and KEY_VALUE in error
+    ]
+    if not key_values:
+        return {}
+    indexes = {tuple(sorted(key_value)) for key_value in key_values}
+    existing = {}
+    async for document in collection.find({"$or": key_values}):
+        for fields in indexes:
+            existing[
+                unique_key({name: document.get(name) for name in fields})
+            ] = document[ID]
+    return existing
+
+
+async def describe_errors(
+    collection: AsyncIOMotorCollection,
+    write_errors: dict[int, WriteError],
+) -> list[BulkError]:
+    """Turn raw bulk write errors into bulk errors.
+
+    Duplicates are reported along with the id of the existing entry.
+
+    Args:
+        collection (AsyncIOMotorCollection): collection written to.
+        write_errors (dict[int, WriteError]): raw errors by input index.
+
+    Returns:
+        list[BulkError]: errors sorted by input index.
+    """
+    existing = await find_duplicates(collection, write_errors.values())
+    return [
+        BulkError(
+            index=index,
+            detail=error["errmsg"],
+            id=existing.get(unique_key(error.get(KEY_VALUE, {}))),
+        )
+        for index, error in sorted(write_errors.items())
+    ]
+
+
+async def find_duplicate(
+    collection: AsyncIOMotorCollection,
+    write_error: WriteError,
+) -> T.Any:
+    """Find the id of the entry which caused a duplicate key error.
+
+    Args:
+        collection (AsyncIOMotorCollection): collection written to.
+        write_error (WriteError): raw write error.
+
+    Returns:
+        Any: id of the existing entry, if it is still there.
+    """
+    existing = await find_duplicates(collection, [write_error])
+    return existing.get(unique_key(write_error.get(KEY_VALUE, {})))
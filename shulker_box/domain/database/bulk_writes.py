@@ -0,0 +1,230 @@
+"""Database bulk writes of the stored entries."""
+
+import typing as T
+import uuid
+
+from beanie.odm.utils.dump import get_dict
+from pymongo import errors, results
+
+from shulker_box.domain import exceptions, repositories
+from shulker_box.domain.bulk import BulkCreateResult, BulkResult
+from shulker_box.domain.database import bulk
+from shulker_box.domain.database.changelog import MongoChangeLog
+from shulker_box.domain.database.queries import create_bulk_query
+from shulker_box.domain.database.storage import Model
+
+ID = "id"
+
+
+class MongoBulkWrites(
+    MongoChangeLog[
+        Model,
+        repositories.CreateSchema,
+        repositories.UpdateSchema,
+        repositories.OutSchema,
+    ],
+):
+    """Generic database bulk writes, a chunk of entries at once.
+
+    Bulk fields are read along with the ids of the entries selected for
+    bulk writes, so that it is known what the writes changed.
+    """
+
+    bulk_fields: tuple[str, ...] = ()
+
+    async def create_many(
+        self,
+        data_objects: T.Sequence[repositories.CreateSchema],
+        chunk_size: int,
+    ) -> BulkCreateResult[repositories.OutSchema]:
+        """Create many entries with unordered bulk inserts.
+
+        Every chunk is written with a single round trip and a failing
+        entry does not stop the rest of its chunk from being written.
+
+        Args:
+            data_objects (Sequence[CreateSchema]): input data objects.
+            chunk_size (int): number of entries inserted at once.
+
+        Returns:
+            BulkCreateResult: created entries and failures by input index.
+        """
+        entries = [self.table(**obj.dict()) for obj in data_objects]
+        await self.stamp(entries)
+        collection = self.table.get_motor_collection()
+        write_errors = await bulk.insert_many(
+            collection,
+            [get_dict(entry, to_db=True) for entry in entries],
+            chunk_size,
+        )
+        return BulkCreateResult(
+            created=[
+                self.schema.from_orm(entry)
+                for index, entry in enumerate(entries)
+                if index not in write_errors
+            ],
+            errors=await bulk.describe_errors(collection, write_errors),
+        )
+
+    async def delete_many(
+        self,
+        chunk_size: int,
+        ids: list[uuid.UUID] | None = None,
+        **filters,
+    ) -> BulkResult[repositories.OutSchema]:
+        """Delete all the matching entries.
+
+        The ids of the matching entries are read first, so that they can
+        be reported, and then deleted with a single query per chunk, once
+        their tombstones are left.
+
+        Args:
+            chunk_size (int): number of entries deleted at once.
+            ids (list[UUID] | None): delete only entries with these ids.
+            filters (dict): filters to apply.
+
+        Returns:
+            BulkResult: counts, ids and the entries before the delete.
+        """
+        collection = self.table.get_motor_collection()
+        bulk_result = BulkResult[repositories.OutSchema]()
+        chunks = self.read_selection(
+            bulk_result,
+            create_bulk_query(filters, self.table, ids),
+            chunk_size,
+        )
+        async for chunk in chunks:
+            await self.bury(chunk)
+            delete_result = await collection.delete_many(
+                {self.table.id: {"$in": chunk}},
+            )
+            bulk_result.matched += len(chunk)
+            bulk_result.modified += delete_result.deleted_count
+            bulk_result.ids.extend(chunk)
+        return bulk_result
+
+    async def read_selection(
+        self,
+        bulk_result: BulkResult[repositories.OutSchema],
+        query: dict[str, T.Any],
+        chunk_size: int,
+    ) -> T.AsyncIterator[list[uuid.UUID]]:
+        """Read ids of the entries selected for a bulk write, chunk by chunk.
+
+        Bulk fields of the entries are kept in the bulk result,
+        as they are before the write.
+
+        Args:
+            bulk_result (BulkResult[OutSchema]): outcome of the bulk write.
+            query (dict[str, Any]): raw query of the selected entries.
+            chunk_size (int): maximum number of ids in a chunk.
+
+        Yields:
+            list[UUID]: chunk of ids.
+        """
+        projection = {}
+        if self.bulk_fields:
+            projection = self.projection([ID, *self.bulk_fields])
+        chunks = bulk.read_ids(
+            self.table.get_motor_collection(),
+            query,
+            chunk_size,
+            list(projection),
+        )
+        async for documents in chunks:
+            if projection:
+                bulk_result.before.extend(
+                    self.schema.construct(**self.to_row(document, projection))
+                    for document in documents
+                )
+            yield [document[bulk.ID] for document in documents]
+
+    async def update_many(
+        self,
+        data_object: repositories.UpdateSchema,
+        chunk_size: int,
+        ids: list[uuid.UUID] | None = None,
+        **filters,
+    ) -> BulkResult[repositories.OutSchema]:
+        """Update all the matching entries, a chunk of them at once.
+
+        The ids of the matching entries are read first, then every chunk
+        is updated with a single query and read back, so that the changes
+        can be reported.
+
+        Args:
+            data_object (UpdateSchema): input data object.
+            chunk_size (int): number of entries updated at once.
+            ids (list[UUID] | None): update only entries with these ids.
+            filters (dict): filters to apply.
+
+        Returns:
+            BulkResult[OutSchema]: counts, ids and the entries around it.
+        """
+        update = self.update_query(
+            await self.stamp_changes(
+                self.changes(data_object.dict(exclude_unset=True)),
+            ),
+        )
+        bulk_result = BulkResult[repositories.OutSchema]()
+        chunks = self.read_selection(
+            bulk_result,
+            create_bulk_query(filters, self.table, ids),
+            chunk_size,
+        )
+        async for chunk in chunks:
+            update_result = await self.update_chunk(chunk, update)
+            bulk_result.matched += update_result.matched_count
+            bulk_result.modified += update_result.modified_count
+            bulk_result.ids.extend(chunk)
+            bulk_result.entries.extend(await self.read_entries(chunk))
+        return bulk_result
+
+    async def update_chunk(
+        self,
+        entry_ids: list[uuid.UUID],
+        update: dict[str, T.Any],
+    ) -> results.UpdateResult:
+        """Update a chunk of entries with a single query.
+
+        Args:
+            entry_ids (list[UUID]): primary keys.
+            update (dict[str, Any]): raw update.
+
+        Raises:
+            AlreadyExistsError: when a unique value would be duplicated.
+
+        Returns:
+            UpdateResult: counts of the matched and modified entries.
+        """
+        collection = self.table.get_motor_collection()
+        try:
+            return await collection.update_many(
+                {self.table.id: {"$in": entry_ids}},
+                update,
+            )
+        except errors.DuplicateKeyError as exc:
+            existing_id = await self.find_duplicate(exc)
+            raise exceptions.AlreadyExistsError(id=existing_id)
+
+    async def read_entries(
+        self,
+        entry_ids: list[uuid.UUID],
+    ) -> list[repositories.OutSchema]:
+        """Read the entries with the given primary keys.
+
+        Args:
+            entry_ids (list[UUID]): primary keys.
+
+        Returns:
+            list[OutSchema]: output data representations.
+        """
+        projection = self.projection()
+        cursor = self.table.get_motor_collection().find(
+            {self.table.id: {"$in": entry_ids}},
+            projection=list(projection),
+        )
+        return [
+            self.schema.construct(**self.to_row(document, projection))
+            async for document in cursor
+        ]
@@ -0,0 +1,223 @@
+"""Database change log of the stored entries."""
+
+import typing as T
+import uuid
+from datetime import datetime
+
+from beanie import Document
+from beanie.odm.utils.dump import get_dict
+from pymongo import ASCENDING, ReplaceOne
+
+from shulker_box.domain import repositories
+from shulker_box.domain.changes import Change, Position
+from shulker_box.domain.database import sequences
+from shulker_box.domain.database.queries import (
+    create_keyset_query,
+    create_settled_query,
+)
+from shulker_box.domain.database.storage import Model, MongoStorage
+
+SEQUENCE = "sequence"
+CHANGED_AT = "changed_at"
+DELETED_AT = "deleted_at"
+
+
+def create_since_query(
+    id_field: str,
+    since: Position | None = None,
+) -> dict[str, T.Any]:
+    """Create a query of the changes made after a known one.
+
+    Args:
+        id_field (str): stored name of the primary key.
+        since (Position | None): position of the last known change.
+
+    Returns:
+        dict[str, Any]: raw query.
+    """
+    if since is None:
+        return {}
+    sequence, entry_id = since
+    return create_keyset_query(SEQUENCE, id_field, sequence, entry_id)
+
+
+def create_change_order(id_field: str) -> list[tuple[str, int]]:
+    """Create the order of the changes, served by the sequence indexes.
+
+    Args:
+        id_field (str): stored name of the primary key.
+
+    Returns:
+        list[tuple[str, int]]: raw sort.
+    """
+    return [(SEQUENCE, ASCENDING), (id_field, ASCENDING)]
+
+
+class MongoChangeLog(
+    MongoStorage[
+        Model,
+        repositories.CreateSchema,
+        repositories.UpdateSchema,
+        repositories.OutSchema,
+    ],
+):
+    """Generic database change log.
+
+    Sequenced models number every write with their change sequence, along
+    with the time the number was taken, and the ids of deleted entries are
+    kept in the tombstone collection, if any.
+    """
+
+    sequenced: bool = False
+    tombstone: type[Document] | None = None
+
+    async def collect_changes(
+        self,
+        limit: int,
+        since: Position | None = None,
+        until: float | None = None,
+    ) -> list[Change[repositories.OutSchema]]:
+        """Collect entries written or deleted after a change, in their order.
+
+        Changes are ordered by their sequence numbers and then by the ids,
+        which tells apart the entries written by a single bulk write.
+        Without any known change there is nothing to delete on the caller
+        side, so the tombstones are not read at all.
+
+        Numbers are taken before the writes, which may land out of order.
+        Changes numbered after the given timestamp are left out, so that none
+        is skipped by a caller moving past it before an earlier one lands.
+
+        Args:
+            limit (int): maximum number of changes.
+            since (Position | None): position of the last known change.
+            until (float | None): timestamp of the latest changes, any if None.
+
+        Returns:
+            list[Change[OutSchema]]: changes sorted by their positions.
+        """
+        query = create_since_query(self.table.id, since)
+        projection = self.projection()
+        cursor = self.table.get_motor_collection().find(
+            {**query, **create_settled_query(CHANGED_AT, until)},
+            projection=[*projection, SEQUENCE],
+            sort=create_change_order(self.table.id),
+            limit=limit,
+        )
+        changes: list[Change[repositories.OutSchema]] = [
+            Change(
+                sequence=document[SEQUENCE],
+                id=document[self.table.id],
+                entry=self.schema.construct(
+                    **self.to_row(document, projection),
+                ),
+            )
+            async for document in cursor
+        ]
+        if since is not None:
+            changes.extend(
+                await self.collect_tombstones(
+                    limit,
+                    {**query, **create_settled_query(DELETED_AT, until)},
+                ),
+            )
+        changes.sort(key=lambda change: change.position)
+        return changes[:limit]
+
+    async def collect_tombstones(
+        self,
+        limit: int,
+        query: dict[str, T.Any],
+    ) -> list[Change[repositories.OutSchema]]:
+        """Collect the deletions matching a query of the changes.
+
+        Args:
+            limit (int): maximum number of deletions.
+            query (dict[str, Any]): raw query of the changes.
+
+        Returns:
+            list[Change[OutSchema]]: deletions sorted by their positions.
+        """
+        if self.tombstone is None:
+            return []
+        cursor = self.tombstone.get_motor_collection().find(
+            query,
+            sort=create_change_order(self.table.id),
+            limit=limit,
+        )
+        return [
+            Change(
+                sequence=document[SEQUENCE],
+                id=document[self.table.id],
+            )
+            async for document in cursor
+        ]
+
+    async def stamp(self, entries: T.Sequence[Model]) -> None:
+        """Give new entries the next numbers of the change sequence.
+
+        Args:
+            entries (Sequence[Model]): entries about to be written.
+        """
+        if not self.sequenced or not entries:
+            return
+        last = await self.next_sequence(len(entries))
+        first = last - len(entries) + 1
+        changed_at = datetime.utcnow()
+        for sequence, entry in enumerate(entries, start=first):
+            setattr(entry, SEQUENCE, sequence)
+            setattr(entry, CHANGED_AT, changed_at)
+
+    async def stamp_changes(
+        self,
+        changes: dict[str, T.Any],
+    ) -> dict[str, T.Any]:
+        """Add the next number of the change sequence to the changes.
+
+        Args:
+            changes (dict[str, Any]): raw changes.
+
+        Returns:
+            dict[str, Any]: raw changes numbered in the change sequence.
+        """
+        if not self.sequenced:
+            return changes
+        sequence = await self.next_sequence()
+        return {**changes, SEQUENCE: sequence, CHANGED_AT: datetime.utcnow()}
+
+    async def bury(self, entry_ids: list[uuid.UUID]) -> None:
+        """Leave tombstones of deleted entries, all under a single number.
+
+        Args:
+            entry_ids (list[UUID]): ids of the deleted entries.
+        """
+        if self.tombstone is None or not entry_ids:
+            return
+        sequence = await self.next_sequence()
+        tombstones = [
+            self.tombstone(id=entry_id, sequence=sequence)
+            for entry_id in entry_ids
+        ]
+        await self.tombstone.get_motor_collection().bulk_write(
+            [
+                ReplaceOne(
+                    {self.table.id: tombstone.id},
+                    get_dict(tombstone, to_db=True),
+                    upsert=True,
+                )
+                for tombstone in tombstones
+            ],
+            ordered=False,
+        )
+
+    async def next_sequence(self, size: int = 1) -> int:
+        """Take the next numbers of the change sequence of the entries.
+
+        Args:
+            size (int): number of the numbers to take.
+
+        Returns:
+            int: the last of the taken numbers.
+        """
+        collection = self.table.get_motor_collection()
+        return await sequences.allocate(collection.name, size)
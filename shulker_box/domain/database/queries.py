@@ -1,5 +1,9 @@
 """Database ORM helpers."""
 
+import re
+import typing as T
+from datetime import datetime
+
 from beanie import Document
 
 
@@ -14,3 +18,116 @@ def create_query(body: dict, model: type[Document]) -> dict:
         dict: orm query.
     """
     return {getattr(model, key): value for key, value in body.items()}
+
+
+def create_bulk_query(
+    body: dict,
+    model: type[Document],
+    ids: list | None = None,
+) -> dict:
+    """Create an orm query from a dict, optionally limited to given ids.
+
+    Args:
+        body (dict): payload.
+        model (type[Document]): orm model.
+        ids (list | None): primary keys to limit the query to.
+
+    Returns:
+        dict: orm query.
+    """
+    query = create_query(body, model)
+    if ids is not None:
+        query[model.id] = {"$in": ids}
+    return query
+
+
+def create_projection(
+    fields: T.Iterable[str],
+    model: type[Document],
+) -> dict[str, str]:
+    """Create an orm projection of given fields.
+
+    Args:
+        fields (Iterable[str]): names of the fields.
+        model (type[Document]): orm model.
+
+    Returns:
+        dict[str, str]: stored names and the given names of the fields.
+    """
+    return {getattr(model, name): name for name in fields}
+
+
+def create_settled_query(field: str, until: float | None) -> dict:
+    """Create an orm query of the changes made up to a time.
+
+    Changes stored without the time are taken as made long ago.
+
+    Args:
+        field (str): stored field with the time of the changes.
+        until (float | None): timestamp of the latest changes, any if None.
+
+    Returns:
+        dict: orm query.
+    """
+    if until is None:
+        return {}
+    return {field: {"$not": {"$gt": datetime.utcfromtimestamp(until)}}}
+
+
+def create_prefix_query(field: str, prefix: str) -> dict:
+    """Create an orm query matching values starting with the prefix.
+
+    The pattern is anchored, so that it can be served by an index.
+
+    Args:
+        field (str): stored field name.
+        prefix (str): beginning of the values.
+
+    Returns:
+        dict: orm query.
+    """
+    pattern = re.escape(prefix)
+    return {field: {"$regex": f"^{pattern}"}}
+
+
+def create_keyset_query(
+    key_field: str,
+    id_field: str,
+    key: T.Any,
+    entry_id: T.Any,
+) -> dict:
+    """Create an orm query of the entries after one, by a key and the id.
+
+    Only the key is bounded by a range and the entries sharing the key
+    are left out by a filter, so that a single scan of an index on the key
+    and the id serves the query in its order.
+
+    Args:
+        key_field (str): stored field sorting the entries first.
+        id_field (str): stored name of the primary key.
+        key (Any): key of the last known entry.
+        entry_id (Any): primary key of the last known entry.
+
+    Returns:
+        dict: orm query.
+    """
+    return {
+        key_field: {"$gte": key},
+        "$nor": [{key_field: key, id_field: {"$lte": entry_id}}],
+    }
+
+
+def apply_update(document: dict, update: dict) -> dict:
+    """Apply $set and $inc operators of an update to a raw document.
+
+    Args:
+        document (dict): raw document before the update.
+        update (dict): raw update.
+
+    Returns:
+        dict: raw document after the update.
+    """
+    updated = document | update.get("$set", {})
+    for key, change in update.get("$inc", {}).items():
+        updated[key] = updated.get(key, 0) + change
+    return updated
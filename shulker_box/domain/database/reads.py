@@ -0,0 +1,226 @@
+"""Database reads of the stored entries."""
+
+import typing as T
+import uuid
+
+from pymongo import ASCENDING
+from structlog import get_logger
+
+from shulker_box.domain import exceptions, repositories
+from shulker_box.domain.cursors import Keyset
+from shulker_box.domain.database.storage import Model, MongoStorage
+
+logger = get_logger(__name__)
+
+SCORE = "score"
+SEARCH = "search"
+
+Order = list[tuple[str, int]]
+
+
+class MongoReads(
+    MongoStorage[
+        Model,
+        repositories.CreateSchema,
+        repositories.UpdateSchema,
+        repositories.OutSchema,
+    ],
+):
+    """Generic database reads, straight from the raw documents if enabled."""
+
+    raw_reads: bool = True
+
+    async def collect(
+        self,
+        limit: int | None = None,
+        after: Keyset | None = None,
+        fields: T.Sequence[str] | None = None,
+        **filters,
+    ) -> list[repositories.OutSchema]:
+        """Collect entries based on the query, in the order of their pages.
+
+        Pages are read with a range on the order instead of skipping,
+        so the cost of a page does not depend on how deep it is. Only the
+        selected fields are fetched and the output schemas are built
+        straight from the stored values, without ORM documents.
+
+        Args:
+            limit (int | None): maximum number of entries.
+            after (Keyset | None): collect only entries after this one.
+            fields (Sequence[str] | None): output fields to read, all if None.
+            filters (dict): filters to apply.
+
+        Returns:
+            list[OutSchema]: list of output data representations.
+        """
+        if not self.raw_reads:
+            return await self.collect_documents(limit, after, fields, **filters)
+        query, order = self.page_query(filters, after)
+        projection = self.projection(fields)
+        cursor = self.table.get_motor_collection().find(
+            query,
+            projection=list(projection),
+            sort=order or None,
+            limit=limit or 0,
+        )
+        schema = self.read_schema(fields)
+        return [
+            schema.construct(**self.to_row(document, projection))
+            async for document in cursor
+        ]
+
+    async def collect_documents(
+        self,
+        limit: int | None = None,
+        after: Keyset | None = None,
+        fields: T.Sequence[str] | None = None,
+        **filters,
+    ) -> list[repositories.OutSchema]:
+        """Collect entries through the ORM documents, in the page order.
+
+        Args:
+            limit (int | None): maximum number of entries.
+            after (Keyset | None): collect only entries after this one.
+            fields (Sequence[str] | None): output fields to read, all if None.
+            filters (dict): filters to apply.
+
+        Returns:
+            list[OutSchema]: list of output data representations.
+        """
+        query, order = self.page_query(filters, after)
+        entries = self.table.find(query).sort(order)
+        schema = self.read_schema(fields)
+        return [schema.from_orm(entry) async for entry in entries.limit(limit)]
+
+    def page_query(
+        self,
+        filters: dict[str, T.Any],
+        after: Keyset | None = None,
+    ) -> tuple[dict[str, T.Any], Order]:
+        """Create a query of the entries after one, along with their order.
+
+        Entries are ordered by their ids, which bound the pages.
+
+        Args:
+            filters (dict[str, Any]): filters to apply.
+            after (Keyset | None): position of the last entry of a page.
+
+        Returns:
+            tuple[dict[str, Any], Order]: raw query and sort.
+        """
+        query = self.query(filters)
+        if after is not None:
+            query[self.table.id] = {"$gt": after.id}
+        return query, [(self.table.id, ASCENDING)]
+
+    async def search(
+        self,
+        limit: int | None = None,
+        offset: int = 0,
+        fields: T.Sequence[str] | None = None,
+        **filters,
+    ) -> list[repositories.OutSchema]:
+        """Collect entries matching a text search, the most relevant first.
+
+        Relevance does not order the entries uniquely, so they are paged
+        with an offset instead of a range on the primary key.
+
+        Args:
+            limit (int | None): maximum number of entries.
+            offset (int): number of entries to skip.
+            fields (Sequence[str] | None): output fields to read, all if None.
+            filters (dict): words to search for and other filters to apply.
+
+        Returns:
+            list[OutSchema]: list of output data representations.
+        """
+        text = filters.pop(SEARCH)
+        relevance = {"$meta": "textScore"}
+        projection = self.projection(fields)
+        cursor = self.table.get_motor_collection().find(
+            {**self.query(filters), "$text": {"$search": text}},
+            projection=list(projection),
+            sort=[(SCORE, relevance), (self.table.id, ASCENDING)],
+            skip=offset,
+            limit=limit or 0,
+        )
+        schema = self.read_schema(fields)
+        return [
+            schema.construct(**self.to_row(document, projection))
+            async for document in cursor
+        ]
+
+    async def stream(
+        self,
+        batch_size: int,
+        **filters,
+    ) -> T.AsyncIterator[dict[str, T.Any]]:
+        """Stream entries straight from the database cursor.
+
+        Only the fields of the output schema are fetched and the rows
+        are yielded as plain dicts keyed by the output schema fields.
+
+        Args:
+            batch_size (int): number of entries fetched at once.
+            filters (dict): filters to apply.
+
+        Yields:
+            dict[str, Any]: raw output data representation.
+        """
+        projection = self.projection()
+        cursor = self.table.get_motor_collection().find(
+            self.query(filters),
+            projection=list(projection),
+            batch_size=batch_size,
+        )
+        async for document in cursor:
+            yield self.to_row(document, projection)
+
+    async def get_by_id(
+        self,
+        entry_id: uuid.UUID,
+        fields: T.Sequence[str] | None = None,
+    ) -> repositories.OutSchema:
+        """Get an entry by its id.
+
+        Args:
+            entry_id (UUID): primary key.
+            fields (Sequence[str] | None): output fields to read, all if None.
+
+        Raises:
+            DoesNotExistError: when entry does not exist.
+
+        Returns:
+            OutSchema: output data representation.
+        """
+        entry = await self.find_by_id(entry_id, fields)
+        if entry is None:
+            logger.error("Entry was not found", id=entry_id)
+            raise exceptions.DoesNotExistError(id=entry_id)
+        return entry
+
+    async def find_by_id(
+        self,
+        entry_id: uuid.UUID,
+        fields: T.Sequence[str] | None = None,
+    ) -> repositories.OutSchema | None:
+        """Find an entry by its id, fetching only the selected fields.
+
+        Args:
+            entry_id (UUID): primary key.
+            fields (Sequence[str] | None): output fields to read, all if None.
+
+        Returns:
+            OutSchema | None: output data representation, if there is one.
+        """
+        if not self.raw_reads:
+            entry = await self.table.find_one(self.table.id == entry_id)
+            return entry and self.read_schema(fields).from_orm(entry)
+        projection = self.projection(fields)
+        document = await self.table.get_motor_collection().find_one(
+            {self.table.id: entry_id},
+            projection=list(projection),
+        )
+        return document and self.read_schema(fields).construct(
+            **self.to_row(document, projection),
+        )
@@ -3,19 +3,26 @@
 import typing as T
 import uuid
 
-from beanie import Document
+from pymongo import ReturnDocument, errors
 from structlog import get_logger
 
 from shulker_box.domain import exceptions, repositories
-from shulker_box.domain.database.queries import create_query
+from shulker_box.domain.database.bulk_writes import ID, MongoBulkWrites
+from shulker_box.domain.database.queries import apply_update
+from shulker_box.domain.database.reads import MongoReads
+from shulker_box.domain.database.storage import Model
 
 logger = get_logger(__name__)
 
-Model = T.TypeVar("Model", bound=Document)
-
 
 class MongoRepository(
-    T.Generic[
+    MongoBulkWrites[
+        Model,
+        repositories.CreateSchema,
+        repositories.UpdateSchema,
+        repositories.OutSchema,
+    ],
+    MongoReads[
         Model,
         repositories.CreateSchema,
         repositories.UpdateSchema,
@@ -24,44 +31,39 @@ class MongoRepository(
 ):
     """Generic database storage for ORM models."""
 
-    table: type[Model]
-    schema: type[repositories.OutSchema]
-
     async def create(
         self,
         data_object: repositories.CreateSchema,
     ) -> repositories.OutSchema:
         """Create a new entry.
 
+        Uniqueness is left to the indexes, so a duplicate costs no extra
+        round trip unless it actually happens.
+
         Args:
             data_object (CreateSchema): input data object.
 
+        Raises:
+            AlreadyExistsError: when a unique value is already taken.
+
         Returns:
             OutSchema: output data representation.
         """
-        entry = await self.table(**data_object.dict()).insert()
+        entry = self.table(**data_object.dict())
+        await self.stamp([entry])
+        try:
+            await entry.insert()
+        except errors.DuplicateKeyError as exc:
+            existing_id = await self.find_duplicate(exc)
+            raise exceptions.AlreadyExistsError(id=existing_id)
         return self.schema.from_orm(entry)
 
-    async def collect(
-        self,
-        **filters,
-    ) -> list[repositories.OutSchema]:
-        """Collect all entries nased on the query.
+    async def delete(self, entry_id: uuid.UUID) -> repositories.OutSchema:
+        """Delete an entry by its id with a single query.
 
-        Args:
-            filters (dict): filters to apply.
-
-        Returns:
-            list[OutSchema]: list of output data representations.
-        """
-        query = create_query(filters, self.table)
-        return [
-            self.schema.from_orm(entry)
-            async for entry in self.table.find(query)
-        ]
-
-    async def get_by_id(self, entry_id: uuid.UUID) -> repositories.OutSchema:
-        """Get an entry by its id.
+        The tombstone is left before the entry is deleted, so that no
+        deletion goes unseen by the syncing clients. A tombstone of an
+        entry which was not there is harmless and expires with the rest.
 
         Args:
             entry_id (UUID): primary key.
@@ -70,51 +72,97 @@ class MongoRepository(
             DoesNotExistError: when entry does not exist.
 
         Returns:
-            OutSchema: output data representation.
+            OutSchema: output data representation of the deleted entry.
         """
-        entry = await self.table.find_one(self.table.id == entry_id)
+        projection = self.projection()
+        await self.bury([entry_id])
+        entry = await self.table.get_motor_collection().find_one_and_delete(
+            {self.table.id: entry_id},
+            projection=list(projection),
+        )
         if not entry:
             logger.error("Entry was not found", id=entry_id)
             raise exceptions.DoesNotExistError(id=entry_id)
-        return self.schema.from_orm(entry)
+        return self.schema.construct(**self.to_row(entry, projection))
 
-    async def delete(self, entry_id: uuid.UUID) -> None:
-        """Get an entry by its id and delete it.
+    async def update(
+        self,
+        entry_id: uuid.UUID,
+        data_object: repositories.UpdateSchema,
+        version: int | None = None,
+    ) -> repositories.Update[repositories.OutSchema]:
+        """Update an existing entry and return it with a single query.
+
+        The entry is read as it was right before the update, so that
+        the changes can be told apart from concurrent ones. Versioned
+        entries get their version bumped and can be updated only if they
+        are still at the expected version.
 
         Args:
             entry_id (UUID): primary key.
+            data_object (UpdateSchema): input data object.
+            version (int | None): expected version, any if None.
 
         Raises:
             DoesNotExistError: when entry does not exist.
+            AlreadyExistsError: when a unique value is already taken.
+            VersionMismatchError: when the entry is at another version.
+
+        Returns:
+            Update[OutSchema]: output data representations before and after.
         """
-        entry = await self.table.find_one(self.table.id == entry_id)
-        if not entry:
+        changes = self.changes(data_object.dict(exclude_unset=True))
+        if not changes:
+            return await self.leave_unchanged(entry_id, version)
+        changes = await self.stamp_changes(changes)
+        query: dict[str, T.Any] = {self.table.id: entry_id}
+        if self.version_field is not None and version is not None:
+            query[self.version_field] = version
+        update = self.update_query(changes)
+        try:
+            before = (
+                await self.table.get_motor_collection().find_one_and_update(
+                    query,
+                    update,
+                    return_document=ReturnDocument.BEFORE,
+                )
+            )
+        except errors.DuplicateKeyError as exc:
+            existing_id = await self.find_duplicate(exc)
+            raise exceptions.AlreadyExistsError(id=existing_id)
+        if not before and await self.find_by_id(entry_id, [ID]) is None:
             logger.error("Entry was not found", id=entry_id)
             raise exceptions.DoesNotExistError(id=entry_id)
-        await entry.delete()
-
-    async def update(
+        if not before:
+            raise exceptions.VersionMismatchError(id=entry_id)
+        return repositories.Update(
+            before=self.schema.from_orm(self.table.parse_obj(before)),
+            after=self.schema.from_orm(
+                self.table.parse_obj(apply_update(before, update)),
+            ),
+        )
+
+    async def leave_unchanged(
         self,
         entry_id: uuid.UUID,
-        data_object: repositories.UpdateSchema,
-    ) -> repositories.OutSchema:
-        """Update an existing entry.
+        version: int | None = None,
+    ) -> repositories.Update[repositories.OutSchema]:
+        """Read an entry which is updated without any changes.
 
         Args:
             entry_id (UUID): primary key.
-            data_object (CreateSchema): input data object.
+            version (int | None): expected version, any if None.
 
         Raises:
-            DoesNotExistError: when entry does not exist.
+            VersionMismatchError: when the entry is at another version.
 
         Returns:
-            OutSchema: output data representation.
+            Update[OutSchema]: the same output data representation twice.
         """
-        query = create_query(data_object.dict(exclude_unset=True), self.table)
-        update_result = await self.table.find_one(
-            self.table.id == entry_id,
-        ).set(query)
-        if getattr(update_result, "matched_count", 0) == 0:
-            logger.error("Entry was not found", id=entry_id)
-            raise exceptions.DoesNotExistError(id=entry_id)
-        return await self.get_by_id(entry_id)
+        entry = await self.get_by_id(entry_id)
+        unchanged = repositories.Update(before=entry, after=entry)
+        if self.version_field is None or version is None:
+            return unchanged
+        if getattr(entry, self.version_field) != version:
+            raise exceptions.VersionMismatchError(id=entry_id)
+        return unchanged
@@ -0,0 +1,26 @@
+"""Change sequences."""
+
+from pymongo import ReturnDocument
+
+from shulker_box.database.models import Generation
+
+WRITES = "writes"
+
+
+async def allocate(name: str, size: int = 1) -> int:
+    """Take the next numbers of a sequence with a single atomic increment.
+
+    Args:
+        name (str): sequence name.
+        size (int): number of the numbers to take.
+
+    Returns:
+        int: the last of the taken numbers.
+    """
+    counter = await Generation.get_motor_collection().find_one_and_update(
+        {"_id": name},
+        {"$inc": {WRITES: size}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    return counter[WRITES]
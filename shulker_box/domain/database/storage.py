@@ -0,0 +1,142 @@
+"""Base of the database storage classes."""
+
+import typing as T
+
+from beanie import Document
+from pymongo import errors
+from structlog import get_logger
+
+from shulker_box.api import schemas
+from shulker_box.domain import repositories
+from shulker_box.domain.database import bulk
+from shulker_box.domain.database.queries import create_projection, create_query
+
+logger = get_logger(__name__)
+
+Model = T.TypeVar("Model", bound=Document)
+
+
+class MongoStorage(
+    T.Generic[
+        Model,
+        repositories.CreateSchema,
+        repositories.UpdateSchema,
+        repositories.OutSchema,
+    ],
+):
+    """Generic database storage of ORM models, reading raw documents.
+
+    Versioned models get their version bumped by every update.
+    """
+
+    table: type[Model]
+    schema: type[repositories.OutSchema]
+    version_field: str | None = None
+
+    def query(self, filters: dict[str, T.Any]) -> dict[str, T.Any]:
+        """Create a query of the entries matching the filters.
+
+        Args:
+            filters (dict[str, Any]): filters to apply.
+
+        Returns:
+            dict[str, Any]: raw query.
+        """
+        return create_query(filters, self.table)
+
+    def changes(self, data: dict[str, T.Any]) -> dict[str, T.Any]:
+        """Create the stored changes of the fields set in the input data.
+
+        Args:
+            data (dict[str, Any]): fields to change.
+
+        Returns:
+            dict[str, Any]: raw changes.
+        """
+        return create_query(data, self.table)
+
+    def to_row(
+        self,
+        document: dict[str, T.Any],
+        projection: dict[str, str],
+    ) -> dict[str, T.Any]:
+        """Rename the stored fields of a document after the output schema.
+
+        Fields missing from older documents are left out, so that
+        the output schema fills in their defaults.
+
+        Args:
+            document (dict[str, Any]): raw document.
+            projection (dict[str, str]): stored and output schema names.
+
+        Returns:
+            dict[str, Any]: raw output data representation.
+        """
+        return {
+            name: document[alias]
+            for alias, name in projection.items()
+            if alias in document
+        }
+
+    def projection(
+        self,
+        fields: T.Sequence[str] | None = None,
+    ) -> dict[str, str]:
+        """Map the stored field names onto the output schema fields.
+
+        Args:
+            fields (Sequence[str] | None): output fields to read, all if None.
+
+        Returns:
+            dict[str, str]: stored names and their output schema names.
+        """
+        return create_projection(fields or self.schema.__fields__, self.table)
+
+    def read_schema(
+        self,
+        fields: T.Sequence[str] | None = None,
+    ) -> type[repositories.OutSchema]:
+        """Get the output schema limited to the given fields.
+
+        Args:
+            fields (Sequence[str] | None): output fields to read, all if None.
+
+        Returns:
+            type[OutSchema]: full or partial output schema.
+        """
+        if fields is None:
+            return self.schema
+        return T.cast(
+            type[repositories.OutSchema],
+            schemas.partial_schema(self.schema, fields),
+        )
+
+    def update_query(self, changes: dict[str, T.Any]) -> dict[str, T.Any]:
+        """Create an update setting the changes and bumping the version.
+
+        Args:
+            changes (dict[str, Any]): raw changes.
+
+        Returns:
+            dict[str, Any]: raw update.
+        """
+        update: dict[str, T.Any] = {"$set": changes}
+        if self.version_field is not None:
+            update["$inc"] = {self.version_field: 1}
+        return update
+
+    async def find_duplicate(self, exc: errors.DuplicateKeyError) -> T.Any:
+        """Find the entry which caused a duplicate key error.
+
+        Args:
+            exc (DuplicateKeyError): error raised by the database.
+
+        Returns:
+            Any: id of the existing entry.
+        """
+        existing_id = await bulk.find_duplicate(
+            self.table.get_motor_collection(),
+            exc.details,
+        )
+        logger.error("Entry already exists", id=existing_id)
+        return existing_id
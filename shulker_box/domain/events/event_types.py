@@ -2,6 +2,8 @@
 
 import abc
 import enum
+import typing as T
+from dataclasses import asdict
 
 
 class Event(abc.ABC):
@@ -12,6 +14,16 @@ class Event(abc.ABC):
     def __init__(self, *args, **kwargs) -> None:
         """Allow taking parameters."""  # noqa: DAR101
 
+    def to_payload(self) -> dict[str, T.Any]:
+        """Convert the event to a payload.
+
+        Registered events get a faster encoder generated for their class.
+
+        Returns:
+            dict[str, Any]: event fields.
+        """
+        return asdict(self)
+
     @abc.abstractmethod
     async def handle(self) -> None:
         """Handle the event."""
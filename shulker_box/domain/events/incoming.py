@@ -1 +1,5 @@
-"""Domain events coming from the outside world."""
+"""Domain events coming from the outside world.
+
+Event classes registered here with incoming event types are consumed
+from the redis streams named after their types, when the consumer is on.
+"""
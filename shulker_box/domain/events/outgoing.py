@@ -20,6 +20,7 @@ class ItemCreated(Event):
     id: uuid.UUID
     name: str
     category: ItemCategory
+    version: int
 
     async def handle(self) -> None:
         """Publish info about created item."""
@@ -33,3 +34,16 @@ class ItemDeleted(Event):
 
     async def handle(self) -> None:
         """Publish info about deleted item."""
+
+
+@eventclass(OutgoingEventType.ITEM_UPDATED)
+class ItemUpdated(Event):
+    """Event handler for item update."""
+
+    id: uuid.UUID
+    name: str
+    category: ItemCategory
+    version: int
+
+    async def handle(self) -> None:
+        """Publish info about updated item."""
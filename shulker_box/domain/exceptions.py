@@ -16,3 +16,24 @@ class AlreadyExistsError(Exception):
     """Raised when an object already exists."""
 
     id: uuid.UUID
+
+
+@dataclass
+class VersionMismatchError(Exception):
+    """Raised when an object was changed since the expected version."""
+
+    id: uuid.UUID
+
+
+@dataclass
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor is malformed."""
+
+    cursor: str
+
+
+@dataclass
+class ExpiredTokenError(Exception):
+    """Raised when the changes since a sync token are no longer kept."""
+
+    token: str
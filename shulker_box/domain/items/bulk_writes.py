@@ -0,0 +1,131 @@
+"""Items bulk writes."""
+
+import asyncio
+
+from structlog import get_logger
+
+from shulker_box.api.v1.items import bulk_schemas, schemas
+from shulker_box.domain import bulk
+from shulker_box.domain.events.outgoing import (
+    ItemCreated,
+    ItemDeleted,
+    ItemUpdated,
+)
+from shulker_box.domain.items import stats
+from shulker_box.domain.items.reads import ItemReads
+from shulker_box.events.bus import EventBus
+from shulker_box.settings import settings
+
+logger = get_logger(__name__)
+
+
+class ItemBulkWrites(ItemReads):
+    """Writes of many items at once."""
+
+    async def create_many(
+        self,
+        data_objects: list[schemas.ItemCreateSchema],
+    ) -> bulk.BulkCreateResult[schemas.ItemOutSchema]:
+        """Create many items at once.
+
+        Duplicates are reported per item by the unique index on the name
+        instead of being looked up upfront.
+
+        Args:
+            data_objects (list[ItemCreateSchema]): input data objects.
+
+        Returns:
+            BulkCreateResult[ItemOutSchema]: created items and failures.
+        """
+        logger.info("Creating items", items=len(data_objects))
+        bulk_result = await self.repository.create_many(
+            data_objects,
+            settings.ITEMS_BULK_CHUNK_SIZE,
+        )
+        await asyncio.gather(
+            stats.ItemStats.move(
+                added=[item.category for item in bulk_result.created],
+            ),
+            self.invalidate([]),
+        )
+        await EventBus.publish_many(
+            [ItemCreated(**item.dict()) for item in bulk_result.created],
+        )
+        logger.info(
+            "Created items",
+            created=len(bulk_result.created),
+            failed=len(bulk_result.errors),
+        )
+        return bulk_result
+
+    async def delete_many(
+        self,
+        selection: bulk_schemas.ItemBulkSelectSchema,
+    ) -> bulk.BulkResult[schemas.ItemOutSchema]:
+        """Delete all the selected items at once.
+
+        Categories of the items are read along with their ids, so that
+        the stats are moved without counting all the items again.
+
+        Args:
+            selection (ItemBulkSelectSchema): ids or filters of the items.
+
+        Returns:
+            BulkResult: counts and ids of the deleted items.
+        """
+        logger.info("Deleting items", selection=selection)
+        bulk_result = await self.repository.delete_many(
+            settings.ITEMS_BULK_CHUNK_SIZE,
+            **selection.dict(exclude_none=True),
+        )
+        await asyncio.gather(
+            stats.ItemStats.move(
+                removed=[item.category for item in bulk_result.before],
+            ),
+            self.invalidate(bulk_result.ids),
+        )
+        await EventBus.publish_many(
+            [ItemDeleted(id=pk) for pk in bulk_result.ids],
+        )
+        logger.info("Deleted items", deleted=bulk_result.modified)
+        return bulk_result
+
+    async def update_many(
+        self,
+        bulk_update: bulk_schemas.ItemBulkUpdateSchema,
+    ) -> bulk.BulkResult[schemas.ItemOutSchema]:
+        """Apply the same changes to all the selected items at once.
+
+        Categories of the items are read before and after the update,
+        so that the stats are moved without counting all the items again.
+
+        Args:
+            bulk_update (ItemBulkUpdateSchema): selection and changes.
+
+        Returns:
+            BulkResult[ItemOutSchema]: counts and the updated items.
+        """
+        logger.info("Updating items", update=bulk_update)
+        bulk_result = await self.repository.update_many(
+            schemas.ItemUpdateSchema(
+                **bulk_update.changes.dict(exclude_unset=True),
+            ),
+            settings.ITEMS_BULK_CHUNK_SIZE,
+            **bulk_update.dict(exclude={"changes"}, exclude_none=True),
+        )
+        await asyncio.gather(
+            stats.ItemStats.move(
+                added=[item.category for item in bulk_result.entries],
+                removed=[item.category for item in bulk_result.before],
+            ),
+            self.invalidate(bulk_result.ids),
+        )
+        await EventBus.publish_many(
+            [ItemUpdated(**item.dict()) for item in bulk_result.entries],
+        )
+        logger.info(
+            "Updated items",
+            matched=bulk_result.matched,
+            modified=bulk_result.modified,
+        )
+        return bulk_result
@@ -0,0 +1,150 @@
+"""Items cache."""
+
+import asyncio
+import typing as T
+import uuid
+
+import redis
+from structlog import get_logger
+
+from shulker_box.api.schemas import pick_fields
+from shulker_box.api.v1.items.schemas import ItemOutSchema
+from shulker_box.domain.cache import LRUCache
+from shulker_box.events.event_types import OutgoingEventType
+from shulker_box.events.subscriber import subscribe_with_redis
+from shulker_box.settings import settings
+
+logger = get_logger(__name__)
+
+RETRY_INTERVAL = 1
+INVALIDATING_EVENTS = (
+    OutgoingEventType.ITEM_UPDATED.value,
+    OutgoingEventType.ITEM_DELETED.value,
+)
+
+
+class ItemCache:
+    """Holder of the in-process cache of items by their ids.
+
+    With invalidation turned on, entries changed by other workers
+    are dropped as soon as their events come through redis. Every drop
+    is counted, so that reads started before one are not cached.
+    """
+
+    entries: LRUCache[uuid.UUID, ItemOutSchema] | None = None
+    listener: asyncio.Task | None = None
+    invalidations = 0
+
+    @classmethod
+    async def start(cls) -> None:
+        """Create the cache and start listening for changes, if enabled."""
+        if not settings.ITEMS_CACHE:
+            return
+        cls.entries = LRUCache(
+            settings.ITEMS_CACHE_SIZE,
+            settings.ITEMS_CACHE_TTL,
+        )
+        if settings.ITEMS_CACHE_INVALIDATION:
+            cls.listener = asyncio.create_task(cls.listen())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Stop listening for changes and drop the cache."""
+        if cls.listener is not None:
+            cls.listener.cancel()
+            await asyncio.gather(cls.listener, return_exceptions=True)
+            cls.listener = None
+        cls.entries = None
+
+    @classmethod
+    def get(
+        cls,
+        pk: uuid.UUID,
+        fields: T.Sequence[str] | None = None,
+    ) -> ItemOutSchema | None:
+        """Get a cached item, cut down to the selected fields.
+
+        Args:
+            pk (UUID): item id.
+            fields (Sequence[str] | None): fields to keep, all if None.
+
+        Returns:
+            ItemOutSchema | None: cached item, if there is a fresh one.
+        """
+        if cls.entries is None:
+            return None
+        item = cls.entries.get(pk)
+        if item is None:
+            return None
+        return pick_fields(item, fields)  # type: ignore
+
+    @classmethod
+    def put(cls, item: ItemOutSchema, since: int | None = None) -> None:
+        """Cache an item, unless anything was dropped since it was read.
+
+        Args:
+            item (ItemOutSchema): item to cache.
+            since (int | None): invalidations counted before the read.
+        """
+        if since is not None and since != cls.invalidations:
+            return
+        if cls.entries is not None:
+            cls.entries.set(item.id, item)
+
+    @classmethod
+    def invalidate(cls, *pks: uuid.UUID) -> None:
+        """Drop cached items.
+
+        Args:
+            pks (UUID): ids of the items.
+        """
+        cls.invalidations += 1
+        if cls.entries is None:
+            return
+        for pk in pks:
+            cls.entries.invalidate(pk)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all the cached items."""
+        cls.invalidations += 1
+        if cls.entries is not None:
+            cls.entries.clear()
+
+    @classmethod
+    async def listen(cls) -> None:
+        """Keep dropping items changed anywhere, resubscribing on errors.
+
+        Everything is dropped after losing the subscription,
+        as some of the changes could have been missed in the meantime.
+        """
+        while True:  # noqa: WPS457
+            deliveries = subscribe_with_redis(INVALIDATING_EVENTS)
+            try:
+                async for _, payload in deliveries:
+                    cls.invalidate(*changed_items(payload))
+            except (
+                redis.exceptions.ConnectionError,
+                redis.exceptions.TimeoutError,
+            ) as exc:
+                logger.error("Could not connect to redis", exc=exc)
+            except Exception as exc:
+                logger.exception("Could not listen for changes", exc=exc)
+            cls.clear()
+            await asyncio.sleep(RETRY_INTERVAL)
+
+
+def changed_items(payload: dict[str, T.Any]) -> list[uuid.UUID]:
+    """Read the id of the item an event is about, skipping broken events.
+
+    Args:
+        payload (dict[str, Any]): decoded event.
+
+    Returns:
+        list[UUID]: id of the changed item, none if the event is broken.
+    """
+    try:
+        return [uuid.UUID(payload["id"])]
+    except (KeyError, TypeError, ValueError) as exc:
+        logger.error("Could not read changed item", exc=exc)
+        return []
@@ -0,0 +1,108 @@
+"""Items change log and generations."""
+
+import time
+import typing as T
+
+from structlog import get_logger
+
+from shulker_box.api.v1.items import filters, schemas
+from shulker_box.domain import exceptions
+from shulker_box.domain.changes import (
+    ChangesPage,
+    Position,
+    decode_token,
+    paginate_changes,
+)
+from shulker_box.domain.items import list_cache
+from shulker_box.domain.items.reads import ItemReads, cache_key
+from shulker_box.settings import settings
+
+logger = get_logger(__name__)
+
+
+class ItemChanges(ItemReads):
+    """Changes of the items since the syncs of the clients."""
+
+    async def collect_changes(
+        self,
+        url_filters: filters.ItemChangesFilters,
+    ) -> ChangesPage[schemas.ItemOutSchema]:
+        """Collect the items written and deleted since a sync token.
+
+        Without a token all the items are collected. Tokens are no longer
+        accepted once the tombstones of the deletions after them could be
+        gone, so the clients have to collect all the items again. Changes
+        younger than the settle time are left for the next sync, as writes
+        numbered before them may still be landing.
+
+        Args:
+            url_filters (ItemChangesFilters): url params.
+
+        Returns:
+            ChangesPage[ItemOutSchema]: changes and the token of the rest.
+        """
+        logger.info("Collecting item changes", filters=url_filters)
+        issued_at = time.time()
+        since = None
+        if url_filters.since is not None:
+            since = self.read_token(url_filters.since, issued_at)
+        changes = await self.repository.collect_changes(
+            url_filters.limit + 1,
+            since,
+            issued_at - settings.ITEMS_CHANGES_SETTLE_TIME,
+        )
+        page = paginate_changes(
+            changes,
+            url_filters.limit,
+            since,
+            issued_at,
+        )
+        logger.info(
+            "Collected item changes",
+            changed=len(page.changed),
+            deleted=len(page.deleted),
+        )
+        return page
+
+    def read_token(self, since: str, now: float) -> Position:
+        """Read the position of the last change known to a client.
+
+        Args:
+            since (str): sync token.
+            now (float): current timestamp.
+
+        Raises:
+            ExpiredTokenError: when the token is older than the tombstones.
+
+        Returns:
+            Position: position of the last known change.
+        """
+        token = decode_token(since)
+        if now - token.issued_at > settings.ITEMS_TOMBSTONE_RETENTION:
+            raise exceptions.ExpiredTokenError(token=since)
+        return token.position
+
+    async def get_generation(
+        self,
+        url_filters: filters.ItemPageFilters,
+        fields: T.Sequence[str] | None = None,
+    ) -> tuple[int | None, list_cache.CachedPage | None]:
+        """Read the generation of all the items and a cached page of them.
+
+        The generation of the list cache is moved on once the writes land,
+        unlike the change sequence taken before them. A page read while
+        a write is landing keeps the generation from before the write,
+        so it is never tagged as if it had the write in it. The page
+        stored at the generation is read along with it, if there is one.
+
+        Args:
+            url_filters (ItemPageFilters): url filters.
+            fields (Sequence[str] | None): selected fields, all if None.
+
+        Returns:
+            tuple[int | None, CachedPage | None]: generation, None if it
+                could not be read, and the page stored at it.
+        """
+        return await list_cache.ItemListCache.get(
+            cache_key(url_filters, fields),
+        )
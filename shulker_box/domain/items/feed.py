@@ -0,0 +1,12 @@
+"""Items push feed."""
+
+from shulker_box.events.event_types import OutgoingEventType
+from shulker_box.events.feed import EventFeed
+
+ITEM_EVENTS = (
+    OutgoingEventType.ITEM_CREATED.value,
+    OutgoingEventType.ITEM_UPDATED.value,
+    OutgoingEventType.ITEM_DELETED.value,
+)
+
+item_feed = EventFeed(ITEM_EVENTS)
@@ -0,0 +1,155 @@
+"""Items list cache."""
+
+import hashlib
+import json
+import typing as T
+from dataclasses import dataclass
+
+import orjson
+import redis
+from structlog import get_logger
+
+from shulker_box.api.responses import encode_schema
+from shulker_box.api.v1.items.schemas import ItemOutSchema
+from shulker_box.database.client import RedisClient
+from shulker_box.domain.pagination import Page
+from shulker_box.settings import settings
+
+logger = get_logger(__name__)
+
+GENERATION_KEY = "items:generation"
+PAGE_KEY_PREFIX = "items:page:"
+REDIS_ERROR = "Could not connect to redis"
+SEPARATOR = b"\n"
+
+
+@dataclass
+class CachedPage:
+    """Page of items stored already encoded, served as it is."""
+
+    body: bytes
+    next_cursor: str | None = None
+
+
+def decode_page(stored: bytes | None, generation: int) -> CachedPage | None:
+    """Decode a stored page, unless it is stale.
+
+    Pages are stored as a JSON header with their generation and cursor,
+    followed by the encoded items on the next line.
+
+    Args:
+        stored (bytes | None): stored page, if any.
+        generation (int): current generation.
+
+    Returns:
+        CachedPage | None: fresh page.
+    """
+    if stored is None:
+        return None
+    header, body = stored.split(SEPARATOR, 1)
+    meta = orjson.loads(header)
+    if meta["generation"] != generation:
+        return None
+    return CachedPage(body=body, next_cursor=meta["next_cursor"])
+
+
+class ItemListCache:
+    """Holder of the cache of item pages shared by all the workers.
+
+    Pages are stored in redis already encoded, along with the generation
+    of the items they were read at. Every write moves the generation on,
+    which turns all the stored pages stale at once, and both values are
+    read with a single MGET.
+    """
+
+    @classmethod
+    def key(cls, filters: dict[str, T.Any]) -> str:
+        """Build the key of a page.
+
+        Args:
+            filters (dict[str, Any]): filters and pagination parameters.
+
+        Returns:
+            str: redis key.
+        """
+        normalized = json.dumps(filters, sort_keys=True, default=str)
+        return PAGE_KEY_PREFIX + hashlib.sha256(normalized.encode()).hexdigest()
+
+    @classmethod
+    async def get(
+        cls,
+        key: str,
+    ) -> tuple[int | None, CachedPage | None]:
+        """Get the current generation and a fresh page, if there is one.
+
+        Both are read with a single MGET, the page only when it is stored.
+
+        Args:
+            key (str): key of the page.
+
+        Returns:
+            tuple[int | None, CachedPage | None]: generation and page, no
+                generation if redis could not be reached.
+        """
+        keys = [GENERATION_KEY]
+        if settings.ITEMS_LIST_CACHE:
+            keys.append(key)
+        try:
+            stored = dict(zip(keys, await RedisClient.get().mget(keys)))
+        except (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+        ) as exc:
+            logger.error(REDIS_ERROR, exc=exc)
+            return None, None
+        generation = int(stored[GENERATION_KEY] or 0)
+        return generation, decode_page(stored.get(key), generation)
+
+    @classmethod
+    async def put(
+        cls,
+        key: str,
+        generation: int | None,
+        page: Page[ItemOutSchema],
+    ) -> None:
+        """Store a page read at the given generation.
+
+        Pages read while the generation was unknown are not stored.
+
+        Args:
+            key (str): key of the page.
+            generation (int | None): generation read before the page.
+            page (Page[ItemOutSchema]): page of items.
+        """
+        if not settings.ITEMS_LIST_CACHE or generation is None:
+            return
+        header = orjson.dumps(
+            {"generation": generation, "next_cursor": page.next_cursor},
+        )
+        body = orjson.dumps(page.items, default=encode_schema)
+        try:
+            await RedisClient.get().set(
+                key,
+                SEPARATOR.join((header, body)),
+                ex=settings.ITEMS_LIST_CACHE_TTL,
+            )
+        except (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+        ) as exc:
+            logger.error(REDIS_ERROR, exc=exc)
+
+    @classmethod
+    async def bump(cls) -> None:
+        """Move the generation on, turning all the stored pages stale.
+
+        The generation also tags the pages sent to the clients, so it is
+        moved on even when the pages are not stored.
+        """
+        try:
+            await RedisClient.get().incr(GENERATION_KEY)
+        except (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+        ) as exc:
+            logger.error(REDIS_ERROR, exc=exc)
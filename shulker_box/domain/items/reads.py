@@ -0,0 +1,276 @@
+"""Items reads, coalesced and cached."""
+
+import typing as T
+import uuid
+from dataclasses import asdict, dataclass
+from functools import partial
+
+from structlog import get_logger
+
+from shulker_box.api.schemas import pick_fields
+from shulker_box.api.v1.items import filters, schemas
+from shulker_box.domain import (
+    coalescing,
+    cursors,
+    exceptions,
+    pagination,
+    types_utils,
+)
+from shulker_box.domain.items import cache, list_cache, repositories
+
+logger = get_logger(__name__)
+
+ItemPage = pagination.Page[schemas.ItemOutSchema]
+SEARCH = "search"
+
+
+@dataclass(frozen=True)
+class PageKey:
+    """Page read at a generation of the items, unknown if None."""
+
+    generation: int | None
+    key: str
+
+
+def read_position(cursor: str, by_name: bool) -> cursors.Keyset:
+    """Read the position of the last item of the previous page.
+
+    Args:
+        cursor (str): cursor of the page.
+        by_name (bool): whether the pages are ordered by the names.
+
+    Raises:
+        InvalidCursorError: when the cursor is not one of such pages.
+
+    Returns:
+        Keyset: position of the item.
+    """
+    position = cursors.decode_cursor(cursor)
+    keyed = position.key is not None
+    if keyed != by_name:
+        raise exceptions.InvalidCursorError(cursor=cursor)
+    return position
+
+
+def page_filters(url_filters: filters.ItemPageFilters) -> dict[str, T.Any]:
+    """Turn the url filters into the filters of a page.
+
+    Args:
+        url_filters (ItemPageFilters): url filters.
+
+    Returns:
+        dict[str, Any]: filters with pagination params, empty ones left out.
+    """
+    return asdict(url_filters, dict_factory=types_utils.dict_factory)
+
+
+def cache_key(
+    url_filters: filters.ItemPageFilters,
+    fields: T.Sequence[str] | None,
+) -> str:
+    """Build the key of a page in the list cache.
+
+    Args:
+        url_filters (ItemPageFilters): url filters.
+        fields (Sequence[str] | None): selected fields, all if None.
+
+    Returns:
+        str: redis key.
+    """
+    return list_cache.ItemListCache.key(
+        {**page_filters(url_filters), "fields": fields},
+    )
+
+
+def with_name(fields: T.Sequence[str] | None) -> T.Sequence[str] | None:
+    """Add the name to the fields to read.
+
+    Args:
+        fields (Sequence[str] | None): selected fields, all if None.
+
+    Returns:
+        Sequence[str] | None: fields with the name, all if None.
+    """
+    if fields is None or repositories.NAME in fields:
+        return fields
+    return (*fields, repositories.NAME)
+
+
+class ItemReads:
+    """Reads of the items, dropped whenever the items change."""
+
+    def __init__(self, repository: repositories.ItemRepository) -> None:
+        self.repository = repository
+        self.items = coalescing.SingleFlight[uuid.UUID, schemas.ItemOutSchema]()
+        self.pages = coalescing.SingleFlight[PageKey, ItemPage]()
+
+    async def collect(
+        self,
+        url_filters: filters.ItemPageFilters,
+        fields: T.Sequence[str] | None = None,
+        list_generation: int | None = None,
+    ) -> pagination.Page[schemas.ItemOutSchema]:
+        """Collect a page of items by given filters.
+
+        The page is stored in the list cache at the generation read along
+        with the cached pages, which are served without collecting them.
+
+        Args:
+            url_filters (ItemPageFilters): url filters.
+            fields (Sequence[str] | None): fields to read, all if None.
+            list_generation (int | None): generation of the items, if known.
+
+        Returns:
+            Page[ItemOutSchema]: page of output data representations.
+        """
+        logger.info("Collecting items", filters=url_filters, fields=fields)
+        key = cache_key(url_filters, fields)
+        read_page = partial(
+            self.read_page,
+            list_generation,
+            key,
+            page_filters(url_filters),
+            fields,
+        )
+        page = await self.pages.run(PageKey(list_generation, key), read_page)
+        logger.info("Collected items", items=page.items)
+        return page
+
+    async def read_page(
+        self,
+        list_generation: int | None,
+        page_key: str,
+        filters_dict: dict[str, T.Any],
+        fields: T.Sequence[str] | None = None,
+    ) -> pagination.Page[schemas.ItemOutSchema]:
+        """Read a page of items from the repository and cache it.
+
+        Text searches are ordered by relevance and paged by position,
+        all the other pages are ordered and paged by the item ids.
+
+        Args:
+            list_generation (int | None): generation of the items read before.
+            page_key (str): key of the page in the list cache.
+            filters_dict (dict[str, Any]): filters with pagination params.
+            fields (Sequence[str] | None): fields to read, all if None.
+
+        Returns:
+            Page[ItemOutSchema]: page of output data representations.
+        """
+        limit = filters_dict.pop("limit")
+        cursor = filters_dict.pop("cursor", None)
+        if SEARCH in filters_dict:
+            page = await self.search_items(limit, cursor, fields, filters_dict)
+        else:
+            page = await self.read_items(limit, cursor, fields, filters_dict)
+        await list_cache.ItemListCache.put(page_key, list_generation, page)
+        return page
+
+    async def read_items(
+        self,
+        limit: int,
+        cursor: str | None,
+        fields: T.Sequence[str] | None,
+        filters_dict: dict[str, T.Any],
+    ) -> pagination.Page[schemas.ItemOutSchema]:
+        """Read a page of items ordered by their ids or names.
+
+        Pages ordered by the names carry the normalized name of their last
+        item in the cursor, so the name is read along with the fields.
+
+        Args:
+            limit (int): page size.
+            cursor (str | None): cursor of the page.
+            fields (Sequence[str] | None): fields to read, all if None.
+            filters_dict (dict[str, Any]): filters to apply.
+
+        Returns:
+            Page[ItemOutSchema]: page of output data representations.
+        """
+        by_name = repositories.orders_by_name(filters_dict)
+        items = await self.repository.collect(
+            limit=limit + 1,
+            after=read_position(cursor, by_name) if cursor else None,
+            fields=with_name(fields) if by_name else fields,
+            **filters_dict,
+        )
+        if not by_name:
+            return pagination.paginate(items, limit)
+        page = pagination.paginate(items, limit, repositories.name_key)
+        page.items = [pick_fields(item, fields) for item in page.items]
+        return page
+
+    async def search_items(
+        self,
+        limit: int,
+        cursor: str | None,
+        fields: T.Sequence[str] | None,
+        filters_dict: dict[str, T.Any],
+    ) -> pagination.Page[schemas.ItemOutSchema]:
+        """Read a page of items matching a text search, by relevance.
+
+        Args:
+            limit (int): page size.
+            cursor (str | None): cursor of the page.
+            fields (Sequence[str] | None): fields to read, all if None.
+            filters_dict (dict[str, Any]): words to search for and filters.
+
+        Returns:
+            Page[ItemOutSchema]: page of output data representations.
+        """
+        offset = cursors.decode_offset(cursor) if cursor else 0
+        items = await self.repository.search(
+            limit=limit + 1,
+            offset=offset,
+            fields=fields,
+            **filters_dict,
+        )
+        return pagination.paginate_offset(items, limit, offset)
+
+    async def get(
+        self,
+        pk: uuid.UUID,
+        fields: T.Sequence[str] | None = None,
+    ) -> schemas.ItemOutSchema:
+        """Get an item by its id.
+
+        A cached item is cut down to the selected fields, otherwise only
+        the selected fields are read and such partial items are not cached.
+
+        Args:
+            pk (UUID): item id.
+            fields (Sequence[str] | None): fields to read, all if None.
+
+        Returns:
+            ItemOutSchema: output data representation.
+        """
+        logger.info("Getting an item", id=pk, fields=fields)
+        cached = cache.ItemCache.get(pk, fields)
+        if cached is not None:
+            logger.info("Got a cached item", item=cached)
+            return cached
+        if fields is not None:
+            return await self.repository.get_by_id(pk, fields)
+        since = cache.ItemCache.invalidations
+        item = await self.items.run(pk, partial(self.repository.get_by_id, pk))
+        cache.ItemCache.put(item, since)
+        logger.info("Got an item", item=item)
+        return item
+
+    async def invalidate(self, pks: list[uuid.UUID] | None = None) -> None:
+        """Drop everything read before the items changed.
+
+        Reads still in flight are forgotten, so that the callers coming
+        after the change do not join them.
+
+        Args:
+            pks (list[UUID] | None): changed items, all of them if not given.
+        """
+        if pks is None:
+            cache.ItemCache.clear()
+            self.items.forget()
+        else:
+            cache.ItemCache.invalidate(*pks)
+            self.items.forget(*pks)
+        self.pages.forget()
+        await list_cache.ItemListCache.bump()
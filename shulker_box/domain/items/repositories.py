@@ -1,8 +1,63 @@
 """Items storage classes."""
 
+import typing as T
+
+from pymongo import ASCENDING
+
 from shulker_box.api.v1.items import schemas
 from shulker_box.database import models
+from shulker_box.domain.bulk import BulkRepository
+from shulker_box.domain.changes import ChangeLog
+from shulker_box.domain.cursors import Keyset
 from shulker_box.domain.database import repositories
+from shulker_box.domain.database.queries import (
+    create_keyset_query,
+    create_prefix_query,
+)
+from shulker_box.domain.database.reads import Order
+
+ID = "_id"
+NAME = "name"
+NAME_PREFIX = "name_prefix"
+
+
+def orders_by_name(filters: dict[str, T.Any]) -> bool:
+    """Tell whether the items matching the filters are paged by their names.
+
+    Names matched by their prefixes are read in the order of the indexes
+    serving them, a whole name matches a single item at most.
+
+    Args:
+        filters (dict[str, Any]): filters to apply.
+
+    Returns:
+        bool: whether the pages are ordered by the normalized names.
+    """
+    return filters.get(NAME_PREFIX) is not None and filters.get(NAME) is None
+
+
+def name_key(item: schemas.ItemOutSchema) -> str:
+    """Get the key sorting an item by its name.
+
+    Args:
+        item (ItemOutSchema): item read with its name.
+
+    Returns:
+        str: normalized name.
+    """
+    return models.normalize_name(item.name)
+
+
+class ItemRepository(
+    BulkRepository[
+        schemas.ItemCreateSchema,
+        schemas.ItemUpdateSchema,
+        schemas.ItemOutSchema,
+    ],
+    ChangeLog[schemas.ItemOutSchema],
+    T.Protocol,
+):
+    """Item storage interface, with the bulk writes and the change log."""
 
 
 class ItemMongoRepository(
@@ -17,3 +72,79 @@ class ItemMongoRepository(
 
     table = models.Item
     schema = schemas.ItemOutSchema
+    version_field = "version"
+    sequenced = True
+    tombstone = models.ItemTombstone
+    bulk_fields = ("category",)
+
+    def query(self, filters: dict[str, T.Any]) -> dict[str, T.Any]:
+        """Create a query of the items matching the filters.
+
+        Names are matched by their prefixes on the normalized names.
+
+        Args:
+            filters (dict[str, Any]): filters to apply.
+
+        Returns:
+            dict[str, Any]: raw query.
+        """
+        name_prefix = filters.pop(NAME_PREFIX, None)
+        query = super().query(filters)
+        if name_prefix is not None:
+            query.update(
+                create_prefix_query(
+                    self.table.name_key,
+                    models.normalize_name(name_prefix),
+                ),
+            )
+        return query
+
+    def page_query(
+        self,
+        filters: dict[str, T.Any],
+        after: Keyset | None = None,
+    ) -> tuple[dict[str, T.Any], Order]:
+        """Create a query of the items after one, along with their order.
+
+        Names matched by their prefixes are ordered and paged by their
+        normalized names and the ids, like the indexes serving them.
+        A whole name matches a single item, which needs no order at all.
+
+        Args:
+            filters (dict[str, Any]): filters to apply.
+            after (Keyset | None): position of the last item of a page.
+
+        Returns:
+            tuple[dict[str, Any], Order]: raw query and sort.
+        """
+        if filters.get(NAME) is not None:
+            return self.query(filters), []
+        if not orders_by_name(filters):
+            return super().page_query(filters, after)
+        query = self.query(filters)
+        if after is not None:
+            keyset = create_keyset_query(
+                self.table.name_key,
+                ID,
+                after.key,
+                after.id,
+            )
+            query = {"$and": [query, keyset]}
+        return query, [(self.table.name_key, ASCENDING), models.BY_ID]
+
+    def changes(self, data: dict[str, T.Any]) -> dict[str, T.Any]:
+        """Create the stored changes of the item fields set in the input data.
+
+        The normalized name follows the name.
+
+        Args:
+            data (dict[str, Any]): fields to change.
+
+        Returns:
+            dict[str, Any]: raw changes.
+        """
+        changes = super().changes(data)
+        name = data.get("name")
+        if name is not None:
+            changes[self.table.name_key] = models.normalize_name(name)
+        return changes
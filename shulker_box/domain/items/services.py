@@ -1,24 +1,29 @@
 """Items logic services."""
 
+import asyncio
+import typing as T
 import uuid
 from dataclasses import asdict
 
 from structlog import get_logger
 
 from shulker_box.api.v1.items import filters, schemas
-from shulker_box.domain import exceptions, repositories, types_utils
-from shulker_box.domain.events.outgoing import ItemCreated, ItemDeleted
+from shulker_box.domain import types, types_utils
+from shulker_box.domain.events.outgoing import (
+    ItemCreated,
+    ItemDeleted,
+    ItemUpdated,
+)
+from shulker_box.domain.items import bulk_writes, changes, stats
 from shulker_box.events.bus import EventBus
+from shulker_box.settings import settings
 
 logger = get_logger(__name__)
 
 
-class ItemService:
+class ItemService(changes.ItemChanges, bulk_writes.ItemBulkWrites):
     """Service for items business logic."""
 
-    def __init__(self, repository: repositories.Repository) -> None:
-        self.repository = repository
-
     async def create(
         self,
         data_object: schemas.ItemCreateSchema,
@@ -28,56 +33,40 @@ class ItemService:
         Args:
             data_object (ItemCreateSchema): input data object.
 
-        Raises:
-            AlreadyExistsError: if an item with the same name already exists.
-
         Returns:
             ItemOutSchema: output data representation.
         """
         logger.info("Creating a new item", item=data_object)
-        items = await self.repository.collect(name=data_object.name)
-        if items:
-            logger.error("Item already exists", item=items[0])
-            raise exceptions.AlreadyExistsError(id=items[0].id)
         item = await self.repository.create(data_object)
+        await asyncio.gather(
+            stats.ItemStats.move(added=[item.category]),
+            self.invalidate([]),
+        )
         await EventBus.publish(ItemCreated(**item.dict()))
         logger.info("Created a new item", item=item)
         return item
 
-    async def collect(
+    def export(
         self,
         url_filters: filters.ItemFilters,
-    ) -> list[schemas.ItemOutSchema]:
-        """Collect items by given filters.
+    ) -> T.AsyncIterator[dict[str, T.Any]]:
+        """Stream all the items matching given filters.
 
         Args:
             url_filters (ItemFilters): url filters.
 
         Returns:
-            list[ItemOutSchema]: list of output data representations.
+            AsyncIterator[dict[str, Any]]: raw output data representations.
         """
-        logger.info("Collecting items", filters=url_filters)
+        logger.info("Exporting items", filters=url_filters)
         filters_dict = asdict(
             url_filters,
             dict_factory=types_utils.dict_factory,
         )
-        items = await self.repository.collect(**filters_dict)
-        logger.info("Collected items", items=items)
-        return items
-
-    async def get(self, pk: uuid.UUID) -> schemas.ItemOutSchema:
-        """Get an item by its id.
-
-        Args:
-            pk (UUID): item id.
-
-        Returns:
-            ItemOutSchema: output data representation.
-        """
-        logger.info("Getting an item", id=pk)
-        item = await self.repository.get_by_id(pk)
-        logger.info("Got an item", item=item)
-        return item
+        return self.repository.stream(
+            settings.ITEMS_EXPORT_BATCH_SIZE,
+            **filters_dict,
+        )
 
     async def delete(self, pk: uuid.UUID) -> None:
         """Delete an item.
@@ -86,7 +75,11 @@ class ItemService:
             pk (UUID): item id.
         """
         logger.info("Deleting an item", id=pk)
-        await self.repository.delete(pk)
+        item = await self.repository.delete(pk)
+        await asyncio.gather(
+            stats.ItemStats.move(removed=[item.category]),
+            self.invalidate([pk]),
+        )
         await EventBus.publish(ItemDeleted(id=pk))
         logger.info("Deleted an item", id=pk)
 
@@ -94,24 +87,36 @@ class ItemService:
         self,
         pk: uuid.UUID,
         data_object: schemas.ItemUpdateSchema,
+        version: int | None = None,
     ) -> schemas.ItemOutSchema:
         """Update an existing item.
 
         Args:
             pk (UUID): item id.
             data_object (ItemUpdateSchema): input data object.
-
-        Raises:
-            AlreadyExistsError: if an item with the same name already exists.
+            version (int | None): expected version of the item, any if None.
 
         Returns:
             ItemOutSchema: output data representation.
         """
         logger.info("Updating an item", id=pk, item=data_object)
-        items = await self.repository.collect(name=data_object.name)
-        if items:
-            logger.error("Item already exists", item=items[0])
-            raise exceptions.AlreadyExistsError(id=items[0].id)
-        item = await self.repository.update(pk, data_object)
+        update = await self.repository.update(pk, data_object, version)
+        item = update.after
+        await asyncio.gather(
+            stats.ItemStats.move(
+                added=[item.category],
+                removed=[update.before.category],
+            ),
+            self.invalidate([pk]),
+        )
+        await EventBus.publish(ItemUpdated(**item.dict()))
         logger.info("Updated an item", item=item)
         return item
+
+    async def get_stats(self) -> dict[types.ItemCategory, int]:
+        """Count the items per category.
+
+        Returns:
+            dict[types.ItemCategory, int]: numbers of items per category.
+        """
+        return await stats.ItemStats.get()
@@ -0,0 +1,85 @@
+"""Items statistics."""
+
+import collections
+import typing as T
+
+from pymongo import ReplaceOne, UpdateOne
+from structlog import get_logger
+
+from shulker_box.database.models import Item, ItemCounter
+from shulker_box.domain.types import ItemCategory
+
+logger = get_logger(__name__)
+
+ID = "_id"
+ITEMS = "items"
+
+
+class ItemStats:
+    """Holder of the numbers of items per category.
+
+    Every category has its own counter document, moved on with $inc by
+    the writes, so that reading all of them does not depend on the number
+    of items. Counters can be recomputed from the items at any time.
+    """
+
+    @classmethod
+    async def get(cls) -> dict[ItemCategory, int]:
+        """Read the numbers of items per category.
+
+        Returns:
+            dict[ItemCategory, int]: numbers of items, zero if there are none.
+        """
+        counts = dict.fromkeys(ItemCategory, 0)
+        async for counter in ItemCounter.get_motor_collection().find():
+            counts[ItemCategory(counter[ID])] = counter[ITEMS]
+        return counts
+
+    @classmethod
+    async def move(
+        cls,
+        added: T.Iterable[ItemCategory] = (),
+        removed: T.Iterable[ItemCategory] = (),
+    ) -> None:
+        """Count items in and out of their categories with a single write.
+
+        Args:
+            added (Iterable[ItemCategory]): categories of the new items.
+            removed (Iterable[ItemCategory]): categories of the gone items.
+        """
+        changes = collections.Counter(added)
+        changes.subtract(removed)
+        updates = [
+            UpdateOne({ID: category}, {"$inc": {ITEMS: by}}, upsert=True)
+            for category, by in changes.items()
+            if by
+        ]
+        if updates:
+            await ItemCounter.get_motor_collection().bulk_write(
+                updates,
+                ordered=False,
+            )
+
+    @classmethod
+    async def rebuild(cls) -> dict[ItemCategory, int]:
+        """Recompute the counters from the items.
+
+        Writes made while the items are being counted may be missed,
+        so this is meant for fixing the counters up, not for every write.
+
+        Returns:
+            dict[ItemCategory, int]: numbers of items per category.
+        """
+        counts = dict.fromkeys(ItemCategory, 0)
+        pipeline = [{"$group": {ID: "$category", ITEMS: {"$sum": 1}}}]
+        async for group in Item.get_motor_collection().aggregate(pipeline):
+            counts[ItemCategory(group[ID])] = group[ITEMS]
+        await ItemCounter.get_motor_collection().bulk_write(
+            [
+                ReplaceOne({ID: category}, {ITEMS: count}, upsert=True)
+                for category, count in counts.items()
+            ],
+            ordered=False,
+        )
+        logger.info("Rebuilt item stats", counts=counts)
+        return counts
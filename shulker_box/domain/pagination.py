@@ -0,0 +1,70 @@
+"""Keyset and offset pagination helpers."""
+
+import typing as T
+import uuid
+from dataclasses import dataclass
+
+from shulker_box.domain.cursors import Keyset, encode_cursor, encode_offset
+
+
+class Entry(T.Protocol):
+    """Anything identified by a primary key."""
+
+    id: uuid.UUID
+
+
+PageEntry = T.TypeVar("PageEntry", bound=Entry)
+
+
+@dataclass
+class Page(T.Generic[PageEntry]):
+    """Single page of entries with the cursor of the next one."""
+
+    items: list[PageEntry]
+    next_cursor: str | None = None
+
+
+def paginate(
+    items: list[PageEntry],
+    limit: int,
+    sort_key: T.Callable[[PageEntry], str] | None = None,
+) -> Page[PageEntry]:
+    """Cut a page out of entries fetched with one extra entry.
+
+    Args:
+        items (list): up to limit + 1 entries sorted by the key and the id.
+        limit (int): page size.
+        sort_key (Callable | None): key sorting the entries before the ids.
+
+    Returns:
+        Page: entries of the page and the cursor of the next one.
+    """
+    if len(items) <= limit:
+        return Page(items=items)
+    last = items[limit - 1]
+    return Page(
+        items=items[:limit],
+        next_cursor=encode_cursor(
+            Keyset(id=last.id, key=sort_key(last) if sort_key else None),
+        ),
+    )
+
+
+def paginate_offset(
+    items: list[PageEntry],
+    limit: int,
+    offset: int,
+) -> Page[PageEntry]:
+    """Cut a page out of entries fetched by position with one extra entry.
+
+    Args:
+        items (list): up to limit + 1 entries starting at the offset.
+        limit (int): page size.
+        offset (int): number of entries on the previous pages.
+
+    Returns:
+        Page: entries of the page and the cursor of the next one.
+    """
+    if len(items) <= limit:
+        return Page(items=items)
+    return Page(items=items[:limit], next_cursor=encode_offset(offset + limit))
@@ -2,8 +2,10 @@
 
 import typing as T
 import uuid
+from dataclasses import dataclass
 
 from shulker_box.api import schemas
+from shulker_box.domain.cursors import Keyset
 
 CreateSchema = T.TypeVar(
     "CreateSchema",
@@ -18,6 +20,14 @@ UpdateSchema = T.TypeVar(
 OutSchema = T.TypeVar("OutSchema", bound=schemas.Schema)
 
 
+@dataclass
+class Update(T.Generic[OutSchema]):
+    """Single entry before and after an update."""
+
+    before: OutSchema
+    after: OutSchema
+
+
 class Repository(
     T.Generic[CreateSchema, UpdateSchema, OutSchema],
     T.Protocol,
@@ -32,27 +42,68 @@ class Repository(
         """
         ...  # noqa: WPS428
 
-    async def get_by_id(self, entry_id: uuid.UUID) -> OutSchema:
+    async def get_by_id(
+        self,
+        entry_id: uuid.UUID,
+        fields: T.Sequence[str] | None = None,
+    ) -> OutSchema:
         """Get an entry by its identifier.
 
         Args:
             entry_id (UUID): entry ID.
+            fields (Sequence[str] | None): output fields to read, all if None.
         """
         ...  # noqa: WPS428
 
     async def collect(
         self,
+        limit: int | None = None,
+        after: Keyset | None = None,
+        fields: T.Sequence[str] | None = None,
         **filters,
     ) -> list[OutSchema]:
-        """Collect all entries and allow filtering.
+        """Collect entries in the order of their pages and allow filtering.
 
         Args:
+            limit (int | None): maximum number of entries.
+            after (Keyset | None): collect only entries after this one.
+            fields (Sequence[str] | None): output fields to read, all if None.
             filters (dict): additional filters to apply.
         """
         ...  # noqa: WPS428
 
-    async def delete(self, entry_id: uuid.UUID) -> None:
-        """Delete an entry.
+    async def search(
+        self,
+        limit: int | None = None,
+        offset: int = 0,
+        fields: T.Sequence[str] | None = None,
+        **filters,
+    ) -> list[OutSchema]:
+        """Collect entries matching a text search, the most relevant first.
+
+        Args:
+            limit (int | None): maximum number of entries.
+            offset (int): number of entries to skip.
+            fields (Sequence[str] | None): output fields to read, all if None.
+            filters (dict): words to search for and other filters to apply.
+        """
+        ...  # noqa: WPS428
+
+    def stream(
+        self,
+        batch_size: int,
+        **filters,
+    ) -> T.AsyncIterator[dict[str, T.Any]]:
+        """Stream raw entries without building the output schemas.
+
+        Args:
+            batch_size (int): number of entries fetched at once.
+            filters (dict): additional filters to apply.
+        """
+        ...  # noqa: WPS428
+
+    async def delete(self, entry_id: uuid.UUID) -> OutSchema:
+        """Delete an entry and return it.
 
         Args:
             entry_id (UUID): entry ID.
@@ -63,11 +114,13 @@ class Repository(
         self,
         entry_id: uuid.UUID,
         data_object: UpdateSchema,
-    ) -> OutSchema:
-        """Update an existing entry.
+        version: int | None = None,
+    ) -> Update[OutSchema]:
+        """Update an existing entry and return it before and after.
 
         Args:
             entry_id (UUID): entry ID.
             data_object (UpdateSchema): input data object.
+            version (int | None): expected version of the entry, any if None.
         """
         ...  # noqa: WPS428
@@ -0,0 +1,176 @@
+"""Buffered event dispatch."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from structlog import get_logger
+
+from shulker_box.events.publisher import publish_many_with_redis
+
+if TYPE_CHECKING:
+    from shulker_box.domain.events.event_types import Event
+
+logger = get_logger(__name__)
+
+MILLISECONDS = 1000
+
+
+class BufferStats:
+    """Counters describing how the buffer is flushed.
+
+    Latencies are measured in milliseconds.
+    """
+
+    def __init__(self) -> None:
+        self.flushes = 0
+        self.flushed_events = 0
+        self.failed_flushes = 0
+        self.dropped_events = 0
+        self.last_flush_latency: float = 0
+        self.max_flush_latency: float = 0
+        self._total_flush_latency: float = 0
+
+    @property
+    def average_flush_latency(self) -> float:
+        """Average time of a single flush in milliseconds.
+
+        Returns:
+            float: average flush latency.
+        """
+        if not self.flushes:
+            return 0
+        return self._total_flush_latency / self.flushes
+
+    def record(self, events: int, latency: float) -> None:
+        """Record a finished flush.
+
+        Args:
+            events (int): number of flushed events.
+            latency (float): flush duration in milliseconds.
+        """
+        self.flushes += 1
+        self.flushed_events += events
+        self.last_flush_latency = latency
+        self.max_flush_latency = max(self.max_flush_latency, latency)
+        self._total_flush_latency += latency
+
+    def record_failure(self, dropped: int = 0) -> None:
+        """Record a flush that did not reach redis.
+
+        Args:
+            dropped (int): number of events given up on.
+        """
+        self.failed_flushes += 1
+        self.dropped_events += dropped
+
+
+class EventBuffer:
+    """Bounded queue of events flushed to redis in pipelined batches.
+
+    Events are sent when the batch is full or when the flush interval
+    passes since the first event of the batch, whichever comes first.
+    Publishers putting into the queue wait for a free slot when it is full.
+    A batch redis did not accept is kept and retried after the interval.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        flush_interval: int,
+        max_size: int,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval / MILLISECONDS
+        self.queue: asyncio.Queue["Event"] = asyncio.Queue(maxsize=max_size)
+        self.pending: list["Event"] = []
+        self.stats = BufferStats()
+        self.task: asyncio.Task | None = None
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting to be flushed.
+
+        Returns:
+            int: queue depth.
+        """
+        return self.queue.qsize() + len(self.pending)
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        logger.info("Starting event buffer", batch_size=self.batch_size)
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the background task and flush everything left."""
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+        while not self.queue.empty():
+            self.pending.append(self.queue.get_nowait())
+            if len(self.pending) >= self.batch_size:
+                await self.flush()
+        if not await self.flush():
+            dropped = len(self.pending)
+            logger.error("Dropped buffered events", events=dropped)
+            self.stats.dropped_events += dropped
+            self.pending = []
+        logger.info("Stopped event buffer", stats=self.stats)
+
+    async def run(self) -> None:
+        """Keep collecting and flushing batches of events."""
+        while True:  # noqa: WPS457
+            await self.collect()
+            if not await self.flush():
+                await asyncio.sleep(self.flush_interval)
+
+    async def collect(self) -> None:
+        """Wait for a batch to fill up or for the flush interval to pass."""
+        loop = asyncio.get_running_loop()
+        if not self.pending:
+            self.pending.append(await self.queue.get())
+        deadline = loop.time() + self.flush_interval
+        while len(self.pending) < self.batch_size:
+            try:
+                event = await asyncio.wait_for(
+                    self.queue.get(),
+                    deadline - loop.time(),
+                )
+            except asyncio.TimeoutError:
+                return
+            self.pending.append(event)
+
+    async def flush(self) -> bool:
+        """Publish the pending events in a single pipeline.
+
+        The events stay pending when redis does not accept them. They are
+        dropped on unexpected errors instead, so a single broken event can
+        neither kill the background task nor block the publishers.
+
+        Returns:
+            bool: whether the pending events were published.
+        """
+        if not self.pending:
+            return True
+        started = time.perf_counter()
+        try:
+            published = await publish_many_with_redis(self.pending)
+        except Exception as exc:
+            logger.exception("Could not flush events", exc=exc)
+            self.stats.record_failure(dropped=len(self.pending))
+            self.pending = []
+            return False
+        if not published:
+            self.stats.record_failure()
+            return False
+        latency = (time.perf_counter() - started) * MILLISECONDS
+        self.stats.record(len(self.pending), latency)
+        logger.debug(
+            "Flushed events",
+            events=len(self.pending),
+            latency=latency,
+            depth=self.queue.qsize(),
+        )
+        self.pending = []
+        return True
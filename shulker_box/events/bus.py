@@ -1,27 +1,99 @@
 """Event bus."""
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable
+import asyncio
+from typing import TYPE_CHECKING, Sequence
 
 from structlog import get_logger
 
-from shulker_box.events.publisher import publish_with_redis
+from shulker_box.events.buffer import EventBuffer
+from shulker_box.events.consumer import EventConsumer
+from shulker_box.events.event_types import IncomingEventType
+from shulker_box.events.outbox import OutboxRelay, store_in_outbox
+from shulker_box.events.publisher import (
+    publish_many_with_redis,
+    publish_with_redis,
+)
+from shulker_box.events.registry import EventRegistry, eventclass  # noqa: F401
+from shulker_box.events.sinks import Dispatcher, EventSink, log_events
+from shulker_box.settings import settings
 
 if TYPE_CHECKING:
     from shulker_box.domain.events.event_types import Event
-    from shulker_box.events.event_types import EventType
 
 logger = get_logger(__name__)
 
 
-class EventBus:
-    """Dispatcher and publisher for event objects."""
+class EventBus(Dispatcher, EventRegistry):
+    """Dispatcher and publisher for event objects.
 
-    events: dict[str, type["Event"]] = {}
+    Handled events are fanned out to the subscribed sinks concurrently.
+    """
+
+    audit_log: EventSink | None = None
+    buffer: EventBuffer | None = None
+    relay: OutboxRelay | None = None
+    consumer: EventConsumer | None = None
+
+    @classmethod
+    async def start(cls) -> None:
+        """Start the background delivery and consuming, if enabled."""
+        if settings.EVENTS_AUDIT_LOG:
+            cls.audit_log = cls.subscribe("audit-log", log_events)
+        incoming = cls.incoming()
+        if settings.EVENTS_CONSUMER and incoming:
+            cls.consumer = EventConsumer(
+                events=incoming,
+                batch_size=settings.EVENTS_BATCH_SIZE,
+                concurrency=settings.EVENTS_CONSUMER_CONCURRENCY,
+            )
+            cls.consumer.start()
+        if settings.EVENTS_OUTBOX:
+            cls.relay = OutboxRelay(
+                batch_size=settings.EVENTS_BATCH_SIZE,
+                poll_interval=settings.EVENTS_OUTBOX_POLL_INTERVAL,
+            )
+            cls.relay.start()
+        elif settings.EVENTS_BUFFERED:
+            cls.buffer = EventBuffer(
+                batch_size=settings.EVENTS_BATCH_SIZE,
+                flush_interval=settings.EVENTS_FLUSH_INTERVAL,
+                max_size=settings.EVENTS_QUEUE_SIZE,
+            )
+            cls.buffer.start()
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Stop the background delivery, flushing the buffered events."""
+        await asyncio.gather(*cls.deliveries, return_exceptions=True)
+        if cls.audit_log is not None:
+            cls.unsubscribe(cls.audit_log)
+            cls.audit_log = None
+        if cls.consumer is not None:
+            await cls.consumer.stop()
+            cls.consumer = None
+        if cls.relay is not None:
+            await cls.relay.stop()
+            cls.relay = None
+        if cls.buffer is not None:
+            await cls.buffer.stop()
+            cls.buffer = None
+
+    @classmethod
+    def incoming(cls) -> dict[str, type["Event"]]:
+        """Select the registered events coming from other services.
+
+        Returns:
+            dict[str, type[Event]]: incoming event classes by their types.
+        """
+        return {
+            name: event_class
+            for name, event_class in cls.events.items()
+            if isinstance(event_class.event_type, IncomingEventType)
+        }
 
     @classmethod
     async def publish(cls, event: "Event") -> None:
-        """Publish an event to redis.
+        """Handle an event and send it to the sinks.
 
         Args:
             event (Event): event object.
@@ -38,33 +110,50 @@ class EventBus:
             )
             return
         await event.handle()
-        publish_with_redis(event)
-
+        await cls.dispatch([event])
 
-def eventclass(event_type: "EventType") -> Callable:
-    """Register an event class and return it as a dataclass.
-
-    Connector between the event type and the event class (dataclass).
+    @classmethod
+    async def publish_many(cls, events: Sequence["Event"]) -> None:
+        """Publish a batch of events with a single write.
 
-    Args:
-        event_type (EventType): event type - channel name.
+        Args:
+            events (Sequence[Event]): event objects.
+        """
+        logger.info("Publishing events", events=len(events))
+        registered = [
+            event for event in events if cls.events.get(event.event_type.value)
+        ]
+        if len(registered) < len(events):
+            logger.warning(
+                "No event registered to publish",
+                skipped=len(events) - len(registered),
+                events=cls.events,
+            )
+        if not registered:
+            return
+        for event in registered:
+            await event.handle()
+        await cls.dispatch(registered)
 
-    Returns:
-        Callable: a decorator.
-    """
-    logger.info("Registering event class", event_type=event_type)
+    @classmethod
+    async def deliver(cls, events: Sequence["Event"]) -> None:
+        """Deliver events to redis.
 
-    def wrapper(cls) -> type:
-        """Register the event class and create the dataclass.
+        In outbox mode events are stored in the database and relayed
+        later, in buffered mode they are queued for the background flush.
 
         Args:
-            cls (type): event class.
-
-        Returns:
-            type: the dataclass.
+            events (Sequence[Event]): event objects.
         """
-        EventBus.events[event_type.value] = cls
-        cls.event_type = event_type
-        return dataclass(cls)
-
-    return wrapper
+        if cls.relay is not None:
+            await store_in_outbox(list(events))
+        elif cls.buffer is not None:
+            for event in events:
+                await cls.buffer.queue.put(event)
+        elif len(events) == 1:
+            await publish_with_redis(events[0])
+        else:
+            await publish_many_with_redis(list(events))
+
+
+EventBus.subscribe("redis", EventBus.deliver, critical=True, timeout=None)
@@ -0,0 +1,249 @@
+"""Event consumer handlers."""
+
+import asyncio
+import os
+import socket
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable
+
+import redis
+from pydantic import parse_obj_as
+from structlog import get_logger
+
+from shulker_box.database.client import RedisClient
+from shulker_box.events.encoding import DATA, decode_payload
+from shulker_box.events.subscriber import STREAM_BLOCK
+
+if TYPE_CHECKING:
+    from shulker_box.domain.events.event_types import Event
+
+logger = get_logger(__name__)
+
+GROUP = "shulker-box"
+NEW_MESSAGES = ">"
+FIRST_MESSAGE = b"0-0"
+CLAIM_IDLE_TIME = 60 * 1000
+RETRY_INTERVAL = 1
+
+Message = tuple[bytes, dict[bytes, bytes]]
+Delivery = tuple[str, Message]
+
+
+def decode_message(
+    event_class: type["Event"],
+    fields: dict[bytes, bytes],
+) -> "Event":
+    """Decode a stream message into an event.
+
+    Args:
+        event_class (type[Event]): registered class of the event.
+        fields (dict[bytes, bytes]): fields of the message.
+
+    Returns:
+        Event: event object.
+    """
+    return parse_obj_as(event_class, decode_payload(fields[DATA]))
+
+
+def group_ids(deliveries: list[Delivery]) -> dict[str, list[bytes]]:
+    """Group the ids of the messages by their streams.
+
+    Args:
+        deliveries (list[Delivery]): stream names with the messages.
+
+    Returns:
+        dict[str, list[bytes]]: message ids by stream name.
+    """
+    message_ids: dict[str, list[bytes]] = defaultdict(list)
+    for stream, (message_id, _) in deliveries:
+        message_ids[stream].append(message_id)
+    return message_ids
+
+
+async def create_groups(streams: Iterable[str]) -> None:
+    """Create the consumer group on the streams which have none yet.
+
+    Args:
+        streams (Iterable[str]): stream names.
+
+    Raises:
+        redis.exceptions.ResponseError: when a group can't be created.
+    """
+    client = RedisClient.get()
+    for stream in streams:
+        try:
+            await client.xgroup_create(stream, GROUP, mkstream=True)
+        except redis.exceptions.ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+
+class EventHandler:
+    """Handling of the incoming events in batches, up to a limit at once."""
+
+    def __init__(
+        self,
+        events: dict[str, type["Event"]],
+        concurrency: int,
+    ) -> None:
+        self.events = events
+        self.slots = asyncio.Semaphore(concurrency)
+
+    async def handle(self, deliveries: list[Delivery]) -> None:
+        """Handle a batch of messages and acknowledge all of them at once.
+
+        Messages which can't be decoded or handled are logged
+        and acknowledged anyway, so they do not come back forever.
+
+        Args:
+            deliveries (list[Delivery]): stream names with the messages.
+        """
+        if not deliveries:
+            return
+        await asyncio.gather(
+            *(self.handle_message(*delivery) for delivery in deliveries),
+        )
+        await self.acknowledge(deliveries)
+        logger.debug("Handled events", events=len(deliveries))
+
+    async def acknowledge(self, deliveries: list[Delivery]) -> None:
+        """Acknowledge messages with a single command per stream.
+
+        Args:
+            deliveries (list[Delivery]): stream names with the messages.
+        """
+        async with RedisClient.get().pipeline(transaction=False) as pipeline:
+            for stream, message_ids in group_ids(deliveries).items():
+                pipeline.xack(stream, GROUP, *message_ids)
+            await pipeline.execute()
+
+    async def handle_message(self, stream: str, message: Message) -> None:
+        """Decode a message and handle its event, waiting for a free slot.
+
+        Args:
+            stream (str): stream name, which is the event type.
+            message (Message): message id and fields.
+        """
+        event = self.decode(stream, message)
+        if event is None:
+            return
+        async with self.slots:
+            try:
+                await event.handle()
+            except Exception as exc:
+                logger.exception(
+                    "Could not handle event",
+                    event_object=event,
+                    exc=exc,
+                )
+
+    def decode(self, stream: str, message: Message) -> "Event | None":
+        """Decode a message into an event of the type of its stream.
+
+        Args:
+            stream (str): stream name, which is the event type.
+            message (Message): message id and fields.
+
+        Returns:
+            Event | None: event object, if the message could be decoded.
+        """
+        message_id, fields = message
+        try:
+            return decode_message(self.events[stream], fields)
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.error("Could not decode event", id=message_id, exc=exc)
+        return None
+
+
+class EventConsumer(EventHandler):
+    """Background task handling the incoming events from redis streams.
+
+    Every incoming event type has its own stream. Workers read them as
+    members of a single consumer group, so each message is handled by
+    just one of them. Messages are read and acknowledged in batches and
+    handled concurrently, up to a limit. Messages left unacknowledged by
+    workers which stopped are taken over on start.
+    """
+
+    def __init__(
+        self,
+        events: dict[str, type["Event"]],
+        batch_size: int,
+        concurrency: int,
+    ) -> None:
+        super().__init__(events, concurrency)
+        self.name = f"{socket.gethostname()}-{os.getpid()}"
+        self.batch_size = batch_size
+        self.task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background consumer task."""
+        logger.info("Starting event consumer", streams=list(self.events))
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the background consumer task."""
+        if self.task is None:
+            return
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+        self.task = None
+        logger.info("Stopped event consumer")
+
+    async def run(self) -> None:
+        """Keep consuming, starting over on errors."""
+        while True:  # noqa: WPS457
+            try:
+                await self.consume()
+            except (
+                redis.exceptions.ConnectionError,
+                redis.exceptions.TimeoutError,
+            ) as exc:
+                logger.error("Could not connect to redis", exc=exc)
+            except Exception as exc:
+                logger.exception("Could not consume events", exc=exc)
+            await asyncio.sleep(RETRY_INTERVAL)
+
+    async def consume(self) -> None:
+        """Join the consumer group and handle the messages until stopped."""
+        await create_groups(self.events)
+        await self.recover()
+        await self.listen()
+
+    async def recover(self) -> None:
+        """Handle the messages left unacknowledged for too long."""
+        client = RedisClient.get()
+        for stream in self.events:
+            start = FIRST_MESSAGE
+            claimed = True
+            while claimed:
+                start, messages, *_ = await client.xautoclaim(
+                    stream,
+                    GROUP,
+                    self.name,
+                    CLAIM_IDLE_TIME,
+                    start_id=start,  # type: ignore
+                    count=self.batch_size,
+                )
+                await self.handle([(stream, message) for message in messages])
+                claimed = start != FIRST_MESSAGE
+
+    async def listen(self) -> None:
+        """Keep handling the new messages, batch after batch."""
+        client = RedisClient.get()
+        streams = {stream: NEW_MESSAGES for stream in self.events}
+        while True:  # noqa: WPS457
+            response = await client.xreadgroup(
+                GROUP,
+                self.name,
+                streams,
+                count=self.batch_size,
+                block=STREAM_BLOCK,
+            )
+            await self.handle(
+                [
+                    (stream.decode(), message)
+                    for stream, messages in response
+                    for message in messages
+                ],
+            )
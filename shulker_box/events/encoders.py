@@ -0,0 +1,122 @@
+"""Event payload encoders generated per event class."""
+
+import dataclasses
+import typing as T
+from functools import partial
+
+PLAIN_TYPES = (str, int, float, bool)
+
+Fields = dict[str, T.Any]
+Encoder = T.Callable[[T.Any], Fields]
+Convert = T.Callable[[T.Any], T.Any]
+Converter = tuple[str, Convert]
+
+
+def compile_encoder(event_class: type) -> Encoder:
+    """Build a function converting events of a class to payloads.
+
+    The function reads the fields directly instead of deep copying them
+    like ``dataclasses.asdict`` does. Fields of classes unknown to the
+    encodings, like UUIDs or datetimes, are turned into strings up front,
+    nested dataclasses get their own encoders and values of other
+    annotations are left to ``plain`` and the encoding fallback.
+
+    Args:
+        event_class (type): event dataclass.
+
+    Returns:
+        Encoder: function taking an event and returning its fields.
+    """
+    converters = [
+        (field.name, field_converter(field.type))
+        for field in dataclasses.fields(event_class)
+    ]
+    return partial(encode_fields, converters)
+
+
+def encode_fields(converters: list[Converter], event: T.Any) -> Fields:
+    """Read and convert the fields of an event.
+
+    Args:
+        converters (list[Converter]): field names with their conversions.
+        event (Any): event dataclass instance.
+
+    Returns:
+        Fields: converted fields by their names.
+    """
+    return {name: convert(getattr(event, name)) for name, convert in converters}
+
+
+def field_converter(annotation: T.Any) -> Convert:
+    """Choose the conversion of the values of a field.
+
+    Args:
+        annotation (Any): field annotation.
+
+    Returns:
+        Convert: function converting the field values.
+    """
+    if is_class(annotation) and dataclasses.is_dataclass(annotation):
+        return compile_encoder(annotation)
+    if needs_string(annotation):
+        return str
+    if is_class(annotation):
+        return keep
+    return plain
+
+
+def keep(value: T.Any) -> T.Any:
+    """Pass a value known to the encodings as it is.
+
+    Args:
+        value (Any): field value.
+
+    Returns:
+        Any: the same value.
+    """
+    return value
+
+
+def plain(value: T.Any) -> T.Any:
+    """Turn the dataclasses within a value into dicts.
+
+    Args:
+        value (Any): value of a generic or unresolved annotation.
+
+    Returns:
+        Any: value with dicts in place of the dataclasses.
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items()}
+    return value
+
+
+def is_class(annotation: T.Any) -> bool:
+    """Check if an annotation is a plain class.
+
+    Generic aliases like ``list[int]`` pass as types on Python 3.10,
+    but fail in ``issubclass``, so they are told apart by their origin.
+
+    Args:
+        annotation (Any): field annotation.
+
+    Returns:
+        bool: whether the annotation is a class, not an alias or a string.
+    """
+    return isinstance(annotation, type) and T.get_origin(annotation) is None
+
+
+def needs_string(annotation: T.Any) -> bool:
+    """Check if values of an annotation are encoded as strings.
+
+    Args:
+        annotation (Any): field annotation.
+
+    Returns:
+        bool: whether the annotation is a class unknown to the encodings.
+    """
+    return is_class(annotation) and not issubclass(annotation, PLAIN_TYPES)
@@ -0,0 +1,57 @@
+"""Event payload encodings."""
+
+import json
+import typing as T
+
+import orjson
+
+from shulker_box.settings import settings
+
+try:
+    import msgpack  # noqa: WPS433
+except ImportError:
+    msgpack = None  # type: ignore # noqa: WPS440
+
+JSON = "json"
+ORJSON = "orjson"
+MSGPACK = "msgpack"
+DATA = b"data"
+
+Payload = str | bytes
+
+if settings.EVENTS_ENCODING == MSGPACK and msgpack is None:
+    raise ImportError("The msgpack encoding needs msgpack to be installed")
+
+
+def encode_payload(payload: dict[str, T.Any]) -> Payload:
+    """Encode an event payload with the configured encoding.
+
+    Values unknown to the encoding, like UUIDs or enums, are sent as strings.
+
+    Args:
+        payload (dict[str, Any]): event fields.
+
+    Returns:
+        Payload: JSON text or msgpack bytes.
+    """
+    if settings.EVENTS_ENCODING == MSGPACK:
+        return msgpack.packb(payload, default=str)
+    if settings.EVENTS_ENCODING == ORJSON:
+        return orjson.dumps(payload, default=str)
+    return json.dumps(payload, default=str)
+
+
+def decode_payload(data: Payload) -> dict[str, T.Any]:
+    """Decode an event payload with the configured encoding.
+
+    Args:
+        data (Payload): encoded payload.
+
+    Returns:
+        dict[str, Any]: event fields.
+    """
+    if settings.EVENTS_ENCODING == MSGPACK:
+        return msgpack.unpackb(data)
+    if settings.EVENTS_ENCODING == ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -16,3 +16,4 @@ class OutgoingEventType(EventType):
 
     ITEM_CREATED = "item-created"
     ITEM_DELETED = "item-deleted"
+    ITEM_UPDATED = "item-updated"
@@ -0,0 +1,220 @@
+"""Fan-out of the published events to the clients of a worker."""
+
+import asyncio
+import json
+import typing as T
+from dataclasses import dataclass
+from functools import cached_property
+
+import redis
+from structlog import get_logger
+
+from shulker_box.events.subscriber import subscribe_with_redis
+
+logger = get_logger(__name__)
+
+RETRY_INTERVAL = 1
+
+
+@dataclass
+class Notice:
+    """Published event, encoded just once for all the subscribers."""
+
+    event: str
+    payload: dict[str, T.Any]
+
+    @cached_property
+    def data(self) -> str:
+        """Encode the payload.
+
+        Returns:
+            str: JSON payload.
+        """
+        return json.dumps(self.payload)
+
+    @cached_property
+    def sse(self) -> bytes:
+        """Encode the event as a server-sent event.
+
+        Returns:
+            bytes: event stream frame.
+        """
+        return f"event: {self.event}\ndata: {self.data}\n\n".encode()
+
+    @cached_property
+    def message(self) -> str:
+        """Encode the event as a websocket message.
+
+        Returns:
+            str: JSON message with the event type and its payload.
+        """
+        return json.dumps({"event": self.event, "data": self.payload})
+
+
+class Subscriber:
+    """Bounded queue of the notices for a single client of a feed.
+
+    Used as an async context manager, it is subscribed to the feed
+    for the duration of the block.
+    """
+
+    def __init__(self, feed: "EventFeed", size: int) -> None:
+        self.feed = feed
+        self.notices: asyncio.Queue[Notice | None] = asyncio.Queue(size)
+
+    async def __aenter__(self) -> "Subscriber":
+        """Join the feed.
+
+        Returns:
+            Subscriber: subscribed client.
+        """
+        self.feed.join(self)
+        return self
+
+    async def __aexit__(self, *exc_info: T.Any) -> None:
+        """Leave the feed.
+
+        Args:
+            exc_info (Any): exception raised within the block, if any.
+        """
+        self.feed.leave(self)
+
+    def push(self, notice: Notice) -> bool:
+        """Queue a notice, unless the client is already too far behind.
+
+        Args:
+            notice (Notice): published event.
+
+        Returns:
+            bool: whether the notice was queued.
+        """
+        try:
+            self.notices.put_nowait(notice)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def close(self) -> None:
+        """Throw away the queued notices and tell the client it is done."""
+        while not self.notices.empty():
+            self.notices.get_nowait()
+        self.notices.put_nowait(None)
+
+    async def receive(self) -> Notice | None:
+        """Wait for the next notice.
+
+        Returns:
+            Notice | None: published event, None once dropped.
+        """
+        return await self.notices.get()
+
+
+class Fanout:
+    """Clients of a feed, each one getting every notice.
+
+    A client falling behind by a whole queue is dropped instead of holding
+    the rest back or being buffered without limits, and is expected
+    to catch up on its own.
+    """
+
+    def __init__(self) -> None:
+        self.subscribers: set[Subscriber] = set()
+
+    def leave(self, subscriber: Subscriber) -> None:
+        """Remove a client.
+
+        Args:
+            subscriber (Subscriber): client of the feed.
+        """
+        self.subscribers.discard(subscriber)
+
+    def drop(self, subscriber: Subscriber) -> None:
+        """Remove a client and tell it that it was dropped.
+
+        Args:
+            subscriber (Subscriber): client of the feed.
+        """
+        self.leave(subscriber)
+        subscriber.close()
+
+    def drop_all(self) -> None:
+        """Remove all the clients and tell them that they were dropped."""
+        for subscriber in list(self.subscribers):
+            self.drop(subscriber)
+
+    def publish(self, notice: Notice) -> None:
+        """Queue a notice for every client, dropping the slow ones.
+
+        Args:
+            notice (Notice): published event.
+        """
+        for subscriber in list(self.subscribers):
+            if not subscriber.push(notice):
+                logger.warning(
+                    "Dropping a slow subscriber",
+                    channel=notice.event,
+                )
+                self.drop(subscriber)
+
+
+class EventFeed(Fanout):
+    """Single redis subscription of a worker shared by all of its clients.
+
+    Idle clients only wait on their queues, the subscription is made
+    with the first client to join.
+    """
+
+    def __init__(self, channels: T.Iterable[str]) -> None:
+        super().__init__()
+        self.channels = tuple(channels)
+        self.listener: asyncio.Task | None = None
+
+    def subscribe(self, size: int) -> Subscriber:
+        """Create a client of the feed.
+
+        Args:
+            size (int): number of notices the client can fall behind by.
+
+        Returns:
+            Subscriber: client, to be used as an async context manager.
+        """
+        return Subscriber(self, size)
+
+    def join(self, subscriber: Subscriber) -> None:
+        """Add a client, subscribing to redis with the first one.
+
+        Args:
+            subscriber (Subscriber): client of the feed.
+        """
+        if self.listener is None:
+            self.listener = asyncio.create_task(self.listen())
+        self.subscribers.add(subscriber)
+
+    async def listen(self) -> None:
+        """Keep fanning the events out, resubscribing on errors.
+
+        Everyone is dropped after losing the subscription,
+        as some of the events could have been missed in the meantime.
+        """
+        while True:  # noqa: WPS457
+            deliveries = subscribe_with_redis(self.channels)
+            try:
+                async for channel, payload in deliveries:
+                    self.publish(Notice(channel, payload))
+            except (
+                redis.exceptions.ConnectionError,
+                redis.exceptions.TimeoutError,
+            ) as exc:
+                logger.error("Could not connect to redis", exc=exc)
+            except Exception as exc:
+                logger.exception("Could not fan out events", exc=exc)
+            self.drop_all()
+            await asyncio.sleep(RETRY_INTERVAL)
+
+    async def stop(self) -> None:
+        """Stop the subscription and drop everyone."""
+        if self.listener is not None:
+            self.listener.cancel()
+            await asyncio.gather(self.listener, return_exceptions=True)
+            self.listener = None
+        self.drop_all()
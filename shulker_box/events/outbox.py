@@ -0,0 +1,106 @@
+"""Transactional outbox for events."""
+
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from beanie.odm.operators.find.comparison import In
+from beanie.odm.operators.update.general import Set
+from structlog import get_logger
+
+from shulker_box.database.models import OutboxEvent
+from shulker_box.events.publisher import (
+    encode_event,
+    publish_messages_with_redis,
+)
+
+if TYPE_CHECKING:
+    from shulker_box.domain.events.event_types import Event
+
+logger = get_logger(__name__)
+
+MILLISECONDS = 1000
+
+
+async def store_in_outbox(events: list["Event"]) -> None:
+    """Store encoded events in the outbox with a single write.
+
+    Args:
+        events (list[Event]): event objects.
+    """
+    await OutboxEvent.insert_many(
+        [
+            OutboxEvent(channel=channel, payload=payload)
+            for channel, payload in map(encode_event, events)
+        ],
+    )
+
+
+class OutboxRelay:
+    """Background task streaming pending outbox entries to redis.
+
+    Entries are sent in batches, oldest first, and marked as sent only
+    after redis accepted them, so delivery is at least once and
+    an outage is replayed in the original order.
+    """
+
+    def __init__(self, batch_size: int, poll_interval: int) -> None:
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval / MILLISECONDS
+        self.task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background relay task."""
+        logger.info("Starting outbox relay", batch_size=self.batch_size)
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the background relay task."""
+        if self.task is None:
+            return
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+        self.task = None
+        logger.info("Stopped outbox relay")
+
+    async def run(self) -> None:
+        """Keep relaying, sleeping whenever the outbox is drained.
+
+        Failed batches stay pending in the outbox and are retried
+        after the poll interval, so errors never end the relay.
+        """
+        while True:  # noqa: WPS457
+            try:
+                relayed = await self.relay()
+            except Exception as exc:
+                logger.exception("Could not relay outbox events", exc=exc)
+                relayed = 0
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def relay(self) -> int:
+        """Send the oldest batch of pending entries to redis.
+
+        Returns:
+            int: number of relayed entries.
+        """
+        pending = OutboxEvent.find({OutboxEvent.sent: False})
+        entries = await pending.sort("_id").limit(self.batch_size).to_list()
+        if not entries:
+            return 0
+        messages = [(entry.channel, entry.payload) for entry in entries]
+        if not await publish_messages_with_redis(messages):
+            return 0
+        relayed = OutboxEvent.find(
+            In(OutboxEvent.id, [entry.id for entry in entries]),
+        )
+        await relayed.update(
+            Set(
+                {
+                    OutboxEvent.sent: True,
+                    OutboxEvent.sent_at: datetime.utcnow(),
+                },
+            ),
+        )
+        logger.debug("Relayed outbox events", events=len(entries))
+        return len(entries)
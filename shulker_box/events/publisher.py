@@ -1,12 +1,14 @@
 """Event publisher handlers."""
 
-import json
-from dataclasses import asdict
+import typing as T
 from typing import TYPE_CHECKING
 
 import redis
 import structlog
+from redis import asyncio as aioredis
 
+from shulker_box.database.client import RedisClient
+from shulker_box.events.encoding import DATA, Payload, encode_payload
 from shulker_box.settings import settings
 
 if TYPE_CHECKING:
@@ -14,19 +16,102 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
-client = redis.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT)
+STREAM = "stream"
 
+Message = tuple[str, Payload]
 
-def publish_with_redis(event: "Event") -> None:
+
+def encode_event(event: "Event") -> Message:
+    """Encode an event into a redis message.
+
+    Args:
+        event (Event): event object with type which is the channel name.
+
+    Returns:
+        Message: channel name and the encoded payload.
+    """
+    return event.event_type.value, encode_payload(event.to_payload())
+
+
+def send_message(client: aioredis.Redis, message: Message) -> T.Any:
+    """Send a message with the configured transport.
+
+    Messages are either published to a channel or appended to a stream
+    of the same name. Streams are capped at about the configured length,
+    which lets redis trim them cheaply.
+
+    Args:
+        client (Redis): redis client or pipeline.
+        message (Message): channel name and the encoded payload.
+
+    Returns:
+        Any: awaitable reply, or the pipeline the command was queued in.
+    """
+    channel, payload = message
+    if settings.EVENTS_TRANSPORT == STREAM:
+        return client.xadd(
+            channel,
+            {DATA: payload},
+            maxlen=settings.EVENTS_STREAM_MAX_LENGTH,
+            approximate=True,
+        )
+    return client.publish(channel, payload)
+
+
+async def publish_with_redis(event: "Event") -> None:
     """Publish an event to redis.
 
+    Uses the shared asynchronous client, so a slow redis
+    only holds the awaiting request and not the whole event loop.
+
     Args:
         event (Event): event object with type which is the channel name.
     """
     try:
-        client.publish(
-            event.event_type.value,
-            json.dumps(asdict(event), default=str),
-        )
-    except redis.exceptions.ConnectionError as exc:
+        await send_message(RedisClient.get(), encode_event(event))
+    except (
+        redis.exceptions.ConnectionError,
+        redis.exceptions.TimeoutError,
+    ) as exc:
         logger.error("Could not connect to redis", exc=exc)
+
+
+async def publish_many_with_redis(events: list["Event"]) -> bool:
+    """Publish a batch of events to redis in a single pipeline.
+
+    Args:
+        events (list[Event]): event objects with types which are the channels.
+
+    Returns:
+        bool: whether the events were published.
+    """
+    return await publish_messages_with_redis(
+        [encode_event(event) for event in events],
+    )
+
+
+async def publish_messages_with_redis(messages: list[Message]) -> bool:
+    """Publish already encoded messages to redis in a single pipeline.
+
+    Args:
+        messages (list[Message]): channel names with encoded payloads.
+
+    Returns:
+        bool: whether the messages were published.
+    """
+    try:
+        async with RedisClient.get().pipeline(transaction=False) as pipeline:
+            for message in messages:
+                send_message(pipeline, message)
+            await pipeline.execute()
+    except (
+        redis.exceptions.ConnectionError,
+        redis.exceptions.TimeoutError,
+    ) as exc:
+        logger.error(
+            "Could not connect to redis",
+            exc=exc,
+            messages=len(messages),
+        )
+        return False
+    return True
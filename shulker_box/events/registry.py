@@ -0,0 +1,53 @@
+"""Registration of the event classes."""
+
+from dataclasses import dataclass
+from functools import partialmethod
+from typing import TYPE_CHECKING, Callable
+
+from structlog import get_logger
+
+from shulker_box.events.encoders import compile_encoder
+
+if TYPE_CHECKING:
+    from shulker_box.domain.events.event_types import Event
+    from shulker_box.events.event_types import EventType
+
+logger = get_logger(__name__)
+
+
+class EventRegistry:
+    """Holder of the registered event classes by their types."""
+
+    events: dict[str, type["Event"]] = {}
+
+
+def eventclass(event_type: "EventType") -> Callable:
+    """Register an event class and return it as a dataclass.
+
+    Connector between the event type and the event class (dataclass).
+    The payload encoder of the class is generated once, at registration.
+
+    Args:
+        event_type (EventType): event type - channel name.
+
+    Returns:
+        Callable: a decorator.
+    """
+    logger.info("Registering event class", event_type=event_type)
+
+    def wrapper(cls) -> type:
+        """Register the event class and create the dataclass.
+
+        Args:
+            cls (type): event class.
+
+        Returns:
+            type: the dataclass.
+        """
+        EventRegistry.events[event_type.value] = cls
+        cls.event_type = event_type
+        event_class = dataclass(cls)
+        event_class.to_payload = partialmethod(compile_encoder(event_class))
+        return event_class
+
+    return wrapper
@@ -0,0 +1,205 @@
+"""Destinations of published events."""
+
+import asyncio
+import bisect
+import itertools
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Sequence
+
+from structlog import get_logger
+
+from shulker_box.settings import settings
+
+if TYPE_CHECKING:
+    from shulker_box.domain.events.event_types import Event
+
+logger = get_logger(__name__)
+
+MILLISECONDS = 1000
+LATENCY_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+OVERFLOW = "+Inf"
+
+Send = Callable[[Sequence["Event"]], Awaitable[None]]
+
+
+class LatencyHistogram:
+    """Counts of latencies falling into fixed buckets.
+
+    Latencies are measured in milliseconds, the last bucket counts
+    the ones above the largest bound.
+    """
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0 for _ in range(len(bounds) + 1)]
+        self.count = 0
+        self.total: float = 0
+
+    @property
+    def average(self) -> float:
+        """Average latency in milliseconds.
+
+        Returns:
+            float: average latency.
+        """
+        if not self.count:
+            return 0
+        return self.total / self.count
+
+    def record(self, latency: float) -> None:
+        """Record a measured latency.
+
+        Args:
+            latency (float): latency in milliseconds.
+        """
+        self.counts[bisect.bisect_left(self.bounds, latency)] += 1
+        self.count += 1
+        self.total += latency
+
+    def cumulative(self) -> dict[str, int]:
+        """Count the latencies up to each bound, like prometheus does.
+
+        Returns:
+            dict[str, int]: counts by the upper bounds of the buckets.
+        """
+        labels = [*map(str, self.bounds), OVERFLOW]
+        return dict(zip(labels, itertools.accumulate(self.counts)))
+
+
+class SinkStats:
+    """Counters describing how events are delivered to a sink."""
+
+    def __init__(self) -> None:
+        self.deliveries = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.latency = LatencyHistogram()
+
+    def record(self, latency: float) -> None:
+        """Record a finished delivery.
+
+        Args:
+            latency (float): delivery duration in milliseconds.
+        """
+        self.deliveries += 1
+        self.latency.record(latency)
+
+
+class EventSink:
+    """Destination events are sent to once they are handled.
+
+    Failures and timeouts are logged and counted, they never reach
+    the publisher or the other sinks. Critical sinks are awaited
+    by the publisher, the rest are delivered in the background.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        send: Send,
+        critical: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        self.name = name
+        self.send = send
+        self.critical = critical
+        self.timeout = timeout
+        self.stats = SinkStats()
+
+    async def deliver(self, events: Sequence["Event"]) -> None:
+        """Send events to the sink within its timeout.
+
+        Args:
+            events (Sequence[Event]): event objects.
+        """
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.send(events), self.timeout)
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+            logger.warning("Event sink timed out", sink=self.name)
+        except Exception as exc:
+            self.stats.failures += 1
+            logger.exception("Event sink failed", sink=self.name, exc=exc)
+        self.stats.record((time.perf_counter() - started) * MILLISECONDS)
+
+
+class Dispatcher:
+    """Sinks subscribed to the published events.
+
+    Only the critical sinks hold the publisher back, the deliveries
+    to the others are kept track of until they finish.
+    """
+
+    sinks: list[EventSink] = []
+    deliveries: set[asyncio.Task] = set()
+
+    @classmethod
+    def subscribe(
+        cls,
+        name: str,
+        send: Send,
+        critical: bool = False,
+        timeout: float | None = settings.EVENTS_SINK_TIMEOUT,
+    ) -> EventSink:
+        """Subscribe a sink to the published events.
+
+        Args:
+            name (str): sink name used in logs and metrics.
+            send (Send): coroutine function taking a batch of events.
+            critical (bool): whether publishers wait for the sink.
+            timeout (float | None): delivery timeout in seconds.
+
+        Returns:
+            EventSink: the subscribed sink.
+        """
+        sink = EventSink(name, send, critical=critical, timeout=timeout)
+        cls.sinks.append(sink)
+        return sink
+
+    @classmethod
+    def unsubscribe(cls, sink: EventSink) -> None:
+        """Stop sending events to a sink.
+
+        Args:
+            sink (EventSink): subscribed sink.
+        """
+        cls.sinks.remove(sink)
+
+    @classmethod
+    async def dispatch(cls, events: Sequence["Event"]) -> None:
+        """Send events to all the sinks at the same time.
+
+        Only the critical sinks are awaited, the others keep running
+        in the background until they finish or the bus is stopped.
+        A lone critical sink is awaited without wrapping it in a task.
+
+        Args:
+            events (Sequence[Event]): handled event objects.
+        """
+        critical = []
+        for sink in cls.sinks:
+            if sink.critical:
+                critical.append(sink.deliver(events))
+                continue
+            task = asyncio.create_task(sink.deliver(events))
+            cls.deliveries.add(task)
+            task.add_done_callback(cls.deliveries.discard)
+        if len(critical) == 1:
+            await critical[0]
+        else:
+            await asyncio.gather(*critical)
+
+
+async def log_events(events: Sequence["Event"]) -> None:
+    """Write events to the audit log.
+
+    Args:
+        events (Sequence[Event]): event objects.
+    """
+    for event in events:
+        logger.info(
+            "Audit event",
+            event_type=event.event_type.value,
+            payload=event.to_payload(),
+        )
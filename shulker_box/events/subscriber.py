@@ -0,0 +1,175 @@
+"""Event subscriber handlers."""
+
+import typing as T
+
+from redis import asyncio as aioredis
+from structlog import get_logger
+
+from shulker_box.database.client import RedisClient
+from shulker_box.events.encoding import DATA, decode_payload
+from shulker_box.events.publisher import STREAM
+from shulker_box.settings import settings
+
+logger = get_logger(__name__)
+
+POLL_TIMEOUT = 1.0
+FIRST_MESSAGE = b"0-0"
+STREAM_BLOCK = int(settings.REDIS_TIMEOUT * 1000 / 2)
+
+Delivery = tuple[str, dict[str, T.Any]]
+StreamMessage = tuple[bytes, dict[bytes, T.Any]]
+
+
+async def subscribe_with_redis(
+    channels: T.Iterable[str],
+) -> T.AsyncIterator[Delivery]:
+    """Subscribe to redis channels and decode the published events.
+
+    The subscription follows the configured transport, either the
+    pubsub channels or the streams of the same names.
+
+    Args:
+        channels (Iterable[str]): channel names.
+
+    Yields:
+        Delivery: channel name and the decoded payload.
+    """
+    if settings.EVENTS_TRANSPORT == STREAM:
+        deliveries = read_streams(channels)
+    else:
+        deliveries = read_channels(channels)
+    async for delivery in deliveries:
+        yield delivery
+
+
+async def read_channels(
+    channels: T.Iterable[str],
+) -> T.AsyncIterator[Delivery]:
+    """Listen to redis pubsub channels.
+
+    The subscription holds one connection of the shared pool
+    until the iteration is over.
+
+    Args:
+        channels (Iterable[str]): channel names.
+
+    Yields:
+        Delivery: channel name and the decoded payload.
+    """
+    async with RedisClient.get().pubsub() as pubsub:
+        await pubsub.subscribe(*channels)
+        while True:  # noqa: WPS457
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=POLL_TIMEOUT,
+            )
+            if message is None:
+                continue
+            delivery = decode(message["channel"].decode(), message["data"])
+            if delivery is not None:
+                yield delivery
+
+
+async def read_streams(
+    channels: T.Iterable[str],
+) -> T.AsyncIterator[Delivery]:
+    """Follow redis streams from their current ends.
+
+    Streams are read without a consumer group, so every subscriber sees
+    every message appended after it started. Reads block for less than
+    the socket timeout of the shared client.
+
+    Args:
+        channels (Iterable[str]): stream names.
+
+    Yields:
+        Delivery: stream name and the decoded payload.
+    """
+    client = RedisClient.get()
+    positions = await stream_ends(client, channels)
+    while True:  # noqa: WPS457
+        for delivery in await read_stream_batch(client, positions):
+            yield delivery
+
+
+async def read_stream_batch(
+    client: aioredis.Redis,
+    positions: dict[str, bytes],
+) -> list[Delivery]:
+    """Read the next messages of redis streams and move past them.
+
+    Args:
+        client (Redis): redis client.
+        positions (dict[str, bytes]): ids of the last messages read.
+
+    Returns:
+        list[Delivery]: stream names and the decoded payloads.
+    """
+    response = await client.xread(positions, block=STREAM_BLOCK)
+    deliveries: list[Delivery] = []
+    for stream, messages in response:
+        channel = stream.decode()
+        positions[channel] = messages[-1][0]
+        deliveries.extend(decode_stream(channel, messages))
+    return deliveries
+
+
+def decode_stream(
+    channel: str,
+    messages: list[StreamMessage],
+) -> list[Delivery]:
+    """Decode the messages read from a redis stream.
+
+    Args:
+        channel (str): stream name.
+        messages (list[StreamMessage]): message ids and fields.
+
+    Returns:
+        list[Delivery]: stream name and the decoded payloads.
+    """
+    deliveries = (decode(channel, fields.get(DATA)) for _, fields in messages)
+    return [delivery for delivery in deliveries if delivery is not None]
+
+
+def decode(channel: str, data: T.Any) -> Delivery | None:
+    """Decode a message, skipping it when it is broken.
+
+    Args:
+        channel (str): channel or stream name.
+        data (Any): encoded payload.
+
+    Returns:
+        Delivery | None: channel name and the decoded payload, if valid.
+    """
+    try:
+        payload = decode_payload(data)
+    except (TypeError, ValueError) as exc:
+        logger.error("Could not decode event", channel=channel, exc=exc)
+        return None
+    if not isinstance(payload, dict):
+        logger.error("Could not decode event", channel=channel)
+        return None
+    return channel, payload
+
+
+async def stream_ends(
+    client: aioredis.Redis,
+    channels: T.Iterable[str],
+) -> dict[str, bytes]:
+    """Find the ids of the last messages in redis streams.
+
+    Args:
+        client (Redis): redis client.
+        channels (Iterable[str]): stream names.
+
+    Returns:
+        dict[str, bytes]: last message ids, the first possible id
+            of the streams that are empty or missing.
+    """
+    names = list(channels)
+    async with client.pipeline(transaction=False) as pipeline:
+        for name in names:
+            pipeline.xrevrange(name, count=1)
+        replies = await pipeline.execute()
+    ends = [reply[0][0] if reply else FIRST_MESSAGE for reply in replies]
+    return dict(zip(names, ends))
@@ -5,6 +5,8 @@ from starlette import status
 
 from shulker_box.domain import exceptions
 
+DETAIL = "detail"
+
 
 async def does_not_exist_handler(
     request: Request,
@@ -21,7 +23,7 @@ async def does_not_exist_handler(
     """
     return responses.JSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
-        content={"detail": f"Object does not exist - {exc.id}"},
+        content={DETAIL: f"Object does not exist - {exc.id}"},
     )
 
 
@@ -40,7 +42,64 @@ async def already_exists_handler(
     """
     return responses.JSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
-        content={"detail": f"Object already exists - {exc.id}"},
+        content={DETAIL: f"Object already exists - {exc.id}"},
+    )
+
+
+async def version_mismatch_handler(
+    request: Request,
+    exc: exceptions.VersionMismatchError,
+) -> responses.JSONResponse:
+    """Handle VersionMismatchError.
+
+    Args:
+        request (Request): request object.
+        exc (VersionMismatchError): exception object.
+
+    Returns:
+        JSONResponse: response object.
+    """
+    return responses.JSONResponse(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        content={DETAIL: f"Object was changed - {exc.id}"},
+    )
+
+
+async def invalid_cursor_handler(
+    request: Request,
+    exc: exceptions.InvalidCursorError,
+) -> responses.JSONResponse:
+    """Handle InvalidCursorError.
+
+    Args:
+        request (Request): request object.
+        exc (InvalidCursorError): exception object.
+
+    Returns:
+        JSONResponse: response object.
+    """
+    return responses.JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={DETAIL: f"Invalid cursor - {exc.cursor}"},
+    )
+
+
+async def expired_token_handler(
+    request: Request,
+    exc: exceptions.ExpiredTokenError,
+) -> responses.JSONResponse:
+    """Handle ExpiredTokenError.
+
+    Args:
+        request (Request): request object.
+        exc (ExpiredTokenError): exception object.
+
+    Returns:
+        JSONResponse: response object.
+    """
+    return responses.JSONResponse(
+        status_code=status.HTTP_410_GONE,
+        content={DETAIL: f"Expired token - {exc.token}"},
     )
 
 
@@ -48,5 +107,8 @@ EXCEPTION_HANDLERS = frozenset(
     {
         exceptions.DoesNotExistError: does_not_exist_handler,
         exceptions.AlreadyExistsError: already_exists_handler,
+        exceptions.VersionMismatchError: version_mismatch_handler,
+        exceptions.InvalidCursorError: invalid_cursor_handler,
+        exceptions.ExpiredTokenError: expired_token_handler,
     }.items(),
 )
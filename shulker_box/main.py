@@ -5,7 +5,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from structlog import get_logger
 
 from shulker_box.api import router
-from shulker_box.database.client import init_database
+from shulker_box.database.client import close_redis, init_database, init_redis
+from shulker_box.domain.events import incoming  # noqa: F401
+from shulker_box.domain.items.cache import ItemCache
+from shulker_box.domain.items.feed import item_feed
+from shulker_box.events.bus import EventBus
 from shulker_box.handlers import EXCEPTION_HANDLERS
 from shulker_box.settings import settings
 
@@ -24,7 +28,13 @@ def create_application() -> FastAPI:
         version=settings.VERSION,
         description=settings.DESCRIPTION,
         docs_url="/api/docs",
-        on_startup=[init_database],
+        on_startup=[init_database, init_redis, EventBus.start, ItemCache.start],
+        on_shutdown=[
+            ItemCache.stop,
+            item_feed.stop,
+            EventBus.stop,
+            close_redis,
+        ],
     )
     app.add_middleware(
         CORSMiddleware,
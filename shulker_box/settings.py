@@ -1,6 +1,7 @@
 """App settings."""
 
 from environs import Env
+from marshmallow.validate import OneOf
 from pydantic import BaseSettings
 
 env = Env()
@@ -18,9 +19,77 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = env.str("DATABASE_URL")
 
+    # Items
+    ITEMS_EXPORT_BATCH_SIZE: int = env.int(
+        "ITEMS_EXPORT_BATCH_SIZE",
+        default=1000,
+    )
+    ITEMS_BULK_CHUNK_SIZE: int = env.int("ITEMS_BULK_CHUNK_SIZE", default=1000)
+    ITEMS_CACHE: bool = env.bool("ITEMS_CACHE", default=False)
+    ITEMS_CACHE_SIZE: int = env.int("ITEMS_CACHE_SIZE", default=1000)
+    ITEMS_CACHE_TTL: int = env.int("ITEMS_CACHE_TTL", default=60)
+    ITEMS_CACHE_INVALIDATION: bool = env.bool(
+        "ITEMS_CACHE_INVALIDATION",
+        default=False,
+    )
+    ITEMS_LIST_CACHE: bool = env.bool("ITEMS_LIST_CACHE", default=False)
+    ITEMS_LIST_CACHE_TTL: int = env.int("ITEMS_LIST_CACHE_TTL", default=60)
+    ITEMS_FEED_QUEUE_SIZE: int = env.int("ITEMS_FEED_QUEUE_SIZE", default=100)
+    ITEMS_FEED_HEARTBEAT: float = env.float(
+        "ITEMS_FEED_HEARTBEAT",
+        default=15.0,  # noqa: WPS432
+    )
+    ITEMS_TOMBSTONE_RETENTION: int = env.int(
+        "ITEMS_TOMBSTONE_RETENTION",
+        default=60 * 60 * 24 * 7,
+    )
+    ITEMS_CHANGES_SETTLE_TIME: float = env.float(
+        "ITEMS_CHANGES_SETTLE_TIME",
+        default=1.0,
+    )
+
     # Redis
     REDIS_HOST: str = env.str("REDIS_HOST")
     REDIS_PORT: int = env.int("REDIS_PORT")
+    REDIS_MAX_CONNECTIONS: int = env.int("REDIS_MAX_CONNECTIONS", default=10)
+    REDIS_TIMEOUT: float = env.float("REDIS_TIMEOUT", default=1.0)
+    REDIS_POOL_TIMEOUT: int = env.int("REDIS_POOL_TIMEOUT", default=5)
+
+    # Events
+    EVENTS_BUFFERED: bool = env.bool("EVENTS_BUFFERED", default=False)
+    EVENTS_BATCH_SIZE: int = env.int("EVENTS_BATCH_SIZE", default=100)
+    EVENTS_FLUSH_INTERVAL: int = env.int("EVENTS_FLUSH_INTERVAL", default=100)
+    EVENTS_QUEUE_SIZE: int = env.int("EVENTS_QUEUE_SIZE", default=1000)
+    EVENTS_OUTBOX: bool = env.bool("EVENTS_OUTBOX", default=False)
+    EVENTS_OUTBOX_POLL_INTERVAL: int = env.int(
+        "EVENTS_OUTBOX_POLL_INTERVAL",
+        default=1000,
+    )
+    EVENTS_OUTBOX_RETENTION: int = env.int(
+        "EVENTS_OUTBOX_RETENTION",
+        default=60 * 60 * 24,
+    )
+    EVENTS_TRANSPORT: str = env.str(
+        "EVENTS_TRANSPORT",
+        default="pubsub",
+        validate=OneOf(["pubsub", "stream"]),
+    )
+    EVENTS_ENCODING: str = env.str(
+        "EVENTS_ENCODING",
+        default="json",
+        validate=OneOf(["json", "orjson", "msgpack"]),
+    )
+    EVENTS_STREAM_MAX_LENGTH: int = env.int(
+        "EVENTS_STREAM_MAX_LENGTH",
+        default=10000,  # noqa: WPS432
+    )
+    EVENTS_CONSUMER: bool = env.bool("EVENTS_CONSUMER", default=False)
+    EVENTS_CONSUMER_CONCURRENCY: int = env.int(
+        "EVENTS_CONSUMER_CONCURRENCY",
+        default=10,
+    )
+    EVENTS_AUDIT_LOG: bool = env.bool("EVENTS_AUDIT_LOG", default=False)
+    EVENTS_SINK_TIMEOUT: float = env.float("EVENTS_SINK_TIMEOUT", default=1.0)
 
 
 settings = Settings()
@@ -0,0 +1,49 @@
+"""Benchmark fixtures."""
+
+import pytest
+
+RESULTS = pytest.StashKey[list[str]]()
+
+
+class Report:
+    """Results of a benchmark, shown in the terminal summary."""
+
+    def __init__(self, request: pytest.FixtureRequest) -> None:
+        name = request.node.name
+        self.prefix = f"{name}: "
+        self.results = request.config.stash.setdefault(RESULTS, [])
+
+    def __call__(self, line: str) -> None:
+        """Report a line of results.
+
+        Args:
+            line (str): measured results.
+        """
+        self.results.append(self.prefix + line)
+
+
+@pytest.fixture
+def report(request: pytest.FixtureRequest) -> Report:
+    """Report the results of a benchmark in the terminal summary.
+
+    Args:
+        request (FixtureRequest): request of the benchmark.
+
+    Returns:
+        Report: callable reporting a line of results.
+    """
+    return Report(request)
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    """Show the reported results after the benchmarks.
+
+    Args:
+        terminalreporter (TerminalReporter): pytest terminal reporter.
+    """
+    results = terminalreporter.config.stash.get(RESULTS, [])
+    if not results:
+        return
+    terminalreporter.section("benchmarks")
+    for line in results:
+        terminalreporter.write_line(line)
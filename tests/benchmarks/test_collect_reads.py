@@ -0,0 +1,60 @@
+from unittest import mock
+
+import pytest
+from pydantic import main
+
+from shulker_box.api.v1.items.schemas import ItemCreateSchema
+from shulker_box.domain.items.repositories import ItemMongoRepository
+from shulker_box.domain.types import ItemCategory
+from tests.benchmarks.timing import ROUNDS, best_time_async, compare
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+ITEMS = 5000
+
+
+class DocumentRepository(ItemMongoRepository):
+    """Item storage reading through the ORM documents."""
+
+    raw_reads = False
+
+
+async def measure(repository: ItemMongoRepository) -> tuple[float, int]:
+    """Measure the best time of collecting all the items.
+
+    Validated models are counted on the side, every ORM document and
+    every output schema built through validation adds one.
+    """
+    with mock.patch.object(
+        main,
+        "validate_model",
+        wraps=main.validate_model,
+    ) as validate_model:
+        best = await best_time_async(repository.collect)
+    return best, validate_model.call_count // ROUNDS
+
+
+async def test_collect_reads(async_client, report):
+    """Compare collecting 5k items before and after, needs the database."""
+    categories = list(ItemCategory)
+    await ItemMongoRepository().create_many(
+        [
+            ItemCreateSchema(
+                name=f"Item {i}",
+                category=categories[i % len(categories)],
+            )
+            for i in range(ITEMS)
+        ],
+        chunk_size=ITEMS,
+    )
+    before, before_models = await measure(DocumentRepository())
+    after, after_models = await measure(ItemMongoRepository())
+
+    report(
+        f"{ITEMS} items: {compare(before, after)}, "
+        f"{before_models} -> {after_models} validated models",
+    )
+    assert await ItemMongoRepository().collect() == (
+        await DocumentRepository().collect()
+    )
+    assert after_models < before_models
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import uuid
+from dataclasses import dataclass
+from unittest import mock
+
+import pytest
+
+from shulker_box.database.client import RedisClient
+from shulker_box.domain.events.event_types import Event
+from shulker_box.events.consumer import EventConsumer
+from tests.benchmarks.timing import best_time_async
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+MESSAGES = 2000
+HANDLE_TIME = 0.001
+ROUND_TRIP = 0.0002
+
+
+@dataclass
+class ChestOpened(Event):
+    """Event waiting on I/O while handled, without being registered."""
+
+    id: uuid.UUID
+
+    async def handle(self) -> None:
+        """Wait like a call to another service."""
+        await asyncio.sleep(HANDLE_TIME)
+
+
+class FakeStreams:
+    """Redis serving a single stream, answering after a round trip."""
+
+    def __init__(self, messages: int) -> None:
+        payload = json.dumps({"id": str(uuid.uuid4())}).encode()
+        self.messages = [
+            (f"{index}-0".encode(), {b"data": payload})
+            for index in range(messages)
+        ]
+        self.acknowledged = 0
+        self.drained = asyncio.Event()
+
+    async def xreadgroup(self, group, name, streams, count, block):
+        """Pop a batch of messages, waiting forever once drained."""
+        await asyncio.sleep(ROUND_TRIP)
+        if not self.messages:
+            await asyncio.Event().wait()
+        batch, self.messages = self.messages[:count], self.messages[count:]
+        return [(b"chest-opened", batch)]
+
+    def pipeline(self, transaction):
+        """Start a pipeline acknowledging the messages."""
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Pipeline sent with a single round trip."""
+
+    def __init__(self, streams: FakeStreams) -> None:
+        self.streams = streams
+        self.acks = 0
+
+    async def __aenter__(self):
+        """Open the pipeline."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Close the pipeline."""
+
+    def xack(self, stream, group, *message_ids):
+        """Queue an acknowledgement."""
+        self.acks += len(message_ids)
+
+    async def execute(self):
+        """Send the acknowledgements."""
+        await asyncio.sleep(ROUND_TRIP)
+        self.streams.acknowledged += self.acks
+        if self.streams.acknowledged == MESSAGES:
+            self.streams.drained.set()
+
+
+async def consume(consumer: EventConsumer, streams: FakeStreams) -> None:
+    """Listen to the streams until all the messages are acknowledged."""
+    listener = asyncio.create_task(consumer.listen())
+    await streams.drained.wait()
+    listener.cancel()
+    await asyncio.gather(listener, return_exceptions=True)
+
+
+async def throughput(batch_size: int, concurrency: int) -> float:
+    """Measure how many events are consumed per second."""
+    streams = FakeStreams(MESSAGES)
+    consumer = EventConsumer(
+        events={"chest-opened": ChestOpened},
+        batch_size=batch_size,
+        concurrency=concurrency,
+    )
+    with mock.patch.object(RedisClient, "get", return_value=streams):
+        elapsed = await best_time_async(
+            lambda: consume(consumer, streams),
+            rounds=1,
+        )
+    assert streams.acknowledged == MESSAGES
+    return MESSAGES * 1000 / elapsed
+
+
+async def test_event_consumer_throughput(report):
+    """Compare consuming 2k events one by one and in concurrent batches."""
+    one_by_one = await throughput(batch_size=1, concurrency=1)
+    batched = await throughput(batch_size=100, concurrency=50)
+
+    report(
+        f"{MESSAGES} events: {one_by_one:.0f}/s one by one, "
+        f"{batched:.0f}/s in batches of 100 handled 50 at a time",
+    )
@@ -0,0 +1,68 @@
+import json
+import uuid
+from dataclasses import asdict
+from unittest import mock
+
+import pytest
+
+from shulker_box.domain.events.event_types import Event
+from shulker_box.domain.events.outgoing import ItemCreated, ItemDeleted
+from shulker_box.domain.types import ItemCategory
+from shulker_box.events.publisher import encode_event
+from shulker_box.settings import settings
+from tests.benchmarks.timing import best_time
+
+pytestmark = [pytest.mark.benchmark]
+
+EVENTS = 20000
+
+
+def make_created() -> list[Event]:
+    """Create a batch of item creation events."""
+    categories = list(ItemCategory)
+    return [
+        ItemCreated(
+            id=uuid.uuid4(),
+            name=f"Item {i}",
+            category=categories[i % len(categories)],
+            version=1,
+        )
+        for i in range(EVENTS)
+    ]
+
+
+def make_deleted() -> list[Event]:
+    """Create a batch of item deletion events."""
+    return [ItemDeleted(id=uuid.uuid4()) for _ in range(EVENTS)]
+
+
+def encode_with_asdict(event: Event) -> tuple[str, str]:
+    """Encode an event the way the publisher used to."""
+    return event.event_type.value, json.dumps(asdict(event), default=str)
+
+
+def encode_all(encode, events: list[Event]) -> list:
+    """Encode every event of the batch."""
+    return [encode(event) for event in events]
+
+
+def throughput(encode, events: list[Event]) -> float:
+    """Measure the best encoding throughput in events per second."""
+    return len(events) * 1000 / best_time(lambda: encode_all(encode, events))
+
+
+@pytest.mark.parametrize("make_events", [make_created, make_deleted])
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgpack"])
+def test_event_encoding(make_events, backend: str, report):
+    """Compare encoding 20k item events before and after."""
+    if backend == "msgpack":
+        pytest.importorskip("msgpack")
+    events = make_events()
+    before = throughput(encode_with_asdict, events)
+    with mock.patch.object(settings, "EVENTS_ENCODING", backend):
+        after = throughput(encode_event, events)
+
+    report(
+        f"{EVENTS} {type(events[0]).__name__} with {backend}: "
+        f"{before:.0f}/s -> {after:.0f}/s ({after / before:.1f}x)",
+    )
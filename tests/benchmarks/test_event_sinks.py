@@ -0,0 +1,61 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from shulker_box.domain.events.event_types import Event
+from shulker_box.events import bus as bus_module
+from shulker_box.events.bus import EventBus, eventclass
+from tests.benchmarks.timing import best_time_async, compare
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+EVENTS = 50
+SINK_LATENCY = 0.005
+
+
+@eventclass(mock.MagicMock(value="enderman-teleported"))
+class EndermanTeleported(Event):
+    distance: int
+
+    async def handle(self) -> None:
+        ...
+
+
+async def slow_sink(events) -> None:
+    """Take a while to store the events, like a remote audit log."""
+    await asyncio.sleep(SINK_LATENCY)
+
+
+async def publish_in_sequence(event: Event) -> None:
+    """Publish an event awaiting every sink one after another."""
+    await event.handle()
+    for sink in EventBus.sinks:
+        await sink.deliver([event])
+
+
+async def publish_all(publish) -> None:
+    """Publish a run of events."""
+    for distance in range(EVENTS):
+        await publish(EndermanTeleported(distance=distance))
+
+
+async def publishing_time(publish) -> float:
+    """Measure the time publishers wait for a run of events in ms."""
+    return await best_time_async(lambda: publish_all(publish), rounds=1)
+
+
+@mock.patch.object(bus_module, "publish_with_redis", new=slow_sink)
+async def test_event_sinks(report):
+    """Compare publishing with two slow sinks in sequence and fanned out."""
+    sinks = [
+        EventBus.subscribe("audit-log", slow_sink),
+        EventBus.subscribe("local", slow_sink),
+    ]
+    before = await publishing_time(publish_in_sequence)
+    after = await publishing_time(EventBus.publish)
+    await EventBus.stop()
+    for sink in sinks:
+        EventBus.unsubscribe(sink)
+
+    report(f"{EVENTS} events: {compare(before, after)}")
@@ -0,0 +1,69 @@
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+
+from shulker_box.api.streaming import sse
+from shulker_box.events import feed as feed_module
+from shulker_box.events.feed import EventFeed, Notice
+from tests.benchmarks.timing import best_time_async
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+CLIENTS = 5000
+IDLE_TIME = 0.5
+HEARTBEAT = 15
+
+
+async def idle_subscription(channels):
+    """Subscribe to channels where nothing happens."""
+    await asyncio.Event().wait()
+    yield  # noqa: WPS428
+
+
+async def read_first(frames) -> bytes:
+    """Wait for the first frame of a client."""
+    return await frames.__anext__()
+
+
+async def deliver(
+    event_feed: EventFeed,
+    notice: Notice,
+    clients: list[asyncio.Task],
+) -> list[bytes]:
+    """Publish a notice and wait until every client got it."""
+    event_feed.publish(notice)
+    return await asyncio.gather(*clients)
+
+
+@mock.patch.object(feed_module, "subscribe_with_redis", idle_subscription)
+async def test_feed_fanout(report):
+    """Measure the CPU time of 5k idle clients and of a single event."""
+    event_feed = EventFeed(["item-deleted"])
+    clients = [
+        asyncio.create_task(
+            read_first(sse(event_feed.subscribe(1), HEARTBEAT)),
+        )
+        for _ in range(CLIENTS)
+    ]
+    await asyncio.sleep(0)
+
+    idle = await best_time_async(
+        lambda: asyncio.sleep(IDLE_TIME),
+        rounds=1,
+        clock=time.process_time,
+    )
+    notice = Notice("item-deleted", {"id": "1"})
+    fanout = await best_time_async(
+        lambda: deliver(event_feed, notice, clients),
+        rounds=1,
+        clock=time.process_time,
+    )
+    await event_feed.stop()
+
+    report(
+        f"{CLIENTS} clients: {idle:.1f} ms CPU idle for {IDLE_TIME} s, "
+        f"{fanout:.1f} ms CPU to deliver an event",
+    )
+    assert all(client.result() == notice.sse for client in clients)
@@ -0,0 +1,65 @@
+import json
+import time
+import uuid
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from shulker_box.api.responses import SchemaResponse
+from shulker_box.api.v1.items.schemas import ItemOutSchema
+from shulker_box.domain.types import ItemCategory
+from tests.benchmarks.timing import best_time_async, compare
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+ITEMS = 10000
+
+
+def make_items() -> list[ItemOutSchema]:
+    """Create a page of items the way the repository does."""
+    categories = list(ItemCategory)
+    return [
+        ItemOutSchema(
+            id=uuid.uuid4(),
+            name=f"Item {i}",
+            category=categories[i % len(categories)],
+        )
+        for i in range(ITEMS)
+    ]
+
+
+async def encode_with_response_model(items: list[ItemOutSchema]) -> bytes:
+    """Encode the items like FastAPI does for a declared response model."""
+    field = create_response_field(
+        name="Response_get_items",
+        type_=list[ItemOutSchema],
+    )
+    content = await serialize_response(field=field, response_content=items)
+    return JSONResponse(content).body
+
+
+async def encode_once(items: list[ItemOutSchema]) -> bytes:
+    """Encode the items with the schema response."""
+    return SchemaResponse(items).body
+
+
+async def cpu_time(encode, items: list[ItemOutSchema]) -> float:
+    """Measure the best CPU time of encoding the items in milliseconds."""
+    return await best_time_async(
+        lambda: encode(items),
+        clock=time.process_time,
+    )
+
+
+async def test_response_encoding(report):
+    """Compare encoding a list of 10k items before and after."""
+    items = make_items()
+    before = await cpu_time(encode_with_response_model, items)
+    after = await cpu_time(encode_once, items)
+
+    report(f"{ITEMS} items: {compare(before, after, unit='ms of CPU')}")
+    assert json.loads(await encode_with_response_model(items)) == json.loads(
+        await encode_once(items),
+    )
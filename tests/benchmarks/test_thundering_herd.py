@@ -0,0 +1,90 @@
+import asyncio
+import statistics
+import uuid
+
+import pytest
+
+from shulker_box.api.v1.items.filters import ItemPageFilters
+from shulker_box.api.v1.items.schemas import ItemOutSchema
+from shulker_box.domain.items.services import ItemService
+from shulker_box.domain.types import ItemCategory
+from tests.benchmarks.timing import best_time_async
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+CLIENTS = 500
+POOL_SIZE = 10
+QUERY_TIME = 0.005
+
+ITEM = ItemOutSchema(id=uuid.uuid4(), name="Torch", category=ItemCategory.BLOCK)
+
+
+class SlowRepository:
+    """Repository answering like a database with a small connection pool."""
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.pool = asyncio.Semaphore(POOL_SIZE)
+
+    async def query(self) -> None:
+        """Simulate a single query."""
+        self.queries += 1
+        async with self.pool:
+            await asyncio.sleep(QUERY_TIME)
+
+    async def get_by_id(self, entry_id: uuid.UUID) -> ItemOutSchema:
+        """Get the only item."""
+        await self.query()
+        return ITEM
+
+    async def collect(self, **filters) -> list[ItemOutSchema]:
+        """Collect the only item."""
+        await self.query()
+        return [ITEM]
+
+
+async def herd(call) -> tuple[float, float]:
+    """Run the call for all the clients at once and report p50 and p99."""
+    latencies = await asyncio.gather(
+        *(best_time_async(call, rounds=1) for _ in range(CLIENTS)),
+    )
+    percentiles = statistics.quantiles(latencies, n=100)
+    return percentiles[49], percentiles[98]
+
+
+@pytest.mark.parametrize("operation", ["get", "collect"])
+async def test_thundering_herd(operation: str, report):
+    """Compare a herd of identical reads with and without coalescing."""
+    repository = SlowRepository()
+    service = ItemService(repository)  # type: ignore
+    calls = {
+        "get": lambda: service.get(ITEM.id),
+        "collect": lambda: service.collect(
+            ItemPageFilters(
+                name=None,
+                name_prefix=None,
+                category=None,
+                limit=10,
+                cursor=None,
+                search=None,
+            ),
+        ),
+    }
+    direct = {
+        "get": lambda: repository.get_by_id(ITEM.id),
+        "collect": lambda: repository.collect(limit=11),
+    }
+
+    uncoalesced = await herd(direct[operation])
+    uncoalesced_queries = repository.queries
+    repository.queries = 0
+    coalesced = await herd(calls[operation])
+
+    report(
+        f"{CLIENTS} clients, "
+        f"queries {uncoalesced_queries} -> {repository.queries}, "
+        f"p50 {uncoalesced[0]:.1f} -> {coalesced[0]:.1f} ms, "
+        f"p99 {uncoalesced[1]:.1f} -> {coalesced[1]:.1f} ms",
+    )
+    assert uncoalesced_queries == CLIENTS
+    assert repository.queries == 1
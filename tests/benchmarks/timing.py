@@ -0,0 +1,71 @@
+"""Timing helpers shared by the benchmarks."""
+
+import time
+import typing as T
+
+ROUNDS = 3
+
+Clock = T.Callable[[], float]
+
+
+def best_time(
+    call: T.Callable[[], object],
+    rounds: int = ROUNDS,
+    clock: Clock = time.perf_counter,
+) -> float:
+    """Measure the best time of a call.
+
+    Args:
+        call (Callable): call to measure.
+        rounds (int): how many times to repeat the call.
+        clock (Clock): clock to measure with.
+
+    Returns:
+        float: shortest time of the call in milliseconds.
+    """
+    timings = []
+    for _ in range(rounds):
+        start = clock()
+        call()
+        timings.append((clock() - start) * 1000)
+    return min(timings)
+
+
+async def best_time_async(
+    call: T.Callable[[], T.Awaitable[object]],
+    rounds: int = ROUNDS,
+    clock: Clock = time.perf_counter,
+) -> float:
+    """Measure the best time of an awaited call.
+
+    Args:
+        call (Callable): call to measure.
+        rounds (int): how many times to repeat the call.
+        clock (Clock): clock to measure with.
+
+    Returns:
+        float: shortest time of the call in milliseconds.
+    """
+    timings = []
+    for _ in range(rounds):
+        start = clock()
+        await call()
+        timings.append((clock() - start) * 1000)
+    return min(timings)
+
+
+def compare(before: float, after: float, unit: str = "ms") -> str:
+    """Describe a measurement taken before and after a change.
+
+    Args:
+        before (float): measurement before.
+        after (float): measurement after.
+        unit (str): unit of the measurements.
+
+    Returns:
+        str: both measurements with the ratio between them.
+    """
+    ratio = max(before, after) / min(before, after)
+    old = f"{before:.1f} {unit}"
+    new = f"{after:.1f} {unit}"
+    return f"{old} -> {new} ({ratio:.1f}x)"
@@ -6,7 +6,7 @@ import pytest_asyncio
 from httpx import AsyncClient
 from motor import motor_asyncio
 
-from shulker_box.database.client import init_database
+from shulker_box.database.client import close_redis, init_database
 from shulker_box.main import app as base_app
 
 
@@ -31,3 +31,4 @@ async def async_client() -> T.AsyncGenerator:
         db_client = await init_database()
         yield client
         await clear_database(db_client)
+        await close_redis()
@@ -1,12 +1,17 @@
 """Items API E2E test cases."""
 
+import asyncio
+import json
 import uuid
+from unittest import mock
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from redis import asyncio as aioredis
 
 from shulker_box.domain.types import ItemCategory
+from shulker_box.settings import settings
 
 pytestmark = pytest.mark.asyncio
 
@@ -41,6 +46,32 @@ async def test_item_create_already_exists(async_client: AsyncClient):
     assert data["detail"] == f"Object already exists - {sword.json()['id']}"
 
 
+async def test_item_create_concurrently(async_client: AsyncClient):
+    """Test that exactly one of many parallel creates wins."""
+    responses = await asyncio.gather(
+        *(
+            async_client.post(
+                "/api/v1/items/",
+                json={"name": "Sword", "category": ItemCategory.WEAPON},
+            )
+            for _ in range(10)
+        ),
+    )
+    created = [
+        response.json()
+        for response in responses
+        if response.status_code == status.HTTP_201_CREATED
+    ]
+    rejected = [
+        response.json()["detail"]
+        for response in responses
+        if response.status_code == status.HTTP_400_BAD_REQUEST
+    ]
+
+    assert len(created) == 1
+    assert rejected == [f"Object already exists - {created[0]['id']}"] * 9
+
+
 async def test_item_list(async_client: AsyncClient):
     """Test listing all items."""
     for i in range(3):
@@ -55,6 +86,509 @@ async def test_item_list(async_client: AsyncClient):
     assert len(data) == 3
 
 
+async def test_item_list_pages(async_client: AsyncClient):
+    """Test listing items page by page with a cursor."""
+    for i in range(5):
+        await async_client.post(
+            "/api/v1/items/",
+            json={"name": f"Block {i}", "category": ItemCategory.BLOCK},
+        )
+    pages = []
+    params = {"limit": 2}
+    while True:
+        response = await async_client.get("/api/v1/items/", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+
+    ids = [item["id"] for page in pages for item in page]
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert len(set(ids)) == 5
+
+
+async def test_item_list_fields(async_client: AsyncClient):
+    """Test listing only the selected fields of items page by page."""
+    for i in range(3):
+        await async_client.post(
+            "/api/v1/items/",
+            json={"name": f"Block {i}", "category": ItemCategory.BLOCK},
+        )
+    response = await async_client.get(
+        "/api/v1/items/",
+        params={"fields": "name", "limit": 2},
+    )
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [set(item) for item in data] == [{"id", "name"}, {"id", "name"}]
+    assert "X-Next-Cursor" in response.headers
+
+
+async def test_item_list_unknown_fields(async_client: AsyncClient):
+    """Test listing items with fields they do not have."""
+    response = await async_client.get(
+        "/api/v1/items/",
+        params={"fields": "name,price"},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_item_list_name_prefix(async_client: AsyncClient):
+    """Test listing items by the beginning of their names, in any case."""
+    for name, category in (
+        ("Iron Sword", ItemCategory.WEAPON),
+        ("iron block", ItemCategory.BLOCK),
+        ("Iron Pickaxe", ItemCategory.TOOL),
+        ("Gold Sword", ItemCategory.WEAPON),
+    ):
+        await async_client.post(
+            "/api/v1/items/",
+            json={"name": name, "category": category},
+        )
+    matching = await async_client.get(
+        "/api/v1/items/",
+        params={"name_prefix": "IRON "},
+    )
+    filtered = await async_client.get(
+        "/api/v1/items/",
+        params={"name_prefix": "iron s", "category": ItemCategory.WEAPON},
+    )
+
+    assert matching.status_code == status.HTTP_200_OK
+    assert {item["name"] for item in matching.json()} == {
+        "Iron Sword",
+        "iron block",
+        "Iron Pickaxe",
+    }
+    assert [item["name"] for item in filtered.json()] == ["Iron Sword"]
+
+
+async def test_item_list_name_prefix_pages(async_client: AsyncClient):
+    """Test listing items matched by a prefix page by page, by their names."""
+    for name in ("Iron Sword", "iron block", "Iron Pickaxe", "Iron Axe"):
+        await async_client.post(
+            "/api/v1/items/",
+            json={"name": name, "category": ItemCategory.TOOL},
+        )
+    pages = []
+    params = {"name_prefix": "iron", "fields": "id", "limit": 3}
+    while True:
+        response = await async_client.get("/api/v1/items/", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+    full = await async_client.get(
+        "/api/v1/items/",
+        params={"name_prefix": "iron"},
+    )
+
+    assert [[set(item) for item in page] for page in pages] == [
+        [{"id", "version"}] * 3,
+        [{"id", "version"}],
+    ]
+    assert [item["id"] for page in pages for item in page] == [
+        item["id"] for item in full.json()
+    ]
+    assert [item["name"] for item in full.json()] == [
+        "Iron Axe",
+        "iron block",
+        "Iron Pickaxe",
+        "Iron Sword",
+    ]
+
+
+async def test_item_list_name_prefix_after_update(async_client: AsyncClient):
+    """Test that renamed items are matched by their new names."""
+    shovel = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Shovel", "category": ItemCategory.TOOL},
+    )
+    await async_client.patch(
+        f"/api/v1/items/{shovel.json()['id']}",
+        json={"name": "Spade"},
+    )
+    response = await async_client.get(
+        "/api/v1/items/",
+        params={"name_prefix": "spa"},
+    )
+
+    assert [item["name"] for item in response.json()] == ["Spade"]
+
+
+async def test_item_list_search(async_client: AsyncClient):
+    """Test searching items by words, the most relevant first, by pages."""
+    for name in ("Diamond Sword", "Diamond", "Iron Sword", "Diamond Block"):
+        await async_client.post(
+            "/api/v1/items/",
+            json={"name": name, "category": ItemCategory.WEAPON},
+        )
+    first = await async_client.get(
+        "/api/v1/items/",
+        params={"search": "diamond sword", "limit": 2},
+    )
+    second = await async_client.get(
+        "/api/v1/items/",
+        params={
+            "search": "diamond sword",
+            "limit": 2,
+            "cursor": first.headers["X-Next-Cursor"],
+        },
+    )
+    names = [item["name"] for item in first.json() + second.json()]
+
+    assert first.status_code == status.HTTP_200_OK
+    assert names[0] == "Diamond Sword"
+    assert sorted(names) == [
+        "Diamond",
+        "Diamond Block",
+        "Diamond Sword",
+        "Iron Sword",
+    ]
+    assert "X-Next-Cursor" not in second.headers
+
+
+async def test_item_list_filtered_pages(async_client: AsyncClient):
+    """Test that filters are kept across pages."""
+    for i in range(3):
+        await async_client.post(
+            "/api/v1/items/",
+            json={"name": f"Block {i}", "category": ItemCategory.BLOCK},
+        )
+        await async_client.post(
+            "/api/v1/items/",
+            json={"name": f"Sword {i}", "category": ItemCategory.WEAPON},
+        )
+    first = await async_client.get(
+        "/api/v1/items/",
+        params={"category": ItemCategory.WEAPON, "limit": 2},
+    )
+    second = await async_client.get(
+        "/api/v1/items/",
+        params={
+            "category": ItemCategory.WEAPON,
+            "limit": 2,
+            "cursor": first.headers["X-Next-Cursor"],
+        },
+    )
+    items = first.json() + second.json()
+
+    assert len(items) == 3
+    assert {item["category"] for item in items} == {ItemCategory.WEAPON}
+    assert "X-Next-Cursor" not in second.headers
+
+
+async def test_item_list_invalid_cursor(async_client: AsyncClient):
+    """Test listing items with a malformed cursor."""
+    response = await async_client.get(
+        "/api/v1/items/",
+        params={"cursor": "not-a-cursor"},
+    )
+    data = response.json()
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert data["detail"] == "Invalid cursor - not-a-cursor"
+
+
+async def test_item_list_not_blocked_by_publish(async_client: AsyncClient):
+    """Test that listing items is served while an event publish is stuck."""
+    released = asyncio.Event()
+
+    async def stuck_publish(*args, **kwargs) -> None:
+        await released.wait()
+
+    with mock.patch.object(aioredis.Redis, "publish", new=stuck_publish):
+        creating = asyncio.create_task(
+            async_client.post(
+                "/api/v1/items/",
+                json={"name": "Sword", "category": ItemCategory.WEAPON},
+            ),
+        )
+        response = await asyncio.wait_for(
+            async_client.get("/api/v1/items/"),
+            timeout=1,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not creating.done()
+
+        released.set()
+        created = await asyncio.wait_for(creating, timeout=1)
+
+    assert created.status_code == status.HTTP_201_CREATED
+
+
+async def test_item_export(async_client: AsyncClient):
+    """Test streaming all the items as newline delimited JSON."""
+    created = []
+    for i in range(3):
+        response = await async_client.post(
+            "/api/v1/items/",
+            json={"name": f"Block {i}", "category": ItemCategory.BLOCK},
+        )
+        created.append(response.json())
+    response = await async_client.get("/api/v1/items/export")
+    items = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert sorted(items, key=lambda item: item["name"]) == created
+
+
+async def test_item_export_filtered(async_client: AsyncClient):
+    """Test that the export respects the filters."""
+    await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Block", "category": ItemCategory.BLOCK},
+    )
+    sword = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    response = await async_client.get(
+        "/api/v1/items/export",
+        params={"category": ItemCategory.WEAPON},
+    )
+    items = [json.loads(line) for line in response.text.splitlines()]
+
+    assert items == [sword.json()]
+
+
+async def test_item_bulk_create(async_client: AsyncClient):
+    """Test creating many items from a JSON array."""
+    response = await async_client.post(
+        "/api/v1/items/bulk",
+        json=[
+            {"name": f"Block {i}", "category": ItemCategory.BLOCK}
+            for i in range(3)
+        ],
+    )
+    data = response.json()
+    listed = await async_client.get("/api/v1/items/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data["errors"] == []
+    assert [item["name"] for item in data["created"]] == [
+        "Block 0",
+        "Block 1",
+        "Block 2",
+    ]
+    assert len(listed.json()) == 3
+
+
+async def test_item_bulk_create_ndjson(async_client: AsyncClient):
+    """Test creating many items from newline delimited JSON."""
+    lines = [
+        json.dumps({"name": "Dirt", "category": ItemCategory.BLOCK}),
+        json.dumps({"name": "Bow", "category": ItemCategory.WEAPON}),
+    ]
+    response = await async_client.post(
+        "/api/v1/items/bulk",
+        content="\n".join(lines),
+        headers={"content-type": "application/x-ndjson"},
+    )
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["name"] for item in data["created"]] == ["Dirt", "Bow"]
+
+
+async def test_item_bulk_create_duplicates(async_client: AsyncClient):
+    """Test that duplicates are reported per item with the existing id."""
+    sword = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    with mock.patch.object(settings, "ITEMS_BULK_CHUNK_SIZE", 2):
+        response = await async_client.post(
+            "/api/v1/items/bulk",
+            json=[
+                {"name": "Sword", "category": ItemCategory.WEAPON},
+                {"name": "Dirt", "category": ItemCategory.BLOCK},
+                {"name": "Bow", "category": ItemCategory.WEAPON},
+                {"name": "Dirt", "category": ItemCategory.BLOCK},
+            ],
+        )
+    data = response.json()
+    created = {item["name"]: item["id"] for item in data["created"]}
+
+    assert response.status_code == status.HTTP_200_OK
+    assert list(created) == ["Dirt", "Bow"]
+    assert [(error["index"], error["id"]) for error in data["errors"]] == [
+        (0, sword.json()["id"]),
+        (3, created["Dirt"]),
+    ]
+
+
+async def test_item_bulk_create_publishes_once(async_client: AsyncClient):
+    """Test that the created items are published as a single batch."""
+    with mock.patch.object(
+        aioredis.client.Pipeline,
+        "execute",
+        new_callable=mock.AsyncMock,
+    ) as execute:
+        await async_client.post(
+            "/api/v1/items/bulk",
+            json=[
+                {"name": f"Block {i}", "category": ItemCategory.BLOCK}
+                for i in range(3)
+            ],
+        )
+
+    execute.assert_awaited_once()
+
+
+async def test_item_bulk_create_invalid(async_client: AsyncClient):
+    """Test that a malformed body is rejected."""
+    response = await async_client.post(
+        "/api/v1/items/bulk",
+        content="[{",
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_item_bulk_delete_by_ids(async_client: AsyncClient):
+    """Test deleting many items by their ids."""
+    created = await async_client.post(
+        "/api/v1/items/bulk",
+        json=[
+            {"name": f"Block {i}", "category": ItemCategory.BLOCK}
+            for i in range(3)
+        ],
+    )
+    ids = [item["id"] for item in created.json()["created"]]
+    response = await async_client.request(
+        "DELETE",
+        "/api/v1/items/bulk",
+        json={"ids": [*ids[:2], str(uuid.uuid4())]},
+    )
+    listed = await async_client.get("/api/v1/items/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"matched": 2, "modified": 2}
+    assert [item["id"] for item in listed.json()] == ids[2:]
+
+
+async def test_item_bulk_delete_by_filter(async_client: AsyncClient):
+    """Test deleting a whole category, publishing the events at once."""
+    await async_client.post(
+        "/api/v1/items/bulk",
+        json=[
+            {"name": "Dirt", "category": ItemCategory.BLOCK},
+            {"name": "Sand", "category": ItemCategory.BLOCK},
+            {"name": "Bow", "category": ItemCategory.WEAPON},
+        ],
+    )
+    with mock.patch.object(settings, "ITEMS_BULK_CHUNK_SIZE", 1):
+        with mock.patch.object(
+            aioredis.client.Pipeline,
+            "execute",
+            new_callable=mock.AsyncMock,
+        ) as execute:
+            response = await async_client.request(
+                "DELETE",
+                "/api/v1/items/bulk",
+                json={"category": ItemCategory.BLOCK},
+            )
+    listed = await async_client.get("/api/v1/items/")
+
+    assert response.json() == {"matched": 2, "modified": 2}
+    assert [item["name"] for item in listed.json()] == ["Bow"]
+    execute.assert_awaited_once()
+
+
+async def test_item_bulk_delete_without_selection(async_client: AsyncClient):
+    """Test that deleting requires ids or filters."""
+    response = await async_client.request(
+        "DELETE",
+        "/api/v1/items/bulk",
+        json={},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_item_bulk_update(async_client: AsyncClient):
+    """Test applying the same changes to many items, publishing events."""
+    await async_client.post(
+        "/api/v1/items/bulk",
+        json=[
+            {"name": "Apple", "category": ItemCategory.PLANT},
+            {"name": "Carrot", "category": ItemCategory.PLANT},
+            {"name": "Bread", "category": ItemCategory.FOOD},
+        ],
+    )
+    with mock.patch.object(
+        aioredis.client.Pipeline,
+        "publish",
+    ) as publish, mock.patch.object(
+        aioredis.client.Pipeline,
+        "execute",
+        new_callable=mock.AsyncMock,
+    ):
+        response = await async_client.patch(
+            "/api/v1/items/bulk",
+            json={
+                "category": ItemCategory.PLANT,
+                "changes": {"category": ItemCategory.FOOD},
+            },
+        )
+    listed = await async_client.get(
+        "/api/v1/items/",
+        params={"category": ItemCategory.FOOD},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"matched": 2, "modified": 2}
+    assert len(listed.json()) == 3
+    assert [published.args[0] for published in publish.call_args_list] == [
+        "item-updated",
+        "item-updated",
+    ]
+
+
+async def test_item_bulk_update_name(async_client: AsyncClient):
+    """Test that names, which are unique, cannot be changed in bulk."""
+    await async_client.post(
+        "/api/v1/items/bulk",
+        json=[
+            {"name": "Apple", "category": ItemCategory.PLANT},
+            {"name": "Carrot", "category": ItemCategory.PLANT},
+        ],
+    )
+    response = await async_client.patch(
+        "/api/v1/items/bulk",
+        json={
+            "category": ItemCategory.PLANT,
+            "changes": {"name": "Apple"},
+        },
+    )
+    listed = await async_client.get("/api/v1/items/")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert sorted(item["name"] for item in listed.json()) == [
+        "Apple",
+        "Carrot",
+    ]
+
+
+async def test_item_bulk_update_without_changes(async_client: AsyncClient):
+    """Test that a bulk update has to change something."""
+    response = await async_client.patch(
+        "/api/v1/items/bulk",
+        json={"category": ItemCategory.PLANT, "changes": {}},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 async def test_item_get(async_client: AsyncClient):
     """Test getting an item."""
     sword = await async_client.post(
@@ -70,6 +604,24 @@ async def test_item_get(async_client: AsyncClient):
     assert data["category"] == ItemCategory.WEAPON
 
 
+async def test_item_get_fields(async_client: AsyncClient):
+    """Test getting only the selected fields of an item."""
+    sword = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    response = await async_client.get(
+        f"/api/v1/items/{sword.json()['id']}",
+        params={"fields": "category"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "id": sword.json()["id"],
+        "category": ItemCategory.WEAPON,
+    }
+
+
 async def test_item_get_not_found(async_client: AsyncClient):
     """Test getting an item that does not exist."""
     item_id = uuid.uuid4()
@@ -177,3 +729,35 @@ async def test_item_update_only_category(async_client: AsyncClient):
     assert response.status_code == status.HTTP_200_OK
     assert data["id"] == sword.json()["id"]
     assert data["category"] == ItemCategory.TOOL
+
+
+async def test_item_update_same_name(async_client: AsyncClient):
+    """Test updating an item with the name it already has."""
+    sword = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    response = await async_client.patch(
+        f"/api/v1/items/{sword.json()['id']}",
+        json={"name": "Sword", "category": ItemCategory.TOOL},
+    )
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data["name"] == "Sword"
+    assert data["category"] == ItemCategory.TOOL
+
+
+async def test_item_update_without_changes(async_client: AsyncClient):
+    """Test updating an item with an empty body."""
+    sword = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    response = await async_client.patch(
+        f"/api/v1/items/{sword.json()['id']}",
+        json={},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == sword.json()
@@ -0,0 +1,149 @@
+"""Items cache E2E test cases."""
+
+import typing as T
+import uuid
+from unittest import mock
+
+import pytest
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+
+from shulker_box.database.models import Item
+from shulker_box.domain.items.cache import ItemCache
+from shulker_box.domain.types import ItemCategory
+from shulker_box.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture()
+async def item_cache() -> T.AsyncGenerator:
+    """Turn the item cache on.
+
+    Yields:
+        type[ItemCache]: cache holder.
+    """
+    with mock.patch.object(settings, "ITEMS_CACHE", True):
+        await ItemCache.start()
+    yield ItemCache
+    await ItemCache.stop()
+
+
+async def test_item_get_cached(
+    async_client: AsyncClient,
+    item_cache: type[ItemCache],
+):
+    """Test that a cached item is served without reading the database."""
+    sword = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    first = await async_client.get(f"/api/v1/items/{sword.json()['id']}")
+    await Item.find_one(Item.id == uuid.UUID(sword.json()["id"])).delete()
+    second = await async_client.get(f"/api/v1/items/{sword.json()['id']}")
+    metrics = await async_client.get("/api/v1/metrics/")
+
+    assert first.json() == second.json() == sword.json()
+    assert metrics.json()["item_cache"] == {
+        "size": 1,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+    }
+
+
+async def test_item_update_invalidates_cache(
+    async_client: AsyncClient,
+    item_cache: type[ItemCache],
+):
+    """Test that an updated item is read again."""
+    sword = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    await async_client.get(f"/api/v1/items/{sword.json()['id']}")
+    await async_client.patch(
+        f"/api/v1/items/{sword.json()['id']}",
+        json={"name": "Sword of the Ancients"},
+    )
+    response = await async_client.get(f"/api/v1/items/{sword.json()['id']}")
+
+    assert response.json()["name"] == "Sword of the Ancients"
+
+
+async def test_item_delete_invalidates_cache(
+    async_client: AsyncClient,
+    item_cache: type[ItemCache],
+):
+    """Test that a deleted item is not served from the cache."""
+    sword = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    await async_client.get(f"/api/v1/items/{sword.json()['id']}")
+    await async_client.delete(f"/api/v1/items/{sword.json()['id']}")
+    response = await async_client.get(f"/api/v1/items/{sword.json()['id']}")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_item_bulk_writes_invalidate_cache(
+    async_client: AsyncClient,
+    item_cache: type[ItemCache],
+):
+    """Test that bulk updates and deletes drop the cached items."""
+    sword = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    url = f"/api/v1/items/{sword.json()['id']}"
+    await async_client.get(url)
+    await async_client.patch(
+        "/api/v1/items/bulk",
+        json={"ids": [sword.json()["id"]], "changes": {"name": "Bow"}},
+    )
+    updated = await async_client.get(url)
+    await async_client.request(
+        "DELETE",
+        "/api/v1/items/bulk",
+        json={"ids": [sword.json()["id"]]},
+    )
+    deleted = await async_client.get(url)
+
+    assert updated.json()["name"] == "Bow"
+    assert deleted.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_item_list_cached(async_client: AsyncClient):
+    """Test that pages are shared until the items change."""
+    with mock.patch.object(settings, "ITEMS_LIST_CACHE", True):
+        await async_client.post(
+            "/api/v1/items/",
+            json={"name": "Dirt", "category": ItemCategory.BLOCK},
+        )
+        sand = await async_client.post(
+            "/api/v1/items/",
+            json={"name": "Sand", "category": ItemCategory.BLOCK},
+        )
+        first = await async_client.get(
+            "/api/v1/items/",
+            params={"category": ItemCategory.BLOCK},
+        )
+        await Item.find_one(Item.id == uuid.UUID(sand.json()["id"])).delete()
+        second = await async_client.get(
+            "/api/v1/items/",
+            params={"category": ItemCategory.BLOCK},
+        )
+        await async_client.post(
+            "/api/v1/items/",
+            json={"name": "Gravel", "category": ItemCategory.BLOCK},
+        )
+        third = await async_client.get(
+            "/api/v1/items/",
+            params={"category": ItemCategory.BLOCK},
+        )
+
+    assert second.content == first.content
+    assert len(first.json()) == 2
+    assert sorted(item["name"] for item in third.json()) == ["Dirt", "Gravel"]
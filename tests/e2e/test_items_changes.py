@@ -0,0 +1,190 @@
+"""Items changes E2E test cases."""
+
+import asyncio
+from datetime import datetime
+from unittest import mock
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from shulker_box.database.models import Item
+from shulker_box.domain.items.repositories import ItemMongoRepository
+from shulker_box.domain.types import ItemCategory
+from shulker_box.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+SETTLE_TIME = 0.2
+
+
+@pytest.fixture(autouse=True)
+def settled_at_once():
+    """Collect the changes right after they are made."""
+    with mock.patch.object(settings, "ITEMS_CHANGES_SETTLE_TIME", 0):
+        yield
+
+
+async def create_item(async_client: AsyncClient, name: str) -> dict:
+    """Create an item to sync."""
+    response = await async_client.post(
+        "/api/v1/items/",
+        json={"name": name, "category": ItemCategory.BLOCK},
+    )
+    return response.json()
+
+
+async def test_changes_without_token(async_client: AsyncClient):
+    """Test that all the items are collected without a token."""
+    dirt = await create_item(async_client, "Dirt")
+    stone = await create_item(async_client, "Stone")
+
+    response = await async_client.get("/api/v1/items/changes")
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data["changed"] == [dirt, stone]
+    assert data["deleted"] == []
+    assert not data["more"]
+
+
+async def test_changes_since_token(async_client: AsyncClient):
+    """Test that only the items changed since a token are collected."""
+    dirt = await create_item(async_client, "Dirt")
+    stone = await create_item(async_client, "Stone")
+    token = (await async_client.get("/api/v1/items/changes")).json()["token"]
+    await async_client.delete(f"/api/v1/items/{dirt['id']}")
+    updated = await async_client.patch(
+        f"/api/v1/items/{stone['id']}",
+        json={"category": ItemCategory.TOOL},
+    )
+    sand = await create_item(async_client, "Sand")
+
+    response = await async_client.get(
+        "/api/v1/items/changes",
+        params={"since": token},
+    )
+    data = response.json()
+
+    assert data["changed"] == [updated.json(), sand]
+    assert data["deleted"] == [dirt["id"]]
+    assert data["token"] != token
+
+
+async def test_changes_up_to_date(async_client: AsyncClient):
+    """Test syncing without any changes."""
+    await create_item(async_client, "Dirt")
+    token = (await async_client.get("/api/v1/items/changes")).json()["token"]
+
+    response = await async_client.get(
+        "/api/v1/items/changes",
+        params={"since": token},
+    )
+    data = response.json()
+
+    assert data["changed"] == []
+    assert data["deleted"] == []
+    assert not data["more"]
+
+
+async def test_changes_paged(async_client: AsyncClient):
+    """Test that items changed by a single bulk write are paged one by one."""
+    await async_client.post(
+        "/api/v1/items/bulk",
+        json=[
+            {"name": name, "category": ItemCategory.BLOCK}
+            for name in ("Dirt", "Stone", "Sand")
+        ],
+    )
+    token = (await async_client.get("/api/v1/items/changes")).json()["token"]
+    await async_client.patch(
+        "/api/v1/items/bulk",
+        json={
+            "category": ItemCategory.BLOCK,
+            "changes": {"category": ItemCategory.TOOL},
+        },
+    )
+    changed: list[str] = []
+    more = True
+    while more:
+        data = (
+            await async_client.get(
+                "/api/v1/items/changes",
+                params={"since": token, "limit": 1},
+            )
+        ).json()
+        changed.extend(item["name"] for item in data["changed"])
+        token = data["token"]
+        more = data["more"]
+
+    assert sorted(changed) == ["Dirt", "Sand", "Stone"]
+
+
+async def test_changes_landing_out_of_order(async_client: AsyncClient):
+    """Test that a write numbered earlier but landing later is not skipped."""
+    await create_item(async_client, "Dirt")
+    token = (await async_client.get("/api/v1/items/changes")).json()["token"]
+    sequence = await ItemMongoRepository().next_sequence()
+    numbered_at = datetime.utcnow()
+    stone = await create_item(async_client, "Stone")
+
+    with mock.patch.object(settings, "ITEMS_CHANGES_SETTLE_TIME", SETTLE_TIME):
+        early = await async_client.get(
+            "/api/v1/items/changes",
+            params={"since": token},
+        )
+        sand = Item(name="Sand", category=ItemCategory.BLOCK)
+        sand.sequence = sequence
+        sand.changed_at = numbered_at
+        await sand.insert()
+        await asyncio.sleep(SETTLE_TIME)
+        settled = await async_client.get(
+            "/api/v1/items/changes",
+            params={"since": early.json()["token"]},
+        )
+
+    assert early.json()["changed"] == []
+    assert [item["name"] for item in settled.json()["changed"]] == [
+        "Sand",
+        stone["name"],
+    ]
+
+
+async def test_changes_delete_without_tombstone(async_client: AsyncClient):
+    """Test that items are kept unless their tombstones are left."""
+    dirt = await create_item(async_client, "Dirt")
+
+    with mock.patch.object(
+        ItemMongoRepository,
+        "bury",
+        side_effect=RuntimeError("Tombstones are down"),
+    ):
+        with pytest.raises(RuntimeError):
+            await async_client.delete(f"/api/v1/items/{dirt['id']}")
+
+    response = await async_client.get(f"/api/v1/items/{dirt['id']}")
+
+    assert response.json() == dirt
+
+
+async def test_changes_expired_token(async_client: AsyncClient):
+    """Test that a token older than the tombstones is rejected."""
+    token = (await async_client.get("/api/v1/items/changes")).json()["token"]
+
+    with mock.patch.object(settings, "ITEMS_TOMBSTONE_RETENTION", -1):
+        response = await async_client.get(
+            "/api/v1/items/changes",
+            params={"since": token},
+        )
+
+    assert response.status_code == status.HTTP_410_GONE
+
+
+async def test_changes_invalid_token(async_client: AsyncClient):
+    """Test that a malformed token is rejected."""
+    response = await async_client.get(
+        "/api/v1/items/changes",
+        params={"since": "not-a-token"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
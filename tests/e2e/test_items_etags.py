@@ -0,0 +1,133 @@
+"""Items conditional requests E2E test cases."""
+
+from unittest import mock
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from shulker_box.domain.items.services import ItemService
+from shulker_box.domain.types import ItemCategory
+
+pytestmark = pytest.mark.asyncio
+
+
+async def create_sword(async_client: AsyncClient) -> dict:
+    """Create an item to tag."""
+    response = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    return response.json()
+
+
+async def test_item_not_modified(async_client: AsyncClient):
+    """Test getting an item the client already has."""
+    sword = await create_sword(async_client)
+    response = await async_client.get(f"/api/v1/items/{sword['id']}")
+    etag = response.headers["ETag"]
+
+    cached = await async_client.get(
+        f"/api/v1/items/{sword['id']}",
+        headers={"If-None-Match": etag},
+    )
+
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached.headers["ETag"] == etag
+    assert not cached.content
+
+
+async def test_item_fields_tagged_apart(async_client: AsyncClient):
+    """Test that partial representations do not match the full one."""
+    sword = await create_sword(async_client)
+    response = await async_client.get(f"/api/v1/items/{sword['id']}")
+
+    partial = await async_client.get(
+        f"/api/v1/items/{sword['id']}",
+        params={"fields": "name"},
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+
+    assert partial.status_code == status.HTTP_200_OK
+    assert partial.json() == {
+        "id": sword["id"],
+        "name": "Sword",
+        "version": sword["version"],
+    }
+
+
+async def test_items_not_modified(async_client: AsyncClient):
+    """Test getting a page of items until any item changes."""
+    await create_sword(async_client)
+    response = await async_client.get("/api/v1/items/")
+    etag = response.headers["ETag"]
+
+    cached = await async_client.get(
+        "/api/v1/items/",
+        headers={"If-None-Match": etag},
+    )
+    await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Pickaxe", "category": ItemCategory.TOOL},
+    )
+    changed = await async_client.get(
+        "/api/v1/items/",
+        headers={"If-None-Match": etag},
+    )
+
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()) == 2
+
+
+@mock.patch.object(ItemService, "get_generation", return_value=(None, None))
+async def test_items_untagged(
+    get_generation: mock.AsyncMock,
+    async_client: AsyncClient,
+):
+    """Test that pages are not tagged when the generation is unknown."""
+    await create_sword(async_client)
+
+    response = await async_client.get(
+        "/api/v1/items/",
+        headers={"If-None-Match": "*"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "ETag" not in response.headers
+    assert len(response.json()) == 1
+
+
+async def test_item_update_if_match(async_client: AsyncClient):
+    """Test updating an item that was not changed since it was read."""
+    sword = await create_sword(async_client)
+    read = await async_client.get(f"/api/v1/items/{sword['id']}")
+
+    response = await async_client.patch(
+        f"/api/v1/items/{sword['id']}",
+        json={"category": ItemCategory.TOOL},
+        headers={"If-Match": read.headers["ETag"]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["version"] == sword["version"] + 1
+    assert response.headers["ETag"] != read.headers["ETag"]
+
+
+async def test_item_update_if_match_changed(async_client: AsyncClient):
+    """Test updating an item that was changed in the meantime."""
+    sword = await create_sword(async_client)
+    read = await async_client.get(f"/api/v1/items/{sword['id']}")
+    await async_client.patch(
+        f"/api/v1/items/{sword['id']}",
+        json={"category": ItemCategory.TOOL},
+    )
+
+    response = await async_client.patch(
+        f"/api/v1/items/{sword['id']}",
+        json={"category": ItemCategory.ARMOR},
+        headers={"If-Match": read.headers["ETag"]},
+    )
+
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
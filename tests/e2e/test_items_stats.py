@@ -0,0 +1,121 @@
+"""Items stats API E2E test cases."""
+
+from unittest import mock
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from shulker_box.database.models import ItemCounter
+from shulker_box.domain.items.stats import ItemStats
+from shulker_box.domain.types import ItemCategory
+
+pytestmark = pytest.mark.asyncio
+
+
+async def get_stats(async_client: AsyncClient) -> dict:
+    """Get the item stats."""
+    response = await async_client.get("/api/v1/items/stats")
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+async def test_item_stats_empty(async_client: AsyncClient):
+    """Test getting the stats without any items."""
+    data = await get_stats(async_client)
+
+    assert data["total"] == 0
+    assert data["categories"] == {category: 0 for category in ItemCategory}
+
+
+async def test_item_stats_follow_writes(async_client: AsyncClient):
+    """Test that the stats follow items created, updated and deleted."""
+    sword = await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Sword", "category": ItemCategory.WEAPON},
+    )
+    await async_client.post(
+        "/api/v1/items/bulk",
+        json=[
+            {"name": "Dirt", "category": ItemCategory.BLOCK},
+            {"name": "Stone", "category": ItemCategory.BLOCK},
+        ],
+    )
+    await async_client.patch(
+        f"/api/v1/items/{sword.json()['id']}",
+        json={"category": ItemCategory.TOOL},
+    )
+    await async_client.delete("/api/v1/items/bulk", json={"name": "Dirt"})
+    data = await get_stats(async_client)
+
+    assert data["total"] == 2
+    assert data["categories"][ItemCategory.BLOCK] == 1
+    assert data["categories"][ItemCategory.TOOL] == 1
+    assert data["categories"][ItemCategory.WEAPON] == 0
+
+    await async_client.delete(f"/api/v1/items/{sword.json()['id']}")
+    data = await get_stats(async_client)
+
+    assert data["total"] == 1
+    assert data["categories"][ItemCategory.TOOL] == 0
+
+
+async def test_item_stats_bulk_update(async_client: AsyncClient):
+    """Test that the stats follow categories changed in bulk."""
+    await async_client.post(
+        "/api/v1/items/bulk",
+        json=[
+            {"name": "Dirt", "category": ItemCategory.BLOCK},
+            {"name": "Stone", "category": ItemCategory.BLOCK},
+        ],
+    )
+    await async_client.patch(
+        "/api/v1/items/bulk",
+        json={
+            "category": ItemCategory.BLOCK,
+            "changes": {"category": ItemCategory.PLANT},
+        },
+    )
+    data = await get_stats(async_client)
+
+    assert data["categories"][ItemCategory.BLOCK] == 0
+    assert data["categories"][ItemCategory.PLANT] == 2
+
+
+async def test_item_stats_bulk_delete(async_client: AsyncClient):
+    """Test that bulk deletes move the counters without counting again."""
+    await async_client.post(
+        "/api/v1/items/bulk",
+        json=[
+            {"name": "Dirt", "category": ItemCategory.BLOCK},
+            {"name": "Bread", "category": ItemCategory.FOOD},
+        ],
+    )
+    with mock.patch.object(ItemStats, "rebuild") as rebuild:
+        await async_client.delete(
+            "/api/v1/items/bulk",
+            json={"category": ItemCategory.BLOCK},
+        )
+    data = await get_stats(async_client)
+
+    rebuild.assert_not_called()
+    assert data["categories"][ItemCategory.BLOCK] == 0
+    assert data["categories"][ItemCategory.FOOD] == 1
+
+
+async def test_item_stats_rebuild(async_client: AsyncClient):
+    """Test that drifted counters are recomputed from the items."""
+    await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Bread", "category": ItemCategory.FOOD},
+    )
+    await ItemCounter.get_motor_collection().delete_many({})
+
+    assert (await get_stats(async_client))["total"] == 0
+
+    counts = await ItemStats.rebuild()
+    data = await get_stats(async_client)
+
+    assert counts[ItemCategory.FOOD] == 1
+    assert data["total"] == 1
+    assert data["categories"][ItemCategory.FOOD] == 1
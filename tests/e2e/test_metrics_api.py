@@ -0,0 +1,61 @@
+"""Metrics API E2E test cases."""
+
+from unittest import mock
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from shulker_box.domain.types import ItemCategory
+from shulker_box.events.bus import EventBus
+from shulker_box.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_metrics_without_event_buffer(async_client: AsyncClient):
+    """Test getting metrics when events are not buffered."""
+    response = await async_client.get("/api/v1/metrics/")
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data["event_buffer"] is None
+    assert data["item_cache"] is None
+
+
+async def test_metrics_with_event_sinks(async_client: AsyncClient):
+    """Test getting the latency histograms of the event sinks."""
+    await async_client.post(
+        "/api/v1/items/",
+        json={"name": "Torch", "category": ItemCategory.WEAPON},
+    )
+    response = await async_client.get("/api/v1/metrics/")
+    sinks = {sink["name"]: sink for sink in response.json()["event_sinks"]}
+
+    assert response.status_code == status.HTTP_200_OK
+    assert sinks["redis"]["critical"]
+    assert sinks["redis"]["deliveries"] >= 1
+    assert sinks["redis"]["latency_histogram"]["+Inf"] == (
+        sinks["redis"]["deliveries"]
+    )
+
+
+async def test_metrics_with_event_buffer(async_client: AsyncClient):
+    """Test getting the event buffer metrics."""
+    with mock.patch.object(settings, "EVENTS_BUFFERED", True):
+        await EventBus.start()
+    response = await async_client.get("/api/v1/metrics/")
+    data = response.json()
+    await EventBus.stop()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data["event_buffer"] == {
+        "depth": 0,
+        "flushes": 0,
+        "flushed_events": 0,
+        "failed_flushes": 0,
+        "dropped_events": 0,
+        "last_flush_latency": 0,
+        "max_flush_latency": 0,
+        "average_flush_latency": 0,
+    }
@@ -0,0 +1,104 @@
+"""Events outbox E2E test cases."""
+
+import json
+import typing as T
+from unittest import mock
+
+import pytest
+import pytest_asyncio
+import redis
+from httpx import AsyncClient
+from redis import asyncio as aioredis
+
+from shulker_box.database.models import OutboxEvent
+from shulker_box.domain.types import ItemCategory
+from shulker_box.events.bus import EventBus
+from shulker_box.events.outbox import OutboxRelay
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture()
+async def outbox_relay() -> T.AsyncGenerator:
+    """Switch the event bus to the outbox mode.
+
+    Yields:
+        OutboxRelay: relay which is not running in the background.
+    """
+    EventBus.relay = OutboxRelay(batch_size=2, poll_interval=1000)
+    yield EventBus.relay
+    EventBus.relay = None
+
+
+async def create_items(async_client: AsyncClient, count: int) -> list[dict]:
+    """Create a few items through the API."""
+    items = []
+    for index in range(count):
+        response = await async_client.post(
+            "/api/v1/items/",
+            json={"name": f"Block {index}", "category": ItemCategory.BLOCK},
+        )
+        items.append(response.json())
+    return items
+
+
+@mock.patch.object(aioredis.Redis, "publish", new_callable=mock.AsyncMock)
+async def test_events_stored_in_outbox(
+    mock_publish: mock.AsyncMock,
+    async_client: AsyncClient,
+    outbox_relay: OutboxRelay,
+):
+    """Test that events go to the outbox instead of redis."""
+    items = await create_items(async_client, 1)
+    await async_client.delete(f"/api/v1/items/{items[0]['id']}")
+    entries = await OutboxEvent.find_all().sort("_id").to_list()
+
+    mock_publish.assert_not_awaited()
+    assert [entry.channel for entry in entries] == [
+        "item-created",
+        "item-deleted",
+    ]
+    assert json.loads(entries[0].payload) == items[0]
+    assert not any(entry.sent for entry in entries)
+
+
+@mock.patch.object(aioredis.client.Pipeline, "execute")
+async def test_outbox_relayed_in_order(
+    mock_execute: mock.AsyncMock,
+    async_client: AsyncClient,
+    outbox_relay: OutboxRelay,
+):
+    """Test that the relay sends the oldest entries in batches."""
+    items = await create_items(async_client, 3)
+
+    with mock.patch.object(aioredis.client.Pipeline, "publish") as publish:
+        assert await outbox_relay.relay() == 2
+        assert await outbox_relay.relay() == 1
+        assert await outbox_relay.relay() == 0
+
+    assert [json.loads(call.args[1]) for call in publish.call_args_list] == (
+        items
+    )
+    assert mock_execute.await_count == 2
+    assert all(entry.sent for entry in await OutboxEvent.find_all().to_list())
+
+
+@mock.patch.object(
+    aioredis.client.Pipeline,
+    "execute",
+    side_effect=redis.exceptions.ConnectionError,
+)
+async def test_outbox_kept_when_redis_is_down(
+    mock_execute: mock.AsyncMock,
+    async_client: AsyncClient,
+    outbox_relay: OutboxRelay,
+):
+    """Test that entries stay pending until redis is back."""
+    await create_items(async_client, 1)
+
+    assert await outbox_relay.relay() == 0
+
+    mock_execute.assert_awaited_once()
+    assert not any(
+        entry.sent for entry in await OutboxEvent.find_all().to_list()
+    )
@@ -0,0 +1,88 @@
+"""Items query plans E2E test cases."""
+
+import itertools
+import typing as T
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from shulker_box.database.models import Item
+from shulker_box.domain.cursors import Keyset
+from shulker_box.domain.database.changelog import (
+    create_change_order,
+    create_since_query,
+)
+from shulker_box.domain.database.queries import create_settled_query
+from shulker_box.domain.items.repositories import ItemMongoRepository
+from shulker_box.domain.types import ItemCategory
+
+pytestmark = pytest.mark.asyncio
+
+FILTERS = {
+    "name": "Iron Sword",
+    "name_prefix": "iron",
+    "category": ItemCategory.WEAPON,
+}
+CURSORS = (None, Keyset(id=uuid.UUID(int=0), key="iron"))
+BLOCKING = frozenset(("COLLSCAN", "SORT"))
+
+
+def stages(plan: T.Any) -> T.Iterator[str]:
+    """Walk through all the stages of a query plan."""
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan["stage"]
+        for nested in plan.values():
+            yield from stages(nested)
+    elif isinstance(plan, list):
+        for element in plan:
+            yield from stages(element)
+
+
+def filter_combinations() -> T.Iterator[dict[str, T.Any]]:
+    """Create all the combinations of the item filters."""
+    for size in range(len(FILTERS) + 1):
+        for names in itertools.combinations(FILTERS, size):
+            yield {name: FILTERS[name] for name in names}
+
+
+async def explain(query: dict[str, T.Any], **options) -> set[str]:
+    """Collect the stages of the winning plan of a query."""
+    cursor = Item.get_motor_collection().find(query, **options)
+    explanation = await cursor.explain()
+    return set(stages(explanation["queryPlanner"]["winningPlan"]))
+
+
+async def test_item_queries_use_indexes(async_client: AsyncClient):
+    """Test that the item pages are read in the order of the indexes."""
+    for name in ("Iron Sword", "Iron Pickaxe", "Gold Sword", "Dirt"):
+        await async_client.post(
+            "/api/v1/items/",
+            json={"name": name, "category": ItemCategory.WEAPON},
+        )
+    repository = ItemMongoRepository()
+    scans = []
+    for filters, after in itertools.product(filter_combinations(), CURSORS):
+        query, order = repository.page_query(dict(filters), after)
+        if BLOCKING & await explain(query, sort=order or None, limit=11):
+            scans.append((filters, after))
+        text_query = {
+            **repository.query(dict(filters)),
+            "$text": {"$search": "iron"},
+        }
+        if BLOCKING & await explain(text_query, limit=11):
+            scans.append((filters, "search"))
+
+    assert not scans
+
+
+async def test_item_changes_use_indexes(async_client: AsyncClient):
+    """Test that the changes are read in the order of the indexes."""
+    query = {
+        **create_since_query("_id", (1, uuid.UUID(int=0))),
+        **create_settled_query("changed_at", 0),
+    }
+    order = create_change_order("_id")
+
+    assert not BLOCKING & await explain(query, sort=order, limit=11)
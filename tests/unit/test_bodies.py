@@ -0,0 +1,60 @@
+from unittest import mock
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+
+from shulker_box.api.bodies import NDJSON_MEDIA_TYPE, ManyOf
+from shulker_box.api.v1.items.schemas import ItemCreateSchema
+from shulker_box.domain.types import ItemCategory
+
+pytestmark = [pytest.mark.asyncio]
+
+
+def make_request(body: bytes, media_type: str) -> mock.Mock:
+    """Create a request with the given body."""
+    return mock.Mock(
+        headers={"content-type": media_type},
+        body=mock.AsyncMock(return_value=body),
+    )
+
+
+@pytest.mark.parametrize(
+    ("body", "media_type"),
+    [
+        (
+            b'[{"name": "Dirt", "category": "block"}, '
+            b'{"name": "Bow", "category": "weapon"}]',
+            "application/json",
+        ),
+        (
+            b'{"name": "Dirt", "category": "block"}\n\n'
+            b'{"name": "Bow", "category": "weapon"}\n',
+            NDJSON_MEDIA_TYPE,
+        ),
+    ],
+)
+async def test_parsing_many(body: bytes, media_type: str):
+    """Check that JSON arrays and newline delimited JSON are parsed."""
+    parse = ManyOf(ItemCreateSchema)
+
+    assert await parse(make_request(body, media_type)) == [
+        ItemCreateSchema(name="Dirt", category=ItemCategory.BLOCK),
+        ItemCreateSchema(name="Bow", category=ItemCategory.WEAPON),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("body", "media_type"),
+    [
+        (b"[{", "application/json"),
+        (b'{"name": "Dirt"}', "application/json"),
+        (b'{"name": "Dirt"}\n[', NDJSON_MEDIA_TYPE),
+        (b'{"name": "Dirt", "category": "dirt"}', NDJSON_MEDIA_TYPE),
+    ],
+)
+async def test_parsing_many_invalid(body: bytes, media_type: str):
+    """Check that malformed and invalid bodies are rejected."""
+    parse = ManyOf(ItemCreateSchema)
+
+    with pytest.raises(RequestValidationError):
+        await parse(make_request(body, media_type))
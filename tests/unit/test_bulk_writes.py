@@ -0,0 +1,91 @@
+from unittest import mock
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from shulker_box.domain.bulk import BulkError
+from shulker_box.domain.database import bulk
+
+pytestmark = [pytest.mark.asyncio]
+
+
+async def test_insert_many_in_chunks():
+    """Check that errors of every chunk are indexed across the whole input."""
+    collection = mock.Mock()
+    collection.insert_many = mock.AsyncMock(
+        side_effect=[
+            None,
+            BulkWriteError(
+                {"writeErrors": [{"index": 1, "code": 1, "errmsg": "Nope"}]},
+            ),
+        ],
+    )
+
+    write_errors = await bulk.insert_many(
+        collection,
+        [{"name": str(index)} for index in range(4)],
+        chunk_size=2,
+    )
+
+    assert write_errors == {3: {"index": 1, "code": 1, "errmsg": "Nope"}}
+    assert collection.insert_many.await_args_list == [
+        mock.call([{"name": "0"}, {"name": "1"}], ordered=False),
+        mock.call([{"name": "2"}, {"name": "3"}], ordered=False),
+    ]
+
+
+async def test_describe_errors_without_duplicates():
+    """Check that other errors are reported without looking anything up."""
+    collection = mock.Mock()
+
+    errors = await bulk.describe_errors(
+        collection,
+        {2: {"index": 2, "code": 1, "errmsg": "Nope"}},
+    )
+
+    assert errors == [BulkError(index=2, detail="Nope")]
+    collection.find.assert_not_called()
+
+
+async def test_read_ids_in_chunks():
+    """Check that ids are read in chunks with the last one possibly short."""
+
+    async def find(*args, **kwargs):
+        for index in range(5):
+            yield {"_id": index}
+
+    collection = mock.Mock(find=find)
+    chunks = [
+        chunk async for chunk in bulk.read_ids(collection, {}, chunk_size=2)
+    ]
+
+    assert chunks == [
+        [{"_id": 0}, {"_id": 1}],
+        [{"_id": 2}, {"_id": 3}],
+        [{"_id": 4}],
+    ]
+
+
+async def test_read_ids_with_fields():
+    """Check that the requested fields are read along with the ids."""
+    collection = mock.MagicMock()
+    collection.find.return_value.__aiter__.return_value = [
+        {"_id": 1, "category": "block"},
+    ]
+
+    chunks = [
+        chunk
+        async for chunk in bulk.read_ids(
+            collection,
+            {},
+            chunk_size=2,
+            fields=["category"],
+        )
+    ]
+
+    assert chunks == [[{"_id": 1, "category": "block"}]]
+    collection.find.assert_called_once_with(
+        {},
+        projection=["_id", "category"],
+        batch_size=2,
+    )
@@ -0,0 +1,56 @@
+from unittest import mock
+
+from shulker_box.domain import cache as cache_module
+from shulker_box.domain.cache import LRUCache
+
+
+def test_cache_hits_and_misses():
+    """Check that cached values are returned and counted."""
+    cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=60)
+    cache.set("dirt", 1)
+
+    assert cache.get("dirt") == 1
+    assert cache.get("sand") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used():
+    """Check that the least recently used entry is evicted first."""
+    cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=60)
+    cache.set("dirt", 1)
+    cache.set("sand", 2)
+    cache.get("dirt")
+    cache.set("gravel", 3)
+
+    assert len(cache) == 2
+    assert cache.get("sand") is None
+    assert cache.get("dirt") == 1
+    assert cache.stats.evictions == 1
+
+
+def test_cache_expires_entries():
+    """Check that entries are dropped after their time to live."""
+    cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=60)
+    with mock.patch.object(cache_module.time, "monotonic", return_value=0):
+        cache.set("dirt", 1)
+    with mock.patch.object(cache_module.time, "monotonic", return_value=61):
+        assert cache.get("dirt") is None
+
+    assert len(cache) == 0
+
+
+def test_cache_invalidation():
+    """Check that entries can be dropped one by one or all at once."""
+    cache: LRUCache[str, int] = LRUCache(max_size=3, ttl=60)
+    cache.set("dirt", 1)
+    cache.set("sand", 2)
+    cache.set("gravel", 3)
+    cache.invalidate("dirt")
+    cache.invalidate("bedrock")
+
+    assert cache.get("dirt") is None
+    assert len(cache) == 2
+
+    cache.clear()
+
+    assert len(cache) == 0
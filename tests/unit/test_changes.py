@@ -0,0 +1,65 @@
+import uuid
+
+import pytest
+
+from shulker_box.api.v1.items.schemas import ItemOutSchema
+from shulker_box.domain import exceptions
+from shulker_box.domain.changes import (
+    Change,
+    decode_token,
+    encode_token,
+    paginate_changes,
+)
+from shulker_box.domain.cursors import Keyset, encode_cursor
+from shulker_box.domain.types import ItemCategory
+
+
+def test_token_round_trip():
+    """Check that a token points back to the encoded change."""
+    entry_id = uuid.uuid4()
+
+    token = decode_token(encode_token((7, entry_id), 1.5))
+
+    assert token.position == (7, entry_id)
+    assert token.issued_at == 1.5
+
+
+@pytest.mark.parametrize(
+    "token", ["", "e30", encode_cursor(Keyset(id=uuid.uuid4()))]
+)
+def test_invalid_token(token: str):
+    """Check that malformed tokens are rejected."""
+    with pytest.raises(exceptions.InvalidCursorError):
+        decode_token(token)
+
+
+def test_paginate_changes():
+    """Check that changes are split into items and deletions."""
+    item = ItemOutSchema(
+        id=uuid.uuid4(), name="Dirt", category=ItemCategory.BLOCK
+    )
+    deleted = uuid.uuid4()
+    changes = [
+        Change(sequence=1, id=item.id, entry=item),
+        Change(sequence=2, id=deleted),
+        Change(sequence=3, id=uuid.uuid4()),
+    ]
+
+    page = paginate_changes(changes, limit=2, since=None, issued_at=1.0)
+
+    assert page.changed == [item]
+    assert page.deleted == [deleted]
+    assert page.more
+    assert decode_token(page.token).position == (2, deleted)
+
+
+def test_paginate_no_changes():
+    """Check that the token stays in place without any changes."""
+    since = (5, uuid.uuid4())
+
+    page = paginate_changes([], limit=2, since=since, issued_at=1.0)
+
+    assert not page.changed
+    assert not page.deleted
+    assert not page.more
+    assert decode_token(page.token).position == since
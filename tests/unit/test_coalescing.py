@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from shulker_box.domain.coalescing import SingleFlight
+
+pytestmark = [pytest.mark.asyncio]
+
+
+async def test_single_flight_shares_the_call():
+    """Check that concurrent callers of the same key share one call."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        call_number = calls
+        await asyncio.sleep(0.01)
+        return call_number
+
+    results = await asyncio.gather(
+        *(flight.run("dirt", call) for _ in range(10)),
+        flight.run("sand", call),
+    )
+
+    assert results == [1] * 10 + [2]
+    assert len(flight) == 0
+    assert await flight.run("dirt", call) == 3
+
+
+async def test_single_flight_shares_errors():
+    """Check that every caller gets the error of the shared call."""
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    async def call() -> int:
+        await asyncio.sleep(0.01)
+        raise LookupError("dirt")
+
+    results = await asyncio.gather(
+        *(flight.run("dirt", call) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [LookupError] * 3
+    assert len(flight) == 0
+
+
+async def test_single_flight_survives_cancelled_caller():
+    """Check that a cancelled caller does not cancel the shared call."""
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    async def call() -> int:
+        await asyncio.sleep(0.01)
+        return 1
+
+    cancelled = asyncio.create_task(flight.run("dirt", call))
+    waiting = asyncio.create_task(flight.run("dirt", call))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await waiting == 1
+    assert cancelled.cancelled()
+
+
+async def test_single_flight_forgets_calls():
+    """Check that callers coming after forgetting start a new call."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        call_number = calls
+        await asyncio.sleep(0.01)
+        return call_number
+
+    before = asyncio.create_task(flight.run("dirt", call))
+    other = asyncio.create_task(flight.run("sand", call))
+    await asyncio.sleep(0)
+    flight.forget("dirt")
+    after = asyncio.create_task(flight.run("dirt", call))
+    await asyncio.sleep(0)
+    flight.forget()
+
+    assert len(flight) == 0
+    assert await asyncio.gather(before, other, after) == [1, 2, 3]
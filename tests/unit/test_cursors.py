@@ -0,0 +1,54 @@
+import uuid
+
+import pytest
+
+from shulker_box.domain import exceptions
+from shulker_box.domain.cursors import (
+    AFTER,
+    KEY,
+    Keyset,
+    decode_cursor,
+    decode_offset,
+    encode_cursor,
+    encode_offset,
+    write_cursor,
+)
+
+
+@pytest.mark.parametrize("key", [None, "iron sword"])
+def test_cursor_round_trip(key: str | None):
+    """Check that a cursor points back to the encoded position."""
+    position = Keyset(id=uuid.uuid4(), key=key)
+
+    assert decode_cursor(encode_cursor(position)) == position
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not-a-cursor",
+        "e30",
+        "bnVsbA",
+        write_cursor({AFTER: str(uuid.UUID(int=1)), KEY: 1}),
+    ],
+)
+def test_invalid_cursor(cursor: str):
+    """Check that malformed cursors are rejected."""
+    with pytest.raises(exceptions.InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_offset_round_trip():
+    """Check that an offset cursor points back to the encoded position."""
+    assert decode_offset(encode_offset(40)) == 40
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["", "e30", encode_offset(-1), encode_cursor(Keyset(id=uuid.UUID(int=1)))],
+)
+def test_invalid_offset(cursor: str):
+    """Check that malformed and id cursors are rejected as offsets."""
+    with pytest.raises(exceptions.InvalidCursorError):
+        decode_offset(cursor)
@@ -0,0 +1,78 @@
+import asyncio
+import uuid
+from unittest import mock
+
+import pytest
+from redis import asyncio as aioredis
+
+from shulker_box.database.client import RedisClient, close_redis, init_redis
+from shulker_box.domain.events.outgoing import ItemDeleted
+from shulker_box.events import publisher
+from shulker_box.events.publisher import publish_with_redis
+from shulker_box.settings import settings
+
+pytestmark = [pytest.mark.asyncio]
+
+
+async def test_redis_client_is_shared():
+    """Check that the redis client is created once and reused."""
+    client = await init_redis()
+
+    assert RedisClient.get() is client
+
+    await close_redis()
+
+    assert RedisClient.instance is None
+
+
+async def test_closing_redis_without_client():
+    """Check that closing redis before initializing it is a no-op."""
+    await close_redis()
+    await close_redis()
+
+    assert RedisClient.instance is None
+
+
+async def test_publishing_more_events_than_connections():
+    """Check that publishes wait for a free connection instead of failing."""
+    events = [
+        ItemDeleted(id=uuid.uuid4())
+        for _ in range(settings.REDIS_MAX_CONNECTIONS * 3)
+    ]
+    sent = []
+
+    async def send_command(connection, *args, **kwargs) -> None:
+        sent.append(args)
+
+    async def read_response(connection) -> int:
+        await asyncio.sleep(0.01)
+        return 1
+
+    with mock.patch.object(
+        aioredis.Connection,
+        "connect",
+        new_callable=mock.AsyncMock,
+    ), mock.patch.object(
+        aioredis.Connection,
+        "can_read",
+        new_callable=mock.AsyncMock,
+        return_value=False,
+    ), mock.patch.object(
+        aioredis.Connection,
+        "send_command",
+        new=send_command,
+    ), mock.patch.object(
+        aioredis.Connection,
+        "read_response",
+        new=read_response,
+    ), mock.patch.object(
+        publisher,
+        "logger",
+    ) as logger:
+        await asyncio.gather(*map(publish_with_redis, events))
+        pool = RedisClient.get().connection_pool
+        await close_redis()
+
+    logger.error.assert_not_called()
+    assert len(sent) == len(events)
+    assert len(pool._connections) == settings.REDIS_MAX_CONNECTIONS
@@ -0,0 +1,32 @@
+from shulker_box.api import etags
+
+
+def test_entry_etag():
+    """Check that partial representations are tagged apart."""
+    assert etags.entry_etag(3) == '"3"'
+    assert etags.entry_etag(3, ("id", "name")) == '"3:id,name"'
+
+
+def test_collection_etag():
+    """Check that the tag follows the generation and the query."""
+    etag = etags.collection_etag(1, "limit=10")
+
+    assert etag == etags.collection_etag(1, "limit=10")
+    assert etag != etags.collection_etag(2, "limit=10")
+    assert etag != etags.collection_etag(1, "limit=20")
+
+
+def test_matches():
+    """Check matching against lists, weak and wildcard tags."""
+    assert not etags.matches('"1"', None)
+    assert not etags.matches('"1"', '"2"')
+    assert etags.matches('"1"', '"2", W/"1"')
+    assert etags.matches('"1"', "*")
+
+
+def test_read_version():
+    """Check reading the expected version from If-Match."""
+    assert etags.read_version(None) is None
+    assert etags.read_version("*") is None
+    assert etags.read_version('"4:id,name"') == 4
+    assert etags.read_version('"other"') == etags.NO_VERSION
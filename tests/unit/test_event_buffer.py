@@ -0,0 +1,249 @@
+import asyncio
+import json
+from dataclasses import asdict
+from unittest import mock
+
+import pytest
+import redis
+from redis import asyncio as aioredis
+
+from shulker_box.domain.events.event_types import Event
+from shulker_box.events import buffer as buffer_module
+from shulker_box.events.buffer import EventBuffer
+from shulker_box.events.bus import EventBus, eventclass
+from shulker_box.events.publisher import publish_many_with_redis
+from shulker_box.settings import settings
+
+pytestmark = [pytest.mark.asyncio]
+
+
+@eventclass(mock.MagicMock(value="minecraft-got-an-update"))
+class MinecraftUpdated(Event):
+    version: str
+
+    async def handle(self) -> None:
+        ...
+
+
+def make_events(count: int) -> list[Event]:
+    """Create a bunch of events."""
+    return [MinecraftUpdated(version=f"1.{minor}") for minor in range(count)]
+
+
+@mock.patch.object(
+    buffer_module,
+    "publish_many_with_redis",
+    new_callable=mock.AsyncMock,
+)
+async def test_buffer_flushes_full_batches(mock_publish: mock.AsyncMock):
+    """Check that the buffer sends events in batches of the given size."""
+    event_buffer = EventBuffer(batch_size=2, flush_interval=1000, max_size=10)
+    events = make_events(4)
+    for event in events:
+        await event_buffer.queue.put(event)
+
+    event_buffer.start()
+    await asyncio.sleep(0.01)
+    await event_buffer.stop()
+
+    assert mock_publish.await_args_list == [
+        mock.call(events[:2]),
+        mock.call(events[2:]),
+    ]
+    assert event_buffer.stats.flushes == 2
+    assert event_buffer.stats.flushed_events == 4
+
+
+@mock.patch.object(
+    buffer_module,
+    "publish_many_with_redis",
+    new_callable=mock.AsyncMock,
+)
+async def test_buffer_flushes_after_interval(mock_publish: mock.AsyncMock):
+    """Check that an incomplete batch is sent after the flush interval."""
+    event_buffer = EventBuffer(batch_size=100, flush_interval=10, max_size=10)
+    event_buffer.start()
+    events = make_events(1)
+    await event_buffer.queue.put(events[0])
+
+    await asyncio.sleep(0.05)
+
+    mock_publish.assert_awaited_once_with(events)
+    assert event_buffer.depth == 0
+
+    await event_buffer.stop()
+
+
+async def test_buffer_applies_backpressure():
+    """Check that putting into a full buffer waits for a free slot."""
+    event_buffer = EventBuffer(batch_size=10, flush_interval=10, max_size=1)
+    first, second = make_events(2)
+    await event_buffer.queue.put(first)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(event_buffer.queue.put(second), timeout=0.01)
+
+    assert event_buffer.depth == 1
+
+
+@mock.patch.object(
+    buffer_module,
+    "publish_many_with_redis",
+    new_callable=mock.AsyncMock,
+)
+async def test_buffer_flushed_on_stop(mock_publish: mock.AsyncMock):
+    """Check that stopping the buffer sends everything that is left."""
+    event_buffer = EventBuffer(batch_size=2, flush_interval=10, max_size=10)
+    events = make_events(3)
+    for event in events:
+        await event_buffer.queue.put(event)
+
+    await event_buffer.stop()
+
+    assert mock_publish.await_args_list == [
+        mock.call(events[:2]),
+        mock.call(events[2:]),
+    ]
+    assert event_buffer.depth == 0
+    assert event_buffer.stats.average_flush_latency >= 0
+
+
+@mock.patch.object(
+    buffer_module,
+    "publish_many_with_redis",
+    new_callable=mock.AsyncMock,
+    side_effect=[False, True],
+)
+async def test_buffer_retries_failed_flushes(mock_publish: mock.AsyncMock):
+    """Check that a batch redis did not accept is sent again."""
+    event_buffer = EventBuffer(batch_size=2, flush_interval=10, max_size=10)
+    events = make_events(2)
+    for event in events:
+        await event_buffer.queue.put(event)
+
+    event_buffer.start()
+    await asyncio.sleep(0.05)
+    await event_buffer.stop()
+
+    assert mock_publish.await_args_list == [
+        mock.call(events),
+        mock.call(events),
+    ]
+    assert event_buffer.stats.failed_flushes == 1
+    assert event_buffer.stats.flushed_events == 2
+
+
+@mock.patch.object(
+    buffer_module,
+    "publish_many_with_redis",
+    new_callable=mock.AsyncMock,
+    side_effect=[TypeError, True],
+)
+async def test_buffer_survives_broken_batches(mock_publish: mock.AsyncMock):
+    """Check that an unexpected error drops the batch, not the task."""
+    event_buffer = EventBuffer(batch_size=1, flush_interval=10, max_size=10)
+    events = make_events(2)
+
+    event_buffer.start()
+    for event in events:
+        await event_buffer.queue.put(event)
+    await asyncio.sleep(0.05)
+
+    assert event_buffer.task is not None
+    assert not event_buffer.task.done()
+
+    await event_buffer.stop()
+
+    assert mock_publish.await_args_list[-1] == mock.call(events[1:])
+    assert event_buffer.stats.dropped_events == 1
+    assert event_buffer.stats.flushed_events == 1
+
+
+@mock.patch.object(
+    buffer_module,
+    "publish_many_with_redis",
+    new_callable=mock.AsyncMock,
+    return_value=False,
+)
+async def test_buffer_stopped_without_redis(mock_publish: mock.AsyncMock):
+    """Check that events left when redis is down are counted as dropped."""
+    event_buffer = EventBuffer(batch_size=10, flush_interval=10, max_size=10)
+    for event in make_events(3):
+        await event_buffer.queue.put(event)
+
+    await event_buffer.stop()
+
+    assert event_buffer.stats.dropped_events == 3
+    assert event_buffer.stats.failed_flushes == 1
+    assert event_buffer.depth == 0
+
+
+def test_buffer_stats_without_flushes():
+    """Check that the average latency is zero before the first flush."""
+    event_buffer = EventBuffer(batch_size=2, flush_interval=10, max_size=10)
+
+    assert event_buffer.stats.average_flush_latency == 0
+
+
+@mock.patch.object(
+    buffer_module,
+    "publish_many_with_redis",
+    new_callable=mock.AsyncMock,
+)
+async def test_event_bus_buffered_mode(mock_publish: mock.AsyncMock):
+    """Check that the event bus queues events in buffered mode."""
+    events = make_events(2)
+
+    with mock.patch.object(settings, "EVENTS_BUFFERED", True):
+        await EventBus.start()
+    for event in events:
+        await EventBus.publish(event)
+
+    assert EventBus.buffer is not None
+    assert EventBus.buffer.depth == 2
+
+    await EventBus.stop()
+
+    mock_publish.assert_awaited_once_with(events)
+    assert EventBus.buffer is None
+
+
+async def test_event_bus_unbuffered_mode():
+    """Check that the event bus does not buffer by default."""
+    await EventBus.start()
+
+    assert EventBus.buffer is None
+
+    await EventBus.stop()
+
+
+@mock.patch.object(aioredis.client.Pipeline, "execute")
+async def test_publishing_many_events(mock_execute: mock.AsyncMock):
+    """Check that a batch of events is published in one pipeline."""
+    events = make_events(2)
+
+    with mock.patch.object(aioredis.client.Pipeline, "publish") as publish:
+        published = await publish_many_with_redis(events)
+
+    assert published is True
+    assert publish.call_args_list == [
+        mock.call(
+            "minecraft-got-an-update",
+            json.dumps(asdict(event), default=str),
+        )
+        for event in events
+    ]
+    mock_execute.assert_awaited_once()
+
+
+@mock.patch.object(
+    aioredis.client.Pipeline,
+    "execute",
+    side_effect=redis.exceptions.ConnectionError,
+)
+async def test_publishing_many_events_without_redis(mock_execute: mock.Mock):
+    """Check that publishing a batch survives redis being unavailable."""
+    published = await publish_many_with_redis(make_events(2))
+
+    assert published is False
+    mock_execute.assert_awaited_once()
@@ -1,12 +1,16 @@
+import asyncio
 import json
 from dataclasses import asdict
 from unittest import mock
 
 import pytest
 import redis
+from redis import asyncio as aioredis
 
 from shulker_box.domain.events.event_types import Event
+from shulker_box.events import bus as bus_module
 from shulker_box.events.bus import EventBus, eventclass
+from shulker_box.settings import settings
 
 pytestmark = [pytest.mark.asyncio]
 
@@ -42,7 +46,7 @@ def test_eventclass_as_a_dataclass():
     assert event.date == "2020-01-01"
 
 
-@mock.patch.object(redis.Redis, "publish")
+@mock.patch.object(aioredis.Redis, "publish", new_callable=mock.AsyncMock)
 async def test_publishing_event(mock_publish: mock.Mock):
     """Check that the event bus publishes events to redis."""
     event_type = "lost-ark-has-no-queues-anymore"
@@ -56,13 +60,13 @@ async def test_publishing_event(mock_publish: mock.Mock):
     event = LostArkHasNoQueues()
     await EventBus.publish(event)
 
-    mock_publish.assert_called_once_with(
+    mock_publish.assert_awaited_once_with(
         event_type,
         json.dumps(asdict(event), default=str),
     )
 
 
-@mock.patch.object(redis.Redis, "publish")
+@mock.patch.object(aioredis.Redis, "publish", new_callable=mock.AsyncMock)
 async def test_publishing_not_registered_event(mock_publish: mock.Mock):
     """Check that the event bus ignores events that are not registered."""
     event_type = "battlefield-has-no-bugs"
@@ -77,3 +81,123 @@ async def test_publishing_not_registered_event(mock_publish: mock.Mock):
     await EventBus.publish(BfHasNoBugs())
 
     mock_publish.assert_not_called()
+
+
+@mock.patch.object(
+    aioredis.Redis,
+    "publish",
+    new_callable=mock.AsyncMock,
+    side_effect=redis.exceptions.ConnectionError,
+)
+async def test_publishing_event_without_redis(mock_publish: mock.Mock):
+    """Check that the event bus survives redis being unavailable."""
+    event_type = "new-world-is-still-alive"
+    mocked_enum = mock.MagicMock(value=event_type)
+
+    @eventclass(mocked_enum)
+    class NewWorldIsAlive(Event):
+        async def handle(self) -> None:
+            ...
+
+    await EventBus.publish(NewWorldIsAlive())
+
+    mock_publish.assert_awaited_once()
+
+
+async def test_publishing_event_does_not_block_the_loop():
+    """Check that a stuck publish leaves other coroutines running."""
+    event_type = "diablo-immortal-is-on-pc"
+    mocked_enum = mock.MagicMock(value=event_type)
+    released = asyncio.Event()
+
+    async def stuck_publish(*args, **kwargs) -> None:
+        await released.wait()
+
+    @eventclass(mocked_enum)
+    class DiabloIsOnPc(Event):
+        async def handle(self) -> None:
+            ...
+
+    with mock.patch.object(aioredis.Redis, "publish", new=stuck_publish):
+        publishing = asyncio.create_task(EventBus.publish(DiabloIsOnPc()))
+        await asyncio.wait_for(asyncio.sleep(0.01), timeout=0.1)
+
+        assert not publishing.done()
+
+        released.set()
+        await asyncio.wait_for(publishing, timeout=0.1)
+
+
+@eventclass(mock.MagicMock(value="terraria-got-another-final-update"))
+class TerrariaUpdated(Event):
+    version: str
+
+    async def handle(self) -> None:
+        ...
+
+
+class HytaleReleased(Event):
+    event_type = mock.MagicMock(value="hytale-got-released")
+
+    async def handle(self) -> None:
+        ...
+
+
+@mock.patch.object(
+    bus_module,
+    "publish_many_with_redis",
+    new_callable=mock.AsyncMock,
+)
+async def test_publishing_many_events(mock_publish: mock.AsyncMock):
+    """Check that the event bus publishes registered events as one batch."""
+    events = [TerrariaUpdated(version="1.4.4"), TerrariaUpdated(version="1.5")]
+
+    await EventBus.publish_many([*events, HytaleReleased()])
+
+    mock_publish.assert_awaited_once_with(events)
+
+
+@mock.patch.object(
+    bus_module,
+    "publish_many_with_redis",
+    new_callable=mock.AsyncMock,
+)
+async def test_publishing_many_not_registered_events(
+    mock_publish: mock.AsyncMock,
+):
+    """Check that the event bus skips a batch without registered events."""
+    await EventBus.publish_many([HytaleReleased()])
+    await EventBus.publish_many([])
+
+    mock_publish.assert_not_called()
+
+
+@mock.patch.object(bus_module, "store_in_outbox", new_callable=mock.AsyncMock)
+@mock.patch.object(bus_module.OutboxRelay, "run", new_callable=mock.AsyncMock)
+async def test_publishing_many_events_to_outbox(
+    mock_run: mock.AsyncMock,
+    mock_store: mock.AsyncMock,
+):
+    """Check that the event bus stores a batch of events in the outbox."""
+    events = [TerrariaUpdated(version="1.4.4")]
+
+    with mock.patch.object(settings, "EVENTS_OUTBOX", True):
+        await EventBus.start()
+    await EventBus.publish_many(events)
+    await EventBus.stop()
+
+    mock_store.assert_awaited_once_with(events)
+
+
+@mock.patch.object(bus_module.EventBuffer, "run", new_callable=mock.AsyncMock)
+async def test_publishing_many_events_to_buffer(mock_run: mock.AsyncMock):
+    """Check that the event bus queues a batch of events when buffered."""
+    with mock.patch.object(settings, "EVENTS_BUFFERED", True):
+        await EventBus.start()
+    await EventBus.publish_many([TerrariaUpdated(version="1.4.4")])
+
+    assert EventBus.buffer is not None
+    assert EventBus.buffer.depth == 1
+
+    EventBus.buffer.queue.get_nowait()
+    await EventBus.stop()
@@ -0,0 +1,239 @@
+import asyncio
+import json
+import uuid
+from unittest import mock
+
+import pytest
+import redis
+
+from shulker_box.database.client import RedisClient
+from shulker_box.domain.events.event_types import Event
+from shulker_box.events import consumer as consumer_module
+from shulker_box.events.bus import EventBus, eventclass
+from shulker_box.events.consumer import (
+    EventConsumer,
+    create_groups,
+    decode_message,
+)
+from shulker_box.events.event_types import IncomingEventType
+from shulker_box.settings import settings
+
+pytestmark = [pytest.mark.asyncio]
+
+
+class SignEventType(IncomingEventType):
+    """Events of a sibling service."""
+
+    SIGN_PLACED = "sign-placed"
+
+
+@eventclass(SignEventType.SIGN_PLACED)
+class SignPlaced(Event):
+    """Sign placed somewhere."""
+
+    id: uuid.UUID
+    text: str
+
+    async def handle(self) -> None:
+        """Fail on request."""
+        if self.text == "fail":
+            raise RuntimeError(self.text)
+
+
+def make_message(index: int, text: str = "Hello") -> tuple:
+    """Create a stream message of a placed sign."""
+    payload = {"id": str(uuid.UUID(int=index)), "text": text}
+    return f"{index}-0".encode(), {b"data": json.dumps(payload).encode()}
+
+
+def make_client() -> mock.MagicMock:
+    """Create a redis client acknowledging messages with a pipeline."""
+    client = mock.MagicMock()
+    pipeline = client.pipeline.return_value.__aenter__.return_value
+    pipeline.execute = mock.AsyncMock()
+    return client
+
+
+def make_consumer(concurrency: int = 10) -> EventConsumer:
+    """Create a consumer of the placed signs."""
+    return EventConsumer(
+        events={"sign-placed": SignPlaced},
+        batch_size=10,
+        concurrency=concurrency,
+    )
+
+
+def test_decode_message():
+    """Check that messages are decoded into the registered event classes."""
+    _, fields = make_message(1)
+
+    event = decode_message(SignPlaced, fields)
+
+    assert event == SignPlaced(id=uuid.UUID(int=1), text="Hello")
+
+
+def test_incoming_events():
+    """Check that only the incoming events are consumed."""
+    assert EventBus.incoming() == {"sign-placed": SignPlaced}
+
+
+async def test_consumer_acknowledges_batch():
+    """Check that the whole batch is acknowledged with a single command."""
+    client = make_client()
+    pipeline = client.pipeline.return_value.__aenter__.return_value
+    deliveries = [
+        ("sign-placed", make_message(1)),
+        ("sign-placed", make_message(2, text="fail")),
+        ("sign-placed", (b"3-0", {b"data": b"not json"})),
+    ]
+
+    with mock.patch.object(RedisClient, "get", return_value=client):
+        await make_consumer().handle(deliveries)
+
+    pipeline.xack.assert_called_once_with(
+        "sign-placed",
+        "shulker-box",
+        b"1-0",
+        b"2-0",
+        b"3-0",
+    )
+    pipeline.execute.assert_awaited_once()
+
+
+async def test_consumer_handles_empty_batch():
+    """Check that nothing is acknowledged when there were no messages."""
+    client = make_client()
+
+    with mock.patch.object(RedisClient, "get", return_value=client):
+        await make_consumer().handle([])
+
+    client.pipeline.assert_not_called()
+
+
+async def test_consumer_recovers_and_listens():
+    """Check that pending messages are claimed before the new ones."""
+    client = make_client()
+    pipeline = client.pipeline.return_value.__aenter__.return_value
+    client.xgroup_create = mock.AsyncMock(
+        side_effect=redis.exceptions.ResponseError("BUSYGROUP exists"),
+    )
+    client.xautoclaim = mock.AsyncMock(
+        side_effect=[
+            (b"2-0", [make_message(1)], []),
+            (b"0-0", [make_message(2)], []),
+        ],
+    )
+    client.xreadgroup = mock.AsyncMock(
+        side_effect=[
+            [(b"sign-placed", [make_message(3)])],
+            asyncio.CancelledError(),
+        ],
+    )
+
+    with mock.patch.object(RedisClient, "get", return_value=client):
+        with pytest.raises(asyncio.CancelledError):
+            await make_consumer().consume()
+
+    assert client.xautoclaim.await_args.kwargs["start_id"] == b"2-0"
+    block = client.xreadgroup.await_args.kwargs["block"]
+    assert block < settings.REDIS_TIMEOUT * 1000
+    assert pipeline.xack.call_args_list == [
+        mock.call("sign-placed", "shulker-box", message_id)
+        for message_id in (b"1-0", b"2-0", b"3-0")
+    ]
+
+
+async def test_consumer_join_fails():
+    """Check that errors other than an existing group are raised."""
+    client = make_client()
+    client.xgroup_create = mock.AsyncMock(
+        side_effect=redis.exceptions.ResponseError("WRONGTYPE"),
+    )
+
+    with mock.patch.object(RedisClient, "get", return_value=client):
+        with pytest.raises(redis.exceptions.ResponseError):
+            await create_groups(["sign-placed"])
+
+
+@mock.patch.object(consumer_module, "RETRY_INTERVAL", 0)
+async def test_consumer_reconnects():
+    """Check that the consumer starts over after connection errors."""
+    consume = mock.AsyncMock(
+        side_effect=[
+            redis.exceptions.ConnectionError("Connection refused"),
+            asyncio.CancelledError(),
+        ],
+    )
+
+    with mock.patch.object(EventConsumer, "consume", consume):
+        with pytest.raises(asyncio.CancelledError):
+            await make_consumer().run()
+
+    assert consume.await_count == 2
+
+
+@mock.patch.object(consumer_module, "RETRY_INTERVAL", 0)
+async def test_consumer_keeps_going_after_errors():
+    """Check that the consumer starts over after any other errors."""
+    consume = mock.AsyncMock(
+        side_effect=[
+            redis.exceptions.ResponseError("NOGROUP No such consumer group"),
+            RuntimeError("Unexpected"),
+            asyncio.CancelledError(),
+        ],
+    )
+
+    with mock.patch.object(EventConsumer, "consume", consume):
+        with pytest.raises(asyncio.CancelledError):
+            await make_consumer().run()
+
+    assert consume.await_count == 3
+
+
+async def test_consumer_stop_without_start():
+    """Check that stopping a consumer which never started does nothing."""
+    consumer = make_consumer()
+
+    await consumer.stop()
+
+    assert consumer.task is None
+
+
+async def test_consumer_bounded_concurrency():
+    """Check that no more events are handled at once than allowed."""
+    running = 0
+    most = 0
+
+    async def handle(event):
+        nonlocal running, most
+        running += 1
+        most = max(most, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    consumer = make_consumer(concurrency=2)
+    with mock.patch.object(SignPlaced, "handle", handle):
+        await asyncio.gather(
+            *(
+                consumer.handle_message("sign-placed", make_message(index))
+                for index in range(10)
+            ),
+        )
+
+    assert most == 2
+
+
+@mock.patch.object(EventConsumer, "run", new_callable=mock.AsyncMock)
+async def test_event_bus_consumer(run: mock.AsyncMock):
+    """Check that the event bus consumes the incoming events if enabled."""
+    with mock.patch.object(settings, "EVENTS_CONSUMER", True):
+        await EventBus.start()
+
+    assert EventBus.consumer is not None
+    assert EventBus.consumer.events == {"sign-placed": SignPlaced}
+
+    await asyncio.sleep(0)
+    await EventBus.stop()
+
+    run.assert_awaited_once()
+    assert EventBus.consumer is None
@@ -0,0 +1,119 @@
+import json
+import typing as T
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from shulker_box.domain.events.event_types import Event
+from shulker_box.domain.events.outgoing import ItemCreated, ItemDeleted
+from shulker_box.domain.types import ItemCategory
+from shulker_box.events import encoders, encoding
+from shulker_box.events.bus import eventclass
+from shulker_box.events.publisher import encode_event
+from shulker_box.settings import settings
+
+
+@eventclass(mock.MagicMock(value="chunk-generated"))
+class ChunkGenerated(Event):
+    id: uuid.UUID
+    generated_at: datetime
+    biomes: list[str]
+    seed: T.Optional[int] = None
+
+    async def handle(self) -> None:
+        ...
+
+
+@dataclass
+class Biome:
+    name: str
+    center: uuid.UUID
+
+
+@eventclass(mock.MagicMock(value="world-created"))
+class WorldCreated(Event):
+    id: uuid.UUID
+    spawn: Biome
+    biomes: list[Biome]
+    regions: dict[str, Biome]
+    ocean: T.Optional[Biome] = None
+
+    async def handle(self) -> None:
+        ...
+
+
+def make_events() -> list[Event]:
+    """Create one event of every shape."""
+    return [
+        ItemCreated(
+            id=uuid.uuid4(),
+            name="Diamond Sword",
+            category=ItemCategory.WEAPON,
+            version=1,
+        ),
+        ItemDeleted(id=uuid.uuid4()),
+        ChunkGenerated(
+            id=uuid.uuid4(),
+            generated_at=datetime(2022, 3, 1, 12),
+            biomes=["desert"],
+        ),
+        WorldCreated(
+            id=uuid.uuid4(),
+            spawn=Biome(name="plains", center=uuid.uuid4()),
+            biomes=[Biome(name="desert", center=uuid.uuid4())],
+            regions={"north": Biome(name="taiga", center=uuid.uuid4())},
+            ocean=Biome(name="ocean", center=uuid.uuid4()),
+        ),
+    ]
+
+
+def test_generated_encoders_match_asdict():
+    """Check that the generated encoders keep the previous payloads."""
+    for event in make_events():
+        _, payload = encode_event(event)
+
+        assert payload == json.dumps(asdict(event), default=str)
+
+
+def test_base_event_payload():
+    """Check that the base event payload falls back to asdict."""
+    event = ChunkGenerated(
+        id=uuid.uuid4(),
+        generated_at=datetime(2022, 3, 1),
+        biomes=[],
+    )
+
+    assert Event.to_payload(event) == asdict(event)
+
+
+def test_encoding_with_orjson():
+    """Check that the orjson encoding round trips the event fields."""
+    event = ItemDeleted(id=uuid.UUID(int=1))
+
+    with mock.patch.object(settings, "EVENTS_ENCODING", "orjson"):
+        _, payload = encode_event(event)
+        decoded = encoding.decode_payload(payload)
+
+    assert isinstance(payload, bytes)
+    assert decoded == {"id": str(uuid.UUID(int=1))}
+
+
+@pytest.mark.parametrize(
+    ("annotation", "expected"),
+    [
+        (uuid.UUID, True),
+        (datetime, True),
+        (ItemCategory, False),
+        (int, False),
+        (list[str], False),
+        (dict[str, uuid.UUID], False),
+        (T.Optional[uuid.UUID], False),
+        ("uuid.UUID", False),
+    ],
+)
+def test_fields_encoded_as_strings(annotation: T.Any, expected: bool):
+    """Check which field annotations are converted to strings up front."""
+    assert encoders.needs_string(annotation) is expected
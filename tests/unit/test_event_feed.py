@@ -0,0 +1,106 @@
+import asyncio
+from unittest import mock
+
+import pytest
+import redis
+
+from shulker_box.events import feed as feed_module
+from shulker_box.events.feed import EventFeed, Notice
+
+pytestmark = [pytest.mark.asyncio]
+
+
+def deliver(*deliveries, subscriptions=None):
+    """Fake the redis subscription with given deliveries."""
+
+    async def subscribe(channels):
+        if subscriptions is not None:
+            subscriptions.append(channels)
+        for delivery in deliveries:
+            yield delivery
+        await asyncio.Event().wait()
+
+    return mock.patch.object(feed_module, "subscribe_with_redis", subscribe)
+
+
+def test_notice_encoding():
+    """Check that notices are encoded for both kinds of clients."""
+    notice = Notice("item-deleted", {"id": "1"})
+
+    assert notice.sse == b'event: item-deleted\ndata: {"id": "1"}\n\n'
+    assert notice.message == '{"event": "item-deleted", "data": {"id": "1"}}'
+
+
+async def test_feed_fans_out():
+    """Check that all the clients share a single subscription."""
+    subscriptions: list = []
+    event_feed = EventFeed(["item-deleted"])
+
+    with deliver(("item-deleted", {"id": "1"}), subscriptions=subscriptions):
+        async with event_feed.subscribe(1) as first:
+            async with event_feed.subscribe(1) as second:
+                notices = [await first.receive(), await second.receive()]
+        await event_feed.stop()
+
+    assert notices == [Notice("item-deleted", {"id": "1"})] * 2
+    assert notices[0] is notices[1]
+    assert subscriptions == [("item-deleted",)]
+    assert not event_feed.subscribers
+
+
+async def test_feed_drops_slow_clients():
+    """Check that a client with a full queue is dropped."""
+    event_feed = EventFeed(["item-deleted"])
+    deliveries = [("item-deleted", {"id": str(index)}) for index in range(3)]
+
+    with deliver(*deliveries):
+        async with event_feed.subscribe(2) as slow:
+            await asyncio.sleep(0.01)
+
+            assert slow not in event_feed.subscribers
+            assert await slow.receive() is None
+        await event_feed.stop()
+
+
+@mock.patch.object(feed_module, "RETRY_INTERVAL", 0)
+async def test_feed_drops_clients_on_errors():
+    """Check that everyone is dropped after losing the subscription."""
+    event_feed = EventFeed(["item-deleted"])
+
+    async def subscribe(channels):
+        raise redis.exceptions.ConnectionError
+        yield  # noqa: WPS428
+
+    with mock.patch.object(feed_module, "subscribe_with_redis", subscribe):
+        async with event_feed.subscribe(1) as subscriber:
+            notice = await subscriber.receive()
+        await event_feed.stop()
+
+    assert notice is None
+    assert event_feed.listener is None
+
+
+@mock.patch.object(feed_module, "RETRY_INTERVAL", 0)
+async def test_feed_survives_unexpected_errors():
+    """Check that the listener resubscribes after any error."""
+    event_feed = EventFeed(["item-deleted"])
+    subscriptions = 0
+
+    async def subscribe(channels):
+        nonlocal subscriptions
+        subscriptions += 1
+        if subscriptions == 1:
+            raise RuntimeError
+        yield "item-deleted", {"id": "1"}
+        await asyncio.Event().wait()
+
+    with mock.patch.object(feed_module, "subscribe_with_redis", subscribe):
+        async with event_feed.subscribe(1) as dropped:
+            await asyncio.sleep(0.01)
+
+            assert event_feed.listener is not None
+            assert not event_feed.listener.done()
+        await event_feed.stop()
+
+    assert await dropped.receive() is None
+    assert subscriptions == 2
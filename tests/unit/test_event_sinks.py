@@ -0,0 +1,140 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from shulker_box.api.v1.metrics.routes import get_event_sink_metrics
+from shulker_box.domain.events.event_types import Event
+from shulker_box.events import bus as bus_module
+from shulker_box.events.bus import EventBus, eventclass
+from shulker_box.events.sinks import EventSink, LatencyHistogram, log_events
+from shulker_box.settings import settings
+
+pytestmark = [pytest.mark.asyncio]
+
+
+@eventclass(mock.MagicMock(value="villager-traded"))
+class VillagerTraded(Event):
+    emeralds: int
+
+    async def handle(self) -> None:
+        ...
+
+
+@pytest.fixture
+def redis_delivery():
+    """Replace the redis delivery of the event bus."""
+    with mock.patch.object(
+        bus_module,
+        "publish_with_redis",
+        new_callable=mock.AsyncMock,
+    ) as publish:
+        yield publish
+
+
+@pytest.fixture
+def subscribe():
+    """Subscribe sinks to the event bus for a single test."""
+    sinks = []
+
+    def subscribe_sink(*args, **kwargs) -> EventSink:
+        sink = EventBus.subscribe(*args, **kwargs)
+        sinks.append(sink)
+        return sink
+
+    yield subscribe_sink
+    for sink in sinks:
+        EventBus.unsubscribe(sink)
+
+
+def test_latency_histogram():
+    """Check that latencies are counted in cumulative buckets."""
+    histogram = LatencyHistogram(bounds=(1, 10))
+    for latency in (0.5, 1, 3, 20):
+        histogram.record(latency)
+
+    assert histogram.cumulative() == {"1": 2, "10": 3, "+Inf": 4}
+    assert histogram.average == 6.125
+    assert LatencyHistogram().average == 0
+
+
+async def test_sinks_are_isolated(redis_delivery: mock.AsyncMock, subscribe):
+    """Check that failing and stuck sinks do not reach the publisher."""
+    released = asyncio.Event()
+
+    async def stuck(events) -> None:
+        await released.wait()
+
+    failing = subscribe(
+        "failing",
+        mock.AsyncMock(side_effect=RuntimeError),
+        critical=True,
+    )
+    slow = subscribe("slow", stuck, critical=True, timeout=0.01)
+    event = VillagerTraded(emeralds=3)
+
+    await EventBus.publish(event)
+
+    redis_delivery.assert_awaited_once_with(event)
+    assert (failing.stats.failures, failing.stats.deliveries) == (1, 1)
+    assert (slow.stats.timeouts, slow.stats.deliveries) == (1, 1)
+
+
+async def test_background_sinks(redis_delivery: mock.AsyncMock, subscribe):
+    """Check that only critical sinks are awaited by the publisher."""
+    released = asyncio.Event()
+    received = []
+
+    async def local(events) -> None:
+        await released.wait()
+        received.extend(events)
+
+    sink = subscribe("local", local, timeout=None)
+    events = [VillagerTraded(emeralds=1), VillagerTraded(emeralds=2)]
+
+    with mock.patch.object(
+        bus_module,
+        "publish_many_with_redis",
+        new_callable=mock.AsyncMock,
+    ) as publish_many:
+        await EventBus.publish_many(events)
+
+    publish_many.assert_awaited_once_with(events)
+    assert not received
+    assert len(EventBus.deliveries) == 1
+
+    released.set()
+    await EventBus.stop()
+
+    assert received == events
+    assert not EventBus.deliveries
+    assert sink.stats.deliveries == 1
+
+
+async def test_audit_log_sink():
+    """Check that the audit log writes the event payloads."""
+    with mock.patch("shulker_box.events.sinks.logger") as logger:
+        await log_events([VillagerTraded(emeralds=5)])
+
+    logger.info.assert_called_once_with(
+        "Audit event",
+        event_type="villager-traded",
+        payload={"emeralds": 5},
+    )
+
+
+async def test_event_sink_metrics(redis_delivery: mock.AsyncMock):
+    """Check that every sink reports its latency histogram."""
+    with mock.patch.object(settings, "EVENTS_AUDIT_LOG", True):
+        await EventBus.start()
+    await EventBus.publish(VillagerTraded(emeralds=8))
+    metrics = {sink.name: sink for sink in get_event_sink_metrics()}
+    audit_log = EventBus.audit_log
+    await EventBus.stop()
+
+    assert metrics["redis"].critical
+    assert metrics["redis"].latency_histogram["+Inf"] >= 1
+    assert not metrics["audit-log"].critical
+    assert audit_log is not None
+    assert audit_log.stats.deliveries == 1
+    assert EventBus.audit_log is None
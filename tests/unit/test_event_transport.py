@@ -0,0 +1,127 @@
+import importlib
+import sys
+from dataclasses import asdict
+from unittest import mock
+
+import pytest
+from redis import asyncio as aioredis
+
+from shulker_box.domain.events.event_types import Event
+from shulker_box.events import encoding
+from shulker_box.events.bus import EventBus, eventclass
+from shulker_box.events.publisher import encode_event, publish_many_with_redis
+from shulker_box.events.subscriber import subscribe_with_redis
+from shulker_box.settings import settings
+
+pytestmark = [pytest.mark.asyncio]
+
+
+@eventclass(mock.MagicMock(value="creeper-exploded"))
+class CreeperExploded(Event):
+    blocks: int
+
+    async def handle(self) -> None:
+        ...
+
+
+def streams():
+    """Switch the events transport to redis streams."""
+    return mock.patch.object(settings, "EVENTS_TRANSPORT", "stream")
+
+
+def msgpack_encoding():
+    """Switch the events encoding to msgpack, when it is installed."""
+    pytest.importorskip("msgpack")
+    return mock.patch.object(settings, "EVENTS_ENCODING", "msgpack")
+
+
+@mock.patch.object(aioredis.Redis, "xadd", new_callable=mock.AsyncMock)
+async def test_publishing_event_to_stream(mock_xadd: mock.AsyncMock):
+    """Check that events are appended to capped streams."""
+    event = CreeperExploded(blocks=12)
+
+    with streams():
+        await EventBus.publish(event)
+
+    mock_xadd.assert_awaited_once_with(
+        "creeper-exploded",
+        {encoding.DATA: encode_event(event)[1]},
+        maxlen=settings.EVENTS_STREAM_MAX_LENGTH,
+        approximate=True,
+    )
+
+
+@mock.patch.object(aioredis.client.Pipeline, "execute")
+async def test_publishing_many_events_to_stream(mock_execute: mock.AsyncMock):
+    """Check that batches are appended to streams in one pipeline."""
+    events: list[Event] = [
+        CreeperExploded(blocks=blocks) for blocks in range(3)
+    ]
+
+    with streams(), mock.patch.object(
+        aioredis.client.Pipeline,
+        "xadd",
+    ) as xadd:
+        await publish_many_with_redis(events)
+
+    assert xadd.call_count == 3
+    mock_execute.assert_awaited_once()
+
+
+async def test_reading_events_from_streams():
+    """Check that stream readers start at the end and keep their place."""
+    payload = encode_event(CreeperExploded(blocks=3))[1]
+    responses = [
+        [],
+        [[b"creeper-exploded", [(b"2-0", {encoding.DATA: payload})]]],
+    ]
+
+    with streams(), mock.patch.object(
+        aioredis.client.Pipeline,
+        "execute",
+        return_value=[[(b"1-0", {})], []],
+    ), mock.patch.object(
+        aioredis.Redis,
+        "xread",
+        new_callable=mock.AsyncMock,
+        side_effect=responses,
+    ) as xread:
+        deliveries = subscribe_with_redis(["creeper-exploded", "tnt-lit"])
+        delivery = await deliveries.__anext__()
+        await deliveries.aclose()
+
+    assert delivery == ("creeper-exploded", {"blocks": 3})
+    positions = xread.await_args.args[0]
+    assert positions == {"creeper-exploded": b"2-0", "tnt-lit": b"0-0"}
+
+
+def test_encoding_with_json():
+    """Check that the JSON encoding round trips the event fields."""
+    event = CreeperExploded(blocks=4)
+    payload = encoding.encode_payload(asdict(event))
+
+    assert isinstance(payload, str)
+    assert encoding.decode_payload(payload) == {"blocks": 4}
+
+
+def test_encoding_with_msgpack():
+    """Check that the msgpack encoding round trips the event fields."""
+    event = CreeperExploded(blocks=5)
+
+    with msgpack_encoding():
+        payload = encoding.encode_payload(asdict(event))
+        decoded = encoding.decode_payload(payload)
+
+    assert isinstance(payload, bytes)
+    assert decoded == {"blocks": 5}
+
+
+def test_msgpack_encoding_needs_msgpack():
+    """Check that choosing msgpack without the package fails early."""
+    with mock.patch.object(settings, "EVENTS_ENCODING", "msgpack"):
+        with mock.patch.dict(sys.modules, {"msgpack": None}):
+            with pytest.raises(ImportError):
+                importlib.reload(encoding)
+    importlib.reload(encoding)
+
+    assert encoding.msgpack is not None or "msgpack" not in sys.modules
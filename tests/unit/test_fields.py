@@ -0,0 +1,54 @@
+import uuid
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+
+from shulker_box.api.fields import FieldsOf
+from shulker_box.api.schemas import partial_schema, pick_fields
+from shulker_box.api.v1.items.schemas import ItemOutSchema
+from shulker_box.domain.types import ItemCategory
+
+pytestmark = [pytest.mark.asyncio]
+
+
+async def test_fields_selected():
+    """Check that fields are read in the schema order along with the id."""
+    selected = await FieldsOf(ItemOutSchema)(fields="category, name,")
+
+    assert selected == ("id", "name", "category")
+
+
+async def test_fields_not_selected():
+    """Check that all the fields are read when none are selected."""
+    assert await FieldsOf(ItemOutSchema)(fields=None) is None
+
+
+async def test_fields_unknown():
+    """Check that fields missing from the schema are rejected."""
+    with pytest.raises(RequestValidationError):
+        await FieldsOf(ItemOutSchema)(fields="name,price")
+
+
+def test_partial_schema():
+    """Check that partial schemas keep the types and are built once."""
+    schema = partial_schema(ItemOutSchema, ("id", "category"))
+
+    assert list(schema.__fields__) == ["id", "category"]
+    assert schema.parse_obj({"id": str(uuid.UUID(int=1)), "category": "block"})
+    assert partial_schema(ItemOutSchema, ["id", "category"]) is schema
+    assert partial_schema(ItemOutSchema, None) is ItemOutSchema
+
+
+def test_pick_fields():
+    """Check that an entry is cut down to the selected fields."""
+    item = ItemOutSchema(
+        id=uuid.UUID(int=1),
+        name="Dirt",
+        category=ItemCategory.BLOCK,
+    )
+
+    assert pick_fields(item, ("id", "name")).dict() == {
+        "id": item.id,
+        "name": "Dirt",
+    }
+    assert pick_fields(item, None) is item
@@ -0,0 +1,204 @@
+import asyncio
+import uuid
+from unittest import mock
+
+import pytest
+import redis
+from redis import asyncio as aioredis
+
+from shulker_box.api.v1.items.schemas import ItemOutSchema
+from shulker_box.domain.items import cache as cache_module
+from shulker_box.domain.items.cache import ItemCache
+from shulker_box.domain.types import ItemCategory
+from shulker_box.events.subscriber import subscribe_with_redis
+from shulker_box.settings import settings
+
+pytestmark = [pytest.mark.asyncio]
+
+
+def make_item(name: str) -> ItemOutSchema:
+    """Create an item."""
+    return ItemOutSchema(id=uuid.uuid4(), name=name, category=ItemCategory.TOOL)
+
+
+async def test_item_cache_disabled():
+    """Check that nothing is cached by default."""
+    item = make_item("Pickaxe")
+    await ItemCache.start()
+    ItemCache.put(item)
+    ItemCache.invalidate(item.id)
+    ItemCache.clear()
+
+    assert ItemCache.get(item.id) is None
+
+    await ItemCache.stop()
+
+
+@mock.patch.object(settings, "ITEMS_CACHE", True)
+async def test_item_cache_enabled():
+    """Check that items are cached until invalidated."""
+    pickaxe, shovel = make_item("Pickaxe"), make_item("Shovel")
+    await ItemCache.start()
+    ItemCache.put(pickaxe)
+    ItemCache.put(shovel)
+
+    assert ItemCache.get(pickaxe.id) == pickaxe
+    assert ItemCache.listener is None
+
+    ItemCache.invalidate(pickaxe.id)
+
+    assert ItemCache.get(pickaxe.id) is None
+    assert ItemCache.get(shovel.id) == shovel
+
+    ItemCache.clear()
+
+    assert ItemCache.get(shovel.id) is None
+
+    await ItemCache.stop()
+
+    assert ItemCache.entries is None
+
+
+@mock.patch.object(settings, "ITEMS_CACHE", True)
+async def test_item_cache_fields():
+    """Check that cached items are cut down to the selected fields."""
+    pickaxe = make_item("Pickaxe")
+    await ItemCache.start()
+    ItemCache.put(pickaxe)
+
+    assert ItemCache.get(pickaxe.id, ("id", "name")).dict() == {
+        "id": pickaxe.id,
+        "name": "Pickaxe",
+    }
+    assert ItemCache.get(uuid.uuid4(), ("id", "name")) is None
+
+    await ItemCache.stop()
+
+
+@mock.patch.object(settings, "ITEMS_CACHE", True)
+@mock.patch.object(settings, "ITEMS_CACHE_INVALIDATION", True)
+@mock.patch.object(cache_module, "RETRY_INTERVAL", 0)
+async def test_item_cache_invalidated_by_events():
+    """Check that items changed by other workers are dropped."""
+    pickaxe, shovel = make_item("Pickaxe"), make_item("Shovel")
+    subscriptions = 0
+
+    async def subscribe(channels):
+        nonlocal subscriptions
+        subscriptions += 1
+        yield "item-deleted", {"id": str(pickaxe.id)}
+        raise redis.exceptions.ConnectionError
+
+    with mock.patch.object(cache_module, "subscribe_with_redis", subscribe):
+        await ItemCache.start()
+        ItemCache.put(pickaxe)
+        ItemCache.put(shovel)
+        await asyncio.sleep(0.01)
+
+        assert ItemCache.get(pickaxe.id) is None
+        assert ItemCache.get(shovel.id) is None
+        assert subscriptions > 1
+
+        await ItemCache.stop()
+
+    assert ItemCache.listener is None
+
+
+async def test_subscribing_to_events():
+    """Check that published events are decoded from redis messages."""
+    messages = [
+        None,
+        {"channel": b"item-deleted", "data": b'{"id": "1"}'},
+    ]
+
+    with mock.patch.object(
+        aioredis.client.PubSub,
+        "subscribe",
+        new_callable=mock.AsyncMock,
+    ) as subscribe, mock.patch.object(
+        aioredis.client.PubSub,
+        "get_message",
+        new_callable=mock.AsyncMock,
+        side_effect=messages,
+    ):
+        deliveries = subscribe_with_redis(["item-deleted"])
+        delivery = await deliveries.__anext__()
+        await deliveries.aclose()
+
+    assert delivery == ("item-deleted", {"id": "1"})
+    subscribe.assert_awaited_once_with("item-deleted")
+
+
+@mock.patch.object(settings, "ITEMS_CACHE", True)
+async def test_item_cache_skips_stale_reads():
+    """Check that an item read before an invalidation is not cached."""
+    pickaxe = make_item("Pickaxe")
+    await ItemCache.start()
+    since = ItemCache.invalidations
+    ItemCache.invalidate(pickaxe.id)
+    ItemCache.put(pickaxe, since)
+
+    assert ItemCache.get(pickaxe.id) is None
+
+    ItemCache.put(pickaxe, ItemCache.invalidations)
+
+    assert ItemCache.get(pickaxe.id) == pickaxe
+
+    await ItemCache.stop()
+
+
+@mock.patch.object(settings, "ITEMS_CACHE", True)
+@mock.patch.object(settings, "ITEMS_CACHE_INVALIDATION", True)
+@mock.patch.object(cache_module, "RETRY_INTERVAL", 0)
+async def test_item_cache_skips_broken_events():
+    """Check that broken events neither stop nor break the listener."""
+    pickaxe, shovel = make_item("Pickaxe"), make_item("Shovel")
+    subscriptions = 0
+
+    async def subscribe(channels):
+        nonlocal subscriptions
+        subscriptions += 1
+        if subscriptions > 1:
+            await asyncio.Event().wait()
+        yield "item-deleted", {}
+        yield "item-deleted", {"id": "not-an-id"}
+        yield "item-deleted", {"id": str(pickaxe.id)}
+        raise RuntimeError
+
+    with mock.patch.object(cache_module, "subscribe_with_redis", subscribe):
+        await ItemCache.start()
+        ItemCache.put(pickaxe)
+        ItemCache.put(shovel)
+        await asyncio.sleep(0.01)
+
+        assert ItemCache.get(pickaxe.id) is None
+        assert subscriptions == 2
+        assert ItemCache.listener is not None
+        assert not ItemCache.listener.done()
+
+        await ItemCache.stop()
+
+
+async def test_subscribing_skips_broken_messages():
+    """Check that messages which cannot be decoded are skipped."""
+    messages = [
+        {"channel": b"item-deleted", "data": b"{broken"},
+        {"channel": b"item-deleted", "data": b"[]"},
+        {"channel": b"item-deleted", "data": b'{"id": "1"}'},
+    ]
+
+    with mock.patch.object(
+        aioredis.client.PubSub,
+        "subscribe",
+        new_callable=mock.AsyncMock,
+    ), mock.patch.object(
+        aioredis.client.PubSub,
+        "get_message",
+        new_callable=mock.AsyncMock,
+        side_effect=messages,
+    ):
+        deliveries = subscribe_with_redis(["item-deleted"])
+        delivery = await deliveries.__anext__()
+        await deliveries.aclose()
+
+    assert delivery == ("item-deleted", {"id": "1"})
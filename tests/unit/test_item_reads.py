@@ -0,0 +1,91 @@
+import uuid
+from unittest import mock
+
+import pytest
+
+from shulker_box.api.v1.items.schemas import ItemOutSchema
+from shulker_box.domain import exceptions
+from shulker_box.domain.cursors import Keyset, decode_cursor, encode_cursor
+from shulker_box.domain.items.services import ItemService
+from shulker_box.domain.types import ItemCategory
+
+pytestmark = [pytest.mark.asyncio]
+
+ITEMS = [
+    ItemOutSchema(id=uuid.UUID(int=index), name=name, category=category)
+    for index, (name, category) in enumerate(
+        (
+            ("Iron Axe", ItemCategory.TOOL),
+            ("iron Block", ItemCategory.BLOCK),
+            ("Iron Sword", ItemCategory.WEAPON),
+        ),
+    )
+]
+
+
+async def test_read_items_by_name():
+    """Check that pages ordered by the names carry the last name."""
+    repository = mock.AsyncMock()
+    repository.collect.return_value = ITEMS
+
+    page = await ItemService(repository).read_items(
+        limit=2,
+        cursor=None,
+        fields=("id", "version"),
+        filters_dict={"name_prefix": "iron"},
+    )
+
+    assert repository.collect.await_args.kwargs["fields"] == (
+        "id",
+        "version",
+        "name",
+    )
+    assert [item.dict() for item in page.items] == [
+        {"id": item.id, "version": 0} for item in ITEMS[:2]
+    ]
+    assert page.next_cursor is not None
+    assert decode_cursor(page.next_cursor) == Keyset(
+        id=ITEMS[1].id,
+        key="iron block",
+    )
+
+
+async def test_read_items_by_id():
+    """Check that pages ordered by the ids carry the last id alone."""
+    repository = mock.AsyncMock()
+    repository.collect.return_value = ITEMS
+
+    page = await ItemService(repository).read_items(
+        limit=2,
+        cursor=encode_cursor(Keyset(id=ITEMS[0].id)),
+        fields=None,
+        filters_dict={"name": "Iron Axe", "name_prefix": "iron"},
+    )
+
+    assert repository.collect.await_args.kwargs["after"] == Keyset(
+        id=ITEMS[0].id,
+    )
+    assert page.items == ITEMS[:2]
+    assert page.next_cursor == encode_cursor(Keyset(id=ITEMS[1].id))
+
+
+@pytest.mark.parametrize(
+    ("cursor", "filters_dict"),
+    [
+        (encode_cursor(Keyset(id=ITEMS[0].id)), {"name_prefix": "iron"}),
+        (encode_cursor(Keyset(id=ITEMS[0].id, key="iron axe")), {}),
+    ],
+)
+async def test_read_items_other_order(cursor: str, filters_dict: dict):
+    """Check that cursors of pages in another order are rejected."""
+    repository = mock.AsyncMock()
+
+    with pytest.raises(exceptions.InvalidCursorError):
+        await ItemService(repository).read_items(
+            limit=2,
+            cursor=cursor,
+            fields=None,
+            filters_dict=filters_dict,
+        )
+
+    repository.collect.assert_not_called()
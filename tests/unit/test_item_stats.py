@@ -0,0 +1,56 @@
+from unittest import mock
+
+import pytest
+from pymongo import UpdateOne
+
+from shulker_box.database.models import ItemCounter
+from shulker_box.domain.items.stats import ItemStats
+from shulker_box.domain.types import ItemCategory
+
+pytestmark = [pytest.mark.asyncio]
+
+
+async def test_item_stats_move():
+    """Check that all the counters are moved with a single write."""
+    collection = mock.Mock(bulk_write=mock.AsyncMock())
+    with mock.patch.object(
+        ItemCounter,
+        "get_motor_collection",
+        return_value=collection,
+    ):
+        await ItemStats.move(
+            added=[ItemCategory.BLOCK, ItemCategory.BLOCK, ItemCategory.TOOL],
+            removed=[ItemCategory.TOOL, ItemCategory.FOOD],
+        )
+
+    collection.bulk_write.assert_awaited_once_with(
+        [
+            UpdateOne(
+                {"_id": ItemCategory.BLOCK},
+                {"$inc": {"items": 2}},
+                upsert=True,
+            ),
+            UpdateOne(
+                {"_id": ItemCategory.FOOD},
+                {"$inc": {"items": -1}},
+                upsert=True,
+            ),
+        ],
+        ordered=False,
+    )
+
+
+async def test_item_stats_move_nothing():
+    """Check that nothing is written when the counts do not change."""
+    collection = mock.Mock(bulk_write=mock.AsyncMock())
+    with mock.patch.object(
+        ItemCounter,
+        "get_motor_collection",
+        return_value=collection,
+    ):
+        await ItemStats.move(
+            added=[ItemCategory.WEAPON],
+            removed=[ItemCategory.WEAPON],
+        )
+
+    collection.bulk_write.assert_not_awaited()
@@ -0,0 +1,210 @@
+import asyncio
+import uuid
+from unittest import mock
+
+import pytest
+import redis
+from redis import asyncio as aioredis
+
+from shulker_box.api.responses import SchemaResponse
+from shulker_box.api.v1.items.filters import ItemPageFilters
+from shulker_box.api.v1.items.schemas import ItemCreateSchema, ItemOutSchema
+from shulker_box.domain.items.list_cache import (
+    GENERATION_KEY,
+    CachedPage,
+    ItemListCache,
+)
+from shulker_box.domain.items.reads import cache_key
+from shulker_box.domain.items.services import ItemService
+from shulker_box.domain.items.stats import ItemStats
+from shulker_box.domain.pagination import Page
+from shulker_box.domain.types import ItemCategory
+from shulker_box.events.bus import EventBus
+from shulker_box.settings import settings
+
+pytestmark = [pytest.mark.asyncio]
+
+
+class Generation:
+    """Generation of the items kept in memory instead of redis."""
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    async def mget(self, keys: list[str]) -> list[bytes]:
+        """Read the generation.
+
+        Args:
+            keys (list[str]): redis keys.
+
+        Returns:
+            list[bytes]: generation, as redis returns it.
+        """
+        return [str(self.value).encode()]
+
+    async def incr(self, key: str) -> None:
+        """Move the generation on.
+
+        Args:
+            key (str): redis key.
+        """
+        self.value += 1
+
+
+PAGE = Page(
+    items=[
+        ItemOutSchema(
+            id=uuid.UUID(int=1),
+            name="Torch",
+            category=ItemCategory.BLOCK,
+        ),
+    ],
+    next_cursor="cursor",
+)
+FILTERS = ItemPageFilters(
+    name=None,
+    name_prefix=None,
+    category=None,
+    limit=10,
+    cursor=None,
+    search=None,
+)
+
+
+def test_page_key_normalized():
+    """Check that the order of the filters does not matter."""
+    assert ItemListCache.key({"limit": 1, "name": "a"}) == ItemListCache.key(
+        {"name": "a", "limit": 1},
+    )
+    assert ItemListCache.key({"limit": 1}) != ItemListCache.key({"limit": 2})
+
+
+@mock.patch.object(aioredis.Redis, "set", new_callable=mock.AsyncMock)
+@mock.patch.object(aioredis.Redis, "mget", new_callable=mock.AsyncMock)
+async def test_list_cache_disabled(
+    mock_mget: mock.AsyncMock,
+    mock_set: mock.AsyncMock,
+):
+    """Check that only the generation is read from redis by default."""
+    mock_mget.return_value = [b"2"]
+
+    await ItemListCache.put("key", 2, PAGE)
+
+    assert await ItemListCache.get("key") == (2, None)
+    mock_mget.assert_awaited_once_with([GENERATION_KEY])
+    mock_set.assert_not_called()
+
+
+@mock.patch.object(settings, "ITEMS_LIST_CACHE", True)
+@mock.patch.object(aioredis.Redis, "set", new_callable=mock.AsyncMock)
+@mock.patch.object(aioredis.Redis, "mget", new_callable=mock.AsyncMock)
+async def test_list_cache_round_trip(
+    mock_mget: mock.AsyncMock,
+    mock_set: mock.AsyncMock,
+):
+    """Check that a stored page is read back encoded as the response."""
+    await ItemListCache.put("key", 3, PAGE)
+    stored_call = mock_set.await_args_list[0]
+    mock_mget.return_value = [b"3", stored_call.args[1]]
+
+    assert await ItemListCache.get("key") == (
+        3,
+        CachedPage(
+            body=SchemaResponse(PAGE.items).body,
+            next_cursor=PAGE.next_cursor,
+        ),
+    )
+    mock_mget.assert_awaited_once_with([GENERATION_KEY, "key"])
+    assert stored_call.kwargs == {"ex": settings.ITEMS_LIST_CACHE_TTL}
+
+
+@mock.patch.object(settings, "ITEMS_LIST_CACHE", True)
+@mock.patch.object(aioredis.Redis, "set", new_callable=mock.AsyncMock)
+async def test_list_cache_unknown_generation(mock_set: mock.AsyncMock):
+    """Check that pages read without a generation are not stored."""
+    await ItemListCache.put("key", None, PAGE)
+
+    mock_set.assert_not_called()
+
+
+@mock.patch.object(settings, "ITEMS_LIST_CACHE", True)
+@mock.patch.object(aioredis.Redis, "mget", new_callable=mock.AsyncMock)
+async def test_list_cache_stale_page(mock_mget: mock.AsyncMock):
+    """Check that pages stored at older generations are ignored."""
+    stored = b'{"generation":3,"next_cursor":null}\n[]'
+    mock_mget.return_value = [b"4", stored]
+
+    assert await ItemListCache.get("key") == (4, None)
+
+    mock_mget.return_value = [None, None]
+
+    assert await ItemListCache.get("key") == (0, None)
+
+
+@mock.patch.object(aioredis.Redis, "incr", new_callable=mock.AsyncMock)
+async def test_list_cache_bump(mock_incr: mock.AsyncMock):
+    """Check that writes move the generation on, even without the cache."""
+    await ItemListCache.bump()
+
+    mock_incr.assert_awaited_once_with(GENERATION_KEY)
+
+
+@mock.patch.object(ItemListCache, "get", return_value=(5, None))
+async def test_items_generation(get: mock.AsyncMock):
+    """Check that the generation of the list cache tags the items."""
+    service = ItemService(mock.AsyncMock())
+
+    assert await service.get_generation(FILTERS, ("id",)) == (5, None)
+    get.assert_awaited_once_with(cache_key(FILTERS, ("id",)))
+
+
+async def test_items_generation_while_writing():
+    """Check that pages read before a write lands keep the older tag."""
+    generation = Generation()
+    allocated = asyncio.Event()
+    landing = asyncio.Event()
+
+    async def create(data_object: ItemCreateSchema) -> ItemOutSchema:
+        allocated.set()
+        await landing.wait()
+        return PAGE.items[0]
+
+    repository = mock.AsyncMock()
+    repository.create.side_effect = create
+    service = ItemService(repository)
+    with (
+        mock.patch.object(aioredis.Redis, "mget", generation.mget),
+        mock.patch.object(aioredis.Redis, "incr", generation.incr),
+        mock.patch.object(ItemStats, "move"),
+        mock.patch.object(EventBus, "publish"),
+    ):
+        before = await service.get_generation(FILTERS)
+        write = asyncio.create_task(
+            service.create(
+                ItemCreateSchema(name="Torch", category=ItemCategory.BLOCK),
+            ),
+        )
+        await allocated.wait()
+        during = await service.get_generation(FILTERS)
+        landing.set()
+        await write
+        after = await service.get_generation(FILTERS)
+
+    assert during == before
+    assert after != during
+
+
+@mock.patch.object(settings, "ITEMS_LIST_CACHE", True)
+async def test_list_cache_without_redis():
+    """Check that the cache is skipped when redis is unavailable."""
+    with mock.patch.object(
+        aioredis.Redis,
+        "execute_command",
+        side_effect=redis.exceptions.ConnectionError,
+    ) as execute:
+        await ItemListCache.put("key", 0, PAGE)
+        await ItemListCache.bump()
+
+        assert await ItemListCache.get("key") == (None, None)
+
+    assert execute.await_count == 3
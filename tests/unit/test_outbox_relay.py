@@ -0,0 +1,75 @@
+import asyncio
+from unittest import mock
+
+import pytest
+import redis
+
+from shulker_box.events.bus import EventBus
+from shulker_box.events.outbox import OutboxRelay
+from shulker_box.settings import settings
+
+pytestmark = [pytest.mark.asyncio]
+
+
+async def test_relay_keeps_going_while_outbox_is_full():
+    """Check that the relay only sleeps once the outbox is drained."""
+    outbox_relay = OutboxRelay(batch_size=2, poll_interval=1000)
+
+    with mock.patch.object(
+        OutboxRelay,
+        "relay",
+        new_callable=mock.AsyncMock,
+        side_effect=[2, 2, 1, 0],
+    ) as relay:
+        outbox_relay.start()
+        await asyncio.sleep(0.01)
+        await outbox_relay.stop()
+
+    assert relay.await_count == 3
+    assert outbox_relay.task is None
+
+
+async def test_relay_keeps_going_after_errors():
+    """Check that a failed batch is retried instead of ending the relay."""
+    outbox_relay = OutboxRelay(batch_size=2, poll_interval=1)
+
+    with mock.patch.object(
+        OutboxRelay,
+        "relay",
+        new_callable=mock.AsyncMock,
+        side_effect=[
+            redis.exceptions.ResponseError("OOM"),
+            1,
+            asyncio.CancelledError,
+        ],
+    ) as relay:
+        outbox_relay.start()
+        await asyncio.sleep(0.05)
+        await outbox_relay.stop()
+
+    assert relay.await_count == 3
+
+
+async def test_relay_stop_without_start():
+    """Check that stopping a relay that never started is a no-op."""
+    outbox_relay = OutboxRelay(batch_size=2, poll_interval=1000)
+
+    await outbox_relay.stop()
+
+    assert outbox_relay.task is None
+
+
+@mock.patch.object(OutboxRelay, "relay", new_callable=mock.AsyncMock)
+async def test_event_bus_outbox_mode(relay: mock.AsyncMock):
+    """Check that the event bus runs the relay in outbox mode."""
+    with mock.patch.object(settings, "EVENTS_OUTBOX", True):
+        await EventBus.start()
+
+    assert EventBus.relay is not None
+    assert EventBus.buffer is None
+
+    await asyncio.sleep(0.01)
+    await EventBus.stop()
+
+    relay.assert_awaited()
+    assert EventBus.relay is None
@@ -0,0 +1,52 @@
+import uuid
+from dataclasses import dataclass
+
+from shulker_box.domain.cursors import Keyset, encode_cursor, encode_offset
+from shulker_box.domain.pagination import paginate, paginate_offset
+
+
+@dataclass
+class Entry:
+    id: uuid.UUID
+
+
+def test_paginate_last_page():
+    """Check that the last page has no next cursor."""
+    entries = [Entry(id=uuid.uuid4()) for _ in range(2)]
+
+    page = paginate(entries, limit=2)
+
+    assert page.items == entries
+    assert page.next_cursor is None
+
+
+def test_paginate_with_next_page():
+    """Check that the extra entry is cut off and used for the cursor."""
+    entries = [Entry(id=uuid.uuid4()) for _ in range(3)]
+
+    page = paginate(entries, limit=2)
+
+    assert page.items == entries[:2]
+    assert page.next_cursor == encode_cursor(Keyset(id=entries[1].id))
+
+
+def test_paginate_with_sort_key():
+    """Check that the cursor carries the sort key of the last entry."""
+    entries = [Entry(id=uuid.uuid4()) for _ in range(3)]
+
+    page = paginate(entries, limit=1, sort_key=lambda entry: entry.id.hex)
+
+    assert page.next_cursor == encode_cursor(
+        Keyset(id=entries[0].id, key=entries[0].id.hex),
+    )
+
+
+def test_paginate_offset_with_next_page():
+    """Check that the next cursor points right after the page."""
+    entries = [Entry(id=uuid.uuid4()) for _ in range(3)]
+
+    page = paginate_offset(entries, limit=2, offset=4)
+
+    assert page.items == entries[:2]
+    assert page.next_cursor == encode_offset(6)
+    assert paginate_offset(entries, limit=3, offset=4).next_cursor is None
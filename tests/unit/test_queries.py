@@ -0,0 +1,47 @@
+import re
+from datetime import datetime
+
+import pytest
+
+from shulker_box.database.models import normalize_name
+from shulker_box.domain.database.queries import (
+    create_keyset_query,
+    create_prefix_query,
+    create_settled_query,
+)
+
+
+@pytest.mark.parametrize(
+    ("name", "normalized"),
+    [("Diamond Sword", "diamond sword"), ("STRAßE", "strasse"), ("Ⅸ", "ix")],
+)
+def test_normalize_name(name: str, normalized: str):
+    """Check that names are matched regardless of their case and form."""
+    assert normalize_name(name) == normalized
+
+
+def test_prefix_query():
+    """Check that prefixes are anchored and matched literally."""
+    query = create_prefix_query("name_key", "iron (")
+    pattern = re.compile(query["name_key"]["$regex"])
+
+    assert pattern.match("iron (block)")
+    assert not pattern.match("an iron (block)")
+
+
+def test_settled_query():
+    """Check that changes stored without their time count as settled."""
+    query = create_settled_query("changed_at", 0)
+
+    assert query == {"changed_at": {"$not": {"$gt": datetime(1970, 1, 1)}}}
+    assert create_settled_query("changed_at", None) == {}
+
+
+def test_keyset_query():
+    """Check that only the key is bounded and the ties are filtered out."""
+    query = create_keyset_query("name_key", "_id", "iron", 7)
+
+    assert query == {
+        "name_key": {"$gte": "iron"},
+        "$nor": [{"name_key": "iron", "_id": {"$lte": 7}}],
+    }
@@ -0,0 +1,39 @@
+import json
+import uuid
+
+import pytest
+
+from shulker_box.api.responses import SchemaResponse
+from shulker_box.api.v1.items.schemas import ItemOutSchema
+from shulker_box.domain.pagination import Page
+from shulker_box.domain.types import ItemCategory
+
+ITEM = ItemOutSchema(id=uuid.UUID(int=1), name="Anvil", category="block")
+
+
+def test_schema_response_renders_schemas():
+    """Check that schemas are encoded along with UUIDs and enums."""
+    response = SchemaResponse([ITEM])
+
+    assert json.loads(response.body) == [
+        {
+            "id": str(uuid.UUID(int=1)),
+            "name": "Anvil",
+            "category": ItemCategory.BLOCK.value,
+            "version": 0,
+        },
+    ]
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_schema_response_renders_dataclasses():
+    """Check that dataclasses holding schemas are encoded."""
+    response = SchemaResponse(Page(items=[ITEM]))
+
+    assert json.loads(response.body)["items"][0]["name"] == "Anvil"
+
+
+def test_schema_response_unknown_type():
+    """Check that unknown types are not silently encoded."""
+    with pytest.raises(TypeError):
+        SchemaResponse({"anvil": object()})
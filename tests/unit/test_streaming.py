@@ -0,0 +1,59 @@
+import asyncio
+import json
+import typing as T
+import uuid
+from unittest import mock
+
+import pytest
+
+from shulker_box.api.streaming import HEARTBEAT, ndjson, sse
+from shulker_box.events import feed as feed_module
+from shulker_box.events.feed import EventFeed, Notice
+
+pytestmark = [pytest.mark.asyncio]
+
+
+async def make_rows(count: int) -> T.AsyncIterator[dict[str, T.Any]]:
+    """Yield a few rows."""
+    for index in range(count):
+        yield {"id": uuid.UUID(int=index), "index": index}
+
+
+async def test_ndjson_chunks():
+    """Check that rows are encoded as lines grouped into chunks."""
+    chunks = [chunk async for chunk in ndjson(make_rows(5), chunk_size=2)]
+    lines = b"".join(chunks).decode().splitlines()
+
+    assert len(chunks) == 3
+    assert [json.loads(line) for line in lines] == [
+        {"id": str(uuid.UUID(int=index)), "index": index} for index in range(5)
+    ]
+
+
+async def test_ndjson_without_rows():
+    """Check that nothing is sent for an empty stream."""
+    assert [chunk async for chunk in ndjson(make_rows(0), chunk_size=2)] == []
+
+
+async def idle_subscription(channels):
+    """Subscribe to channels where nothing happens."""
+    await asyncio.Event().wait()
+    yield  # noqa: WPS428
+
+
+@mock.patch.object(feed_module, "subscribe_with_redis", idle_subscription)
+async def test_sse_frames():
+    """Check that notices are sent as events with heartbeats in between."""
+    notice = Notice("item-deleted", {"id": "1"})
+    event_feed = EventFeed(["item-deleted"])
+    subscriber = event_feed.subscribe(2)
+    subscriber.push(notice)
+    frames = sse(subscriber, heartbeat=0.01)
+
+    received = [await frames.__anext__(), await frames.__anext__()]
+    event_feed.drop_all()
+    rest = [frame async for frame in frames]
+    await event_feed.stop()
+
+    assert received == [notice.sse, HEARTBEAT]
+    assert rest == []